@@ -31,6 +31,7 @@ VERSION: 1.0
 """
 
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 
 
 # =============================================================================
@@ -647,12 +648,27 @@ def compute_column_metadata_stats(column_meta, table_meta):
         dict with metadata-derived statistics compatible with the existing
         enhance_data_readiness_score function.
     """
-    data_type = column_meta.get('data_type', '').upper()
+    # Column patterns repeat heavily across a warehouse (same type/length/
+    # nullability on same-sized tables), so memoize on the scalar inputs.
+    # The copy keeps callers from mutating each other's cached stats.
+    return _compute_column_stats_cached(
+        column_meta.get('data_type', ''),
+        column_meta.get('character_maximum_length'),
+        column_meta.get('is_nullable', 'YES'),
+        bool(column_meta.get('column_comment', '').strip()),
+        column_meta.get('numeric_precision'),
+        column_meta.get('numeric_scale'),
+        table_meta.get('row_count') or 0,
+    ).copy()
+
+
+@lru_cache(maxsize=10000)
+def _compute_column_stats_cached(raw_data_type, char_max_len, is_nullable,
+                                 has_comment, numeric_precision,
+                                 numeric_scale, row_count):
+    """Memoized core of compute_column_metadata_stats over hashable scalars."""
+    data_type = raw_data_type.upper()
     base_type = data_type.split('(')[0].strip()
-    char_max_len = column_meta.get('character_maximum_length')
-    is_nullable = column_meta.get('is_nullable', 'YES')
-    has_comment = bool(column_meta.get('column_comment', '').strip())
-    row_count = table_meta.get('row_count') or 0
 
     stats = {
         'row_count': row_count,
@@ -689,8 +705,8 @@ def compute_column_metadata_stats(column_meta, table_meta):
 
     # For numeric columns
     elif base_type in NUMERIC_TYPES or any(t in base_type for t in ['NUMBER', 'INT', 'FLOAT', 'DOUBLE', 'DECIMAL']):
-        stats['numeric_precision'] = column_meta.get('numeric_precision')
-        stats['numeric_scale'] = column_meta.get('numeric_scale')
+        stats['numeric_precision'] = numeric_precision
+        stats['numeric_scale'] = numeric_scale
 
     # For semi-structured columns
     elif base_type in SEMI_STRUCTURED_TYPES:
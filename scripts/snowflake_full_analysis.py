@@ -34,18 +34,52 @@ VERSION: 2.0 (Agent Architecture)
 ===============================================================================
 """
 
-import snowflake.connector
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
-import os
 import sys
+
+AGENT_VERSION = "2.0"
+AGENT_NAME = "Snowflake AI Readiness Agent"
+
+# Fast path for --version: the heavy Snowflake/pandas/cryptography imports
+# below take several seconds and are not needed to print a version string.
+# Output matches the argparse version action in parse_arguments(); any other
+# placement of the flag falls through to argparse and behaves identically.
+if __name__ == "__main__" and len(sys.argv) > 1 and sys.argv[1] in ("--version", "-v"):
+    print(f"{AGENT_NAME} v{AGENT_VERSION}")
+    sys.exit(0)
+
+# snowflake.connector, numpy, pandas and cryptography are imported lazily
+# inside the functions that use them (get_connection, load_private_key and
+# the bulk scoring/report passes) so that --help and config validation do
+# not pay their multi-second import cost.
+import os
+import re
+import time
 import csv
 import json
+import hashlib
 import yaml
 import argparse
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from collections import defaultdict
+import heapq
+from collections import Counter, defaultdict, deque
+from itertools import chain, groupby
+from operator import itemgetter
+
+# Optional: orjson serializes via C and is several times faster than stdlib
+# json for the large candidate/cache dumps; fall back to json when absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+# Optional: ijson parses JSON incrementally, keeping append-mode reloads of
+# very large candidate files at one-item-at-a-time peak memory
+try:
+    import ijson
+except ImportError:
+    ijson = None
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from snowflake_ai_readiness_metadata import (
     run_metadata_analysis,
     generate_readiness_report_markdown,
@@ -59,8 +93,8 @@ from snowflake_ai_readiness_metadata import (
 # AGENT METADATA & UTC TIMESTAMP UTILITIES
 # =============================================================================
 
-AGENT_VERSION = "2.0"
-AGENT_NAME = "Snowflake AI Readiness Agent"
+# AGENT_VERSION and AGENT_NAME are defined above the heavy imports so the
+# --version fast path can use them.
 
 # Valid stages for --start-stage option (in execution order)
 VALID_STAGES = ['1', '2', '2A', '2B', '2C', '2D', '2E', '2F', '3', '4', '5', '5B', '6']
@@ -235,6 +269,12 @@ ROLE = get_config_value(CONFIG, 'snowflake.role', 'SNOWFLAKE_ROLE', None)
 # Output directory - Standard destination: snowflake-ai-enablement-reports
 OUTPUT_DIR = Path(get_config_value(CONFIG, 'output.directory', 'OUTPUT_DIR', os.path.join(REPO_ROOT, "snowflake-ai-enablement-reports")))
 
+# Output subdirectories, joined once instead of at every call site
+METADATA_DIR = OUTPUT_DIR / "metadata"
+LOGS_DIR = OUTPUT_DIR / "logs"
+PROFILES_DIR = OUTPUT_DIR / "profiles"
+REPORTS_DIR = OUTPUT_DIR / "reports"
+
 # Database filtering (Objective 1: target_databases)
 TARGET_DATABASES = get_config_value(CONFIG, 'target_databases', None, [])
 EXCLUDE_DATABASES = get_config_value(CONFIG, 'exclude_databases', None, ['SNOWFLAKE', 'SNOWFLAKE_SAMPLE_DATA'])
@@ -247,6 +287,12 @@ FORCE_REANALYSIS = get_config_value(CONFIG, 'analysis.force_reanalysis', 'FORCE_
 if isinstance(FORCE_REANALYSIS, str):
     FORCE_REANALYSIS = FORCE_REANALYSIS.lower() == 'true'
 SAMPLE_SIZES = get_config_value(CONFIG, 'analysis.sample_sizes', None, [10000, 1000, 100])
+ASYNC_PIPELINE_DEPTH = int(get_config_value(CONFIG, 'analysis.async_pipeline_depth', None, 4))
+SCAN_CONCURRENCY = int(get_config_value(CONFIG, 'analysis.scan_concurrency', None, 8))
+CACHE_CHECKPOINT_INTERVAL = int(get_config_value(CONFIG, 'analysis.cache_checkpoint_interval', None, 200))
+USE_APPROX_PERCENTILE = get_config_value(CONFIG, 'analysis.use_approx_percentile', 'USE_APPROX_PERCENTILE', True)
+if isinstance(USE_APPROX_PERCENTILE, str):
+    USE_APPROX_PERCENTILE = USE_APPROX_PERCENTILE.lower() == 'true'
 
 # Data Profiling Thresholds (Objective 2: Deep Data Profiling)
 PROFILING_SPARSITY_LOW = get_config_value(CONFIG, 'profiling.sparsity.low_threshold', None, 10)
@@ -293,9 +339,10 @@ if _db_env and not TARGET_DATABASES:
     TARGET_DATABASES = [db.strip() for db in _db_env.split(",") if db.strip()]
 
 # Cache and log paths
-CACHE_FILE = OUTPUT_DIR / "metadata" / "data_analysis_cache.json"
-ANALYSIS_ERRORS_LOG = OUTPUT_DIR / "logs" / "analysis_errors.log"
-ANALYSIS_SUMMARY_LOG = OUTPUT_DIR / "logs" / "analysis_summary.log"
+CACHE_FILE = METADATA_DIR / "data_analysis_cache.json"
+CACHE_LOG_FILE = METADATA_DIR / "data_analysis_cache.log.jsonl"
+ANALYSIS_ERRORS_LOG = LOGS_DIR / "analysis_errors.log"
+ANALYSIS_SUMMARY_LOG = LOGS_DIR / "analysis_summary.log"
 
 # Audit trail
 AUDIT_LOG = []
@@ -352,6 +399,9 @@ def print_progress_complete(phase, stats_dict):
 
 def load_private_key():
     """Load private key from file, supporting both encrypted and unencrypted keys."""
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import serialization
+
     key_path = os.path.expanduser(PRIVATE_KEY_PATH)
     
     if not os.path.exists(key_path):
@@ -386,6 +436,8 @@ def get_connection():
     - Password authentication (fallback)
     - Optional warehouse and role settings
     """
+    import snowflake.connector
+
     conn_params = {
         'account': ACCOUNT,
         'user': USER,
@@ -461,21 +513,85 @@ def load_existing_candidates():
     
     Returns: list of existing candidates, or empty list if none found
     """
-    candidates_path = OUTPUT_DIR / "metadata" / "all_candidates.json"
+    candidates_path = METADATA_DIR / "all_candidates.json"
     
     if not candidates_path.exists():
         print("  No existing candidates found - starting fresh")
         return []
     
+    # ijson raises its own JSONError hierarchy (not a ValueError subclass
+    # like json.JSONDecodeError), so widen the recovery net to match
+    load_errors = (ValueError, IOError)
+    if ijson is not None:
+        load_errors += (ijson.JSONError,)
+
     try:
-        with open(candidates_path, "r", encoding="utf-8") as f:
-            existing = json.load(f)
+        if ijson is not None:
+            # Incremental parse: decode one candidate at a time instead of
+            # materializing the whole document tree before the list exists
+            with open(candidates_path, "rb") as f:
+                existing = list(ijson.items(f, 'item'))
+        else:
+            with open(candidates_path, "r", encoding="utf-8") as f:
+                existing = json.load(f)
         print(f"  Loaded {len(existing):,} existing candidates from previous run")
         return existing
-    except (json.JSONDecodeError, IOError) as e:
+    except load_errors as e:
         print(f"  Warning: Could not load existing candidates: {e}")
         return []
 
+CHECKPOINT_MAX_AGE_HOURS = 24
+
+def save_checkpoint(stage):
+    """
+    Atomically record that a stage finished.
+
+    The per-phase artifacts (inventory CSVs, candidate JSONs, profiles)
+    already persist the data load_intermediate_state reads back; this
+    marker records how far the run got, so an interrupted run can resume
+    with --start-stage at the first phase that did not complete.
+    """
+    checkpoint = {
+        'last_completed_stage': stage,
+        'timestamp': get_utc_timestamp(),
+        'timestamp_iso': get_utc_timestamp_iso(),
+        'agent_version': AGENT_VERSION
+    }
+    path = METADATA_DIR / "last_completed_stage.json"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".json.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f, indent=2)
+        os.replace(tmp_path, path)
+    except IOError as e:
+        print(f"  Warning: Could not save checkpoint: {e}")
+
+def load_checkpoint():
+    """Load the last-completed-stage marker, warning when stale or from
+    a different agent version. Returns the checkpoint dict or None."""
+    path = METADATA_DIR / "last_completed_stage.json"
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        print(f"  Warning: Could not load checkpoint: {e}")
+        return None
+
+    try:
+        saved = datetime.fromisoformat(checkpoint.get('timestamp_iso', ''))
+        age_hours = (datetime.now(timezone.utc) - saved).total_seconds() / 3600
+        if age_hours > CHECKPOINT_MAX_AGE_HOURS:
+            print(f"  Warning: Checkpoint is {age_hours:.0f}h old; cached state may be stale")
+    except ValueError:
+        pass
+    if checkpoint.get('agent_version') != AGENT_VERSION:
+        print(f"  Warning: Checkpoint from agent v{checkpoint.get('agent_version')} "
+              f"(current v{AGENT_VERSION}); cached state may be incompatible")
+    return checkpoint
+
 def load_intermediate_state(start_stage):
     """
     Load intermediate state from previous runs when restarting from a later stage.
@@ -512,9 +628,13 @@ def load_intermediate_state(start_stage):
     
     start_stage = start_stage.upper() if start_stage else '1'
     print(f"\n=== Loading Intermediate State for Restart from Stage {start_stage} ===")
+
+    checkpoint = load_checkpoint()
+    if checkpoint:
+        print(f"  Last completed stage: {checkpoint.get('last_completed_stage')} at {checkpoint.get('timestamp')}")
     
     # Load full inventory CSV for metadata (databases, schemas, tables, columns info)
-    inventory_path = OUTPUT_DIR / "metadata" / "full_inventory.csv"
+    inventory_path = METADATA_DIR / "full_inventory.csv"
     if inventory_path.exists():
         try:
             with open(inventory_path, "r", encoding="utf-8") as f:
@@ -525,18 +645,27 @@ def load_intermediate_state(start_stage):
                 state['databases'] = list(set((r['DATABASE'],) for r in rows))
                 state['schemas'] = list(set((r['DATABASE'], r['SCHEMA']) for r in rows))
                 state['tables'] = list(set((r['DATABASE'], r['SCHEMA'], r['TABLE']) for r in rows))
-                # Convert to column tuples matching discover_columns format
-                state['columns'] = [
-                    (r['DATABASE'], r['SCHEMA'], r['TABLE'], r['COLUMN'], 0, 
-                     r['DATA_TYPE'], r.get('MAX_LENGTH'), None, None, 'YES', r.get('COMMENT', ''))
-                    for r in rows
-                ]
+                # Convert to column tuples matching discover_columns format.
+                # The CSV round-trip turns MAX_LENGTH into text ('' for NULL,
+                # and possibly float-formatted like '500.0' in inventories
+                # written before the Arrow fetch normalized its lengths), so
+                # coerce it back to the int/None a live Phase 1 run carries
+                # before any inventory consumer compares or converts it
+                columns = []
+                for r in rows:
+                    max_len = r.get('MAX_LENGTH')
+                    columns.append((
+                        r['DATABASE'], r['SCHEMA'], r['TABLE'], r['COLUMN'], 0,
+                        r['DATA_TYPE'],
+                        int(float(max_len)) if max_len not in (None, '') else None,
+                        None, None, 'YES', r.get('COMMENT', '')))
+                state['columns'] = columns
                 print(f"  Loaded inventory: {len(state['databases'])} DBs, {len(state['tables'])} tables, {len(state['columns'])} columns")
         except Exception as e:
             print(f"  Warning: Could not load inventory: {e}")
     
     # Load stages inventory
-    stages_path = OUTPUT_DIR / "metadata" / "stages_inventory.csv"
+    stages_path = METADATA_DIR / "stages_inventory.csv"
     if stages_path.exists():
         try:
             with open(stages_path, "r", encoding="utf-8") as f:
@@ -548,7 +677,7 @@ def load_intermediate_state(start_stage):
             print(f"  Warning: Could not load stages inventory: {e}")
     
     # Load all candidates
-    candidates_path = OUTPUT_DIR / "metadata" / "all_candidates.json"
+    candidates_path = METADATA_DIR / "all_candidates.json"
     if candidates_path.exists():
         try:
             with open(candidates_path, "r", encoding="utf-8") as f:
@@ -558,7 +687,7 @@ def load_intermediate_state(start_stage):
             print(f"  Warning: Could not load candidates: {e}")
     
     # Load enhanced candidates
-    enhanced_path = OUTPUT_DIR / "metadata" / "enhanced_text_candidates.json"
+    enhanced_path = METADATA_DIR / "enhanced_text_candidates.json"
     if enhanced_path.exists():
         try:
             with open(enhanced_path, "r", encoding="utf-8") as f:
@@ -570,7 +699,7 @@ def load_intermediate_state(start_stage):
             print(f"  Warning: Could not load enhanced candidates: {e}")
     
     # Load text profiles
-    profiles_path = OUTPUT_DIR / "profiles" / "text_column_profiles.json"
+    profiles_path = PROFILES_DIR / "text_column_profiles.json"
     if profiles_path.exists():
         try:
             with open(profiles_path, "r", encoding="utf-8") as f:
@@ -600,7 +729,7 @@ def load_existing_metadata():
     }
     
     # Try to load run history
-    history_path = OUTPUT_DIR / "metadata" / "run_history.json"
+    history_path = METADATA_DIR / "run_history.json"
     if history_path.exists():
         try:
             with open(history_path, "r", encoding="utf-8") as f:
@@ -616,7 +745,7 @@ def load_existing_metadata():
 
 def save_run_history(metadata, new_databases):
     """Save run history for incremental tracking."""
-    history_path = OUTPUT_DIR / "metadata" / "run_history.json"
+    history_path = METADATA_DIR / "run_history.json"
     
     # Add current run
     current_run = {
@@ -635,8 +764,7 @@ def save_run_history(metadata, new_databases):
         'last_updated': get_utc_timestamp()
     }
     
-    with open(history_path, "w", encoding="utf-8") as f:
-        json.dump(history, f, indent=2)
+    dump_json_file(history, history_path)
     print(f"  Updated run history: {len(metadata['run_history'])} total runs")
 
 def merge_candidates(existing, new_candidates):
@@ -676,10 +804,10 @@ def prepare_output_directory():
     - Append mode: Preserve existing data
     """
     # Ensure directories exist
-    (OUTPUT_DIR / "metadata").mkdir(parents=True, exist_ok=True)
-    (OUTPUT_DIR / "logs").mkdir(parents=True, exist_ok=True)
-    (OUTPUT_DIR / "profiles").mkdir(parents=True, exist_ok=True)
-    (OUTPUT_DIR / "reports").mkdir(parents=True, exist_ok=True)
+    METADATA_DIR.mkdir(parents=True, exist_ok=True)
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    PROFILES_DIR.mkdir(parents=True, exist_ok=True)
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
     
     if RUN_MODE == 'fresh':
         if BACKUP_BEFORE_FRESH:
@@ -869,8 +997,16 @@ To run full analysis, set 'dry_run.enabled: false' in config/config.yaml
     
     return True
 
-def execute_query(conn, query, description=""):
-    """Execute SELECT query with audit logging (UTC timestamps)."""
+def execute_query(conn, query, description="", use_arrow=False):
+    """
+    Execute SELECT query with audit logging (UTC timestamps).
+
+    With use_arrow=True, results are fetched via fetch_pandas_all(), which
+    transfers Arrow batches instead of building a Python tuple per row -
+    worth it for very large result sets like the account-wide COLUMNS query.
+    Rows are still returned as plain tuples (with None for NULL), falling
+    back to the regular fetch when the connector lacks pandas/pyarrow.
+    """
     query_upper = query.strip().upper()
     if not query_upper.startswith("SELECT"):
         raise ValueError(f"SAFETY VIOLATION: Only SELECT allowed. Got: {query[:50]}")
@@ -886,6 +1022,21 @@ def execute_query(conn, query, description=""):
     try:
         cursor.execute(query)
         columns = [desc[0] for desc in cursor.description] if cursor.description else []
+        if use_arrow:
+            try:
+                df = cursor.fetch_pandas_all()
+                # Nullable FIXED scale-0 columns map to float64 through
+                # Arrow; remember them so their values can be folded back
+                # to int below, matching the tuple fetch (500, not 500.0)
+                float_cols = [c for c, dt in df.dtypes.items() if dt.kind == 'f']
+                # Restore None for NULLs (pandas surfaces them as NaN)
+                df = df.astype(object).where(df.notna(), None)
+                for c in float_cols:
+                    df[c] = [int(v) if isinstance(v, float) and v.is_integer()
+                             else v for v in df[c]]
+                return columns, list(df.itertuples(index=False, name=None))
+            except Exception:
+                pass  # connector without pandas support; use row fetch
         results = cursor.fetchall()
         return columns, results
     except Exception as e:
@@ -895,42 +1046,68 @@ def execute_query(conn, query, description=""):
         cursor.close()
 
 def save_csv(filepath, columns, rows):
-    with open(filepath, "w", newline="", encoding="utf-8") as f:
+    # 1 MiB buffer amortizes write syscalls for million-row inventories
+    with open(filepath, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         writer = csv.writer(f)
         writer.writerow(columns)
         writer.writerows(rows)
 
 def save_audit_log():
     """Save audit trail with UTC timestamp metadata."""
-    audit_path = OUTPUT_DIR / "logs" / "audit_trail.sql"
+    audit_path = LOGS_DIR / "audit_trail.sql"
     metadata = get_generated_metadata()
-    with open(audit_path, "w") as f:
-        f.write("-- ============================================================\n")
-        f.write(f"-- {AGENT_NAME} - Audit Trail\n")
-        f.write("-- ============================================================\n")
-        f.write(f"-- Generated On: {metadata['generated_on']}\n")
-        f.write(f"-- Agent Version: {metadata['agent_version']}\n")
-        f.write("-- Mode: READ-ONLY (All queries are SELECT only)\n")
-        f.write(f"-- Total Queries Executed: {len(AUDIT_LOG)}\n")
-        f.write("-- ============================================================\n\n")
-        for i, entry in enumerate(AUDIT_LOG, 1):
-            f.write(f"-- Query #{i} [{entry['timestamp']}]\n")
-            f.write(f"-- Description: {entry['description']}\n")
-            f.write(f"{entry['query']};\n\n")
+    parts = [
+        "-- ============================================================\n"
+        f"-- {AGENT_NAME} - Audit Trail\n"
+        "-- ============================================================\n"
+        f"-- Generated On: {metadata['generated_on']}\n"
+        f"-- Agent Version: {metadata['agent_version']}\n"
+        "-- Mode: READ-ONLY (All queries are SELECT only)\n"
+        f"-- Total Queries Executed: {len(AUDIT_LOG)}\n"
+        "-- ============================================================\n\n"
+    ]
+    parts.extend(
+        f"-- Query #{i} [{entry['timestamp']}]\n"
+        f"-- Description: {entry['description']}\n"
+        f"{entry['query']};\n\n"
+        for i, entry in enumerate(AUDIT_LOG, 1)
+    )
+    with open(audit_path, "w", buffering=1 << 20) as f:
+        f.write("".join(parts))
 
 def load_analysis_cache():
     """Load existing data analysis cache from JSON file"""
-    if not CACHE_FILE.exists() or FORCE_REANALYSIS:
+    if FORCE_REANALYSIS:
         return {}
 
-    try:
-        with open(CACHE_FILE, "r", encoding="utf-8") as f:
-            cache = json.load(f)
-        print(f"Loaded cache with {len(cache)} analyzed columns")
-        return cache
-    except (json.JSONDecodeError, IOError, OSError) as e:
-        print(f"Warning: Could not load cache: {e}")
-        return {}
+    cache = {}
+    if CACHE_FILE.exists():
+        try:
+            with open(CACHE_FILE, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            print(f"Loaded cache with {len(cache)} analyzed columns")
+        except (json.JSONDecodeError, IOError, OSError) as e:
+            print(f"Warning: Could not load cache: {e}")
+
+    # Replay the append-only shadow log: entries written after the last
+    # compact save survive here if a previous run crashed mid-phase
+    if CACHE_LOG_FILE.exists():
+        try:
+            replayed = 0
+            with open(CACHE_LOG_FILE, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    entry = json.loads(line)
+                    cache[entry["k"]] = entry["v"]
+                    replayed += 1
+            if replayed:
+                print(f"Replayed {replayed} cache entries from shadow log")
+        except (json.JSONDecodeError, KeyError, IOError, OSError) as e:
+            print(f"Warning: Could not replay cache log: {e}")
+
+    return cache
 
 def json_serializer(obj):
     """Custom JSON serializer for objects not serializable by default json code."""
@@ -941,22 +1118,60 @@ def json_serializer(obj):
         return obj.isoformat()
     return str(obj)
 
+def dump_json_file(obj, path, default=json_serializer, skip_unchanged=False):
+    """Write obj as indented JSON, using orjson's C encoder when available.
+
+    With skip_unchanged=True, a content digest kept in a sidecar .sha file
+    lets idempotent re-runs skip rewriting an identical artifact; the
+    encode still happens, only the disk write is saved.
+    """
+    if skip_unchanged:
+        if orjson is not None:
+            payload = orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(obj, indent=2, default=default).encode("utf-8")
+        digest = hashlib.blake2b(payload, digest_size=16).hexdigest()
+        path = Path(path)
+        sidecar = path.with_name(path.name + ".sha")
+        try:
+            if path.exists() and sidecar.exists() and sidecar.read_text() == digest:
+                return
+        except IOError:
+            pass
+        path.write_bytes(payload)
+        sidecar.write_text(digest)
+    elif orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, default=default, option=orjson.OPT_INDENT_2))
+    else:
+        # Large buffer amortizes the many small chunks iterencode emits
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            json.dump(obj, f, indent=2, default=default)
+
 def save_analysis_cache(cache):
     """Save data analysis cache to JSON file. Returns True on success, False on failure."""
     try:
         CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(cache, f, indent=2, default=json_serializer)
+        dump_json_file(cache, CACHE_FILE)
         print(f"Saved cache with {len(cache)} analyzed columns")
         return True
     except (TypeError, IOError, OSError) as e:
         print(f"Error saving cache: {e}")
         return False
 
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z0-9_$]+$')
+
+@lru_cache(maxsize=100_000)
 def validate_snowflake_identifier(identifier, name):
-    """Validate Snowflake identifier to prevent SQL injection"""
-    import re
-    if not re.match(r'^[A-Za-z0-9_$]+$', identifier):
+    """
+    Validate Snowflake identifier to prevent SQL injection.
+
+    Memoized: the same few thousand identifiers are validated several times
+    per candidate across the analysis passes, so cache results per
+    (identifier, name) pair. Invalid identifiers still raise ValueError
+    (exceptions are not cached by lru_cache).
+    """
+    if not _IDENTIFIER_RE.match(identifier):
         raise ValueError(f"Invalid {name}: {identifier}")
     return identifier
 
@@ -1030,6 +1245,27 @@ def get_database_filter_clause():
 # DEEP DATA PROFILING (Objective 2: Sparsity, Cardinality, Content Type)
 # =============================================================================
 
+# Precompiled data-type classifier: a single regex scan replaces the repeated
+# substring checks against the numeric/text/variant type name lists.
+_DTYPE_RE = re.compile(
+    r'(?P<numeric>NUMBER|INT|FLOAT|DOUBLE|DECIMAL)'
+    r'|(?P<text>VARCHAR|TEXT|STRING|CHAR)'
+    r'|(?P<variant>VARIANT|OBJECT|ARRAY)',
+    re.IGNORECASE
+)
+
+@lru_cache(maxsize=None)
+def classify_data_type(data_type):
+    """
+    Classify a Snowflake data type for query dispatch.
+
+    Returns: 'numeric', 'text', 'variant', or 'other'
+    """
+    if not data_type:
+        return 'other'
+    m = _DTYPE_RE.search(data_type)
+    return m.lastgroup if m else 'other'
+
 def classify_sparsity(null_percentage):
     """
     Classify column sparsity based on NULL percentage.
@@ -1125,8 +1361,9 @@ def run_deep_profiling(conn, db, schema, table, column, data_type):
         'profiled_at': datetime.now().isoformat()
     }
     
-    is_text = any(t in data_type.upper() for t in ['VARCHAR', 'TEXT', 'STRING', 'CHAR'])
-    is_variant = data_type.upper() in ('VARIANT', 'OBJECT', 'ARRAY')
+    dtype_kind = classify_data_type(data_type)
+    is_text = dtype_kind == 'text'
+    is_variant = dtype_kind == 'variant'
     
     try:
         cursor = conn.cursor()
@@ -1322,23 +1559,95 @@ def is_confirmed_candidate(candidate, profile=None):
     
     return is_confirmed, reasons
 
-def run_adaptive_sample(conn, db, schema, table, column, data_type):
+def confirm_candidates_bulk(candidates):
     """
-    Run adaptive sampling with fallback: 10K → 1K → 100 rows
-    Returns (success, statistics_dict, sample_size, error_msg)
+    Vectorized confirmation pass over a full candidate list.
+
+    Applies the same checks as is_confirmed_candidate, but computes the
+    pass/fail decision as pandas boolean masks over all candidates at once
+    instead of branching per candidate in Python. Reason strings are then
+    derived from the already-extracted values.
+
+    Returns: list of (is_confirmed: bool, reasons: list), aligned with candidates
     """
-    # Validate identifiers to prevent SQL injection
-    db = validate_snowflake_identifier(db, "database")
-    schema = validate_snowflake_identifier(schema, "schema")
-    table = validate_snowflake_identifier(table, "table")
-    column = validate_snowflake_identifier(column, "column")
+    import pandas as pd
 
-    # Build base query - handle different data types
-    is_numeric = any(t in data_type.upper() for t in ['NUMBER', 'INT', 'FLOAT', 'DOUBLE', 'DECIMAL'])
+    if not candidates:
+        return []
 
-    if is_numeric:
-        # For numeric columns (ML candidates), don't use LENGTH
-        base_query = f"""
+    # Extract the decision inputs once per candidate
+    null_pcts = []
+    avg_lens = []
+    is_nls = []
+    json_valids = []
+    readiness = []
+    features = []
+    for cand in candidates:
+        stats = cand.get('statistics', {})
+        null_pcts.append(stats.get('null_percentage') or stats.get('sparsity', {}).get('null_percentage', 100))
+        avg_lens.append(stats.get('avg_length') or stats.get('content_type', {}).get('avg_length', 0))
+        is_nls.append(stats.get('content_type', {}).get('is_natural_language', None))
+        json_valids.append(stats.get('json_structure', {}).get('is_valid_structure', None))
+        readiness.append(cand.get('scores', {}).get('data_readiness', 0))
+        features.append(cand.get('ai_feature', ''))
+
+    df = pd.DataFrame({
+        'null_pct': null_pcts,
+        'avg_len': avg_lens,
+        'is_nl': is_nls,
+        'json_valid': json_valids,
+        'data_readiness': readiness,
+        'ai_feature': features,
+    })
+
+    is_text_feature = df['ai_feature'].isin(['Cortex LLM', 'Cortex Search / RAG'])
+    sparsity_fail = df['null_pct'] > CONFIRM_MAX_SPARSITY
+    short_fail = is_text_feature & (df['avg_len'] > 0) & (df['avg_len'] < CONFIRM_MIN_AVG_TEXT_LENGTH)
+    nl_fail = is_text_feature & df['is_nl'].eq(False)
+    json_fail = (df['ai_feature'] == 'Cortex Extract') & df['json_valid'].eq(False)
+    readiness_fail = df['data_readiness'] < CONFIRM_MIN_DATA_READINESS
+
+    confirmed_mask = ~(sparsity_fail | short_fail | nl_fail | json_fail | readiness_fail)
+
+    # Derive per-candidate reason strings (same wording as is_confirmed_candidate)
+    results = []
+    for i in range(len(candidates)):
+        reasons = []
+        null_pct = null_pcts[i]
+        if sparsity_fail.iat[i]:
+            reasons.append(f"High sparsity ({null_pct:.1f}% NULL)")
+        else:
+            reasons.append(f"Good completeness ({100-null_pct:.1f}% populated)")
+
+        if is_text_feature.iat[i]:
+            avg_len = avg_lens[i]
+            if short_fail.iat[i]:
+                reasons.append(f"Short content (avg {avg_len:.1f} chars)")
+            elif avg_len:
+                reasons.append(f"Substantial content (avg {avg_len:.1f} chars)")
+            if nl_fail.iat[i]:
+                reasons.append("Content appears to be codes/structured, not natural language")
+            elif is_nls[i] is True:
+                reasons.append("Natural language content detected")
+
+        if features[i] == 'Cortex Extract':
+            if json_fail.iat[i]:
+                reasons.append("Invalid JSON structure detected")
+            elif json_valids[i] is True:
+                reasons.append("Valid JSON structure confirmed")
+
+        if readiness_fail.iat[i]:
+            reasons.append(f"Low data readiness score ({readiness[i]:.2f})")
+        else:
+            reasons.append(f"Good data readiness ({readiness[i]:.2f})")
+
+        results.append((bool(confirmed_mask.iat[i]), reasons))
+
+    return results
+
+# Query templates built once at import: for numeric columns (ML candidates)
+# aggregate raw values, for text/variant columns aggregate LENGTH()
+_NUMERIC_STATS_TPL = """
         SELECT
             COUNT(*) as row_count,
             COUNT("{column}") as non_null_count,
@@ -1350,9 +1659,8 @@ def run_adaptive_sample(conn, db, schema, table, column, data_type):
             STDDEV("{column}") as stddev_value
         FROM "{db}"."{schema}"."{table}"
         """
-    else:
-        # For text/variant columns, use LENGTH
-        base_query = f"""
+
+_TEXT_STATS_TPL = """
         SELECT
             COUNT(*) as row_count,
             COUNT("{column}") as non_null_count,
@@ -1365,6 +1673,61 @@ def run_adaptive_sample(conn, db, schema, table, column, data_type):
         FROM "{db}"."{schema}"."{table}"
         """
 
+def build_column_stats_query(db, schema, table, column, data_type, sample_size=None):
+    """
+    Build the column statistics query shared by the sampling and full-scan passes.
+
+    Identifiers must already be validated. Fills one of the two precomputed
+    templates instead of rebuilding the SQL per call. Returns (query, is_numeric).
+    """
+    is_numeric = classify_data_type(data_type) == 'numeric'
+    template = _NUMERIC_STATS_TPL if is_numeric else _TEXT_STATS_TPL
+    query = template.format(db=db, schema=schema, table=table, column=column)
+
+    if sample_size:
+        query += f" SAMPLE ({sample_size} ROWS)"
+
+    return query, is_numeric
+
+def build_column_stats(result, is_numeric):
+    """Convert a statistics query result row into the statistics dict."""
+    if is_numeric:
+        return {
+            "row_count": result[0],
+            "non_null_count": result[1],
+            "null_percentage": round((1 - result[1] / result[0]) * 100, 2) if result[0] > 0 else 100.0,
+            "max_value": float(result[2]) if result[2] is not None else None,
+            "min_value": float(result[3]) if result[3] is not None else None,
+            "avg_value": float(result[4]) if result[4] is not None else None,
+            "median_value": float(result[5]) if result[5] is not None else None,
+            "p95_value": float(result[6]) if result[6] is not None else None,
+            "stddev_value": float(result[7]) if result[7] is not None else None
+        }
+    return {
+        "row_count": result[0],
+        "non_null_count": result[1],
+        "null_percentage": round((1 - result[1] / result[0]) * 100, 2) if result[0] > 0 else 100.0,
+        "max_length": result[2],
+        "min_length": result[3],
+        "avg_length": round(result[4], 2) if result[4] is not None else None,
+        "median_length": round(result[5], 2) if result[5] is not None else None,
+        "p95_length": round(result[6], 2) if result[6] is not None else None,
+        "stddev_length": round(result[7], 2) if result[7] is not None else None
+    }
+
+def run_adaptive_sample(conn, db, schema, table, column, data_type):
+    """
+    Run adaptive sampling with fallback: 10K → 1K → 100 rows
+    Returns (success, statistics_dict, sample_size, error_msg)
+    """
+    # Validate identifiers to prevent SQL injection
+    db = validate_snowflake_identifier(db, "database")
+    schema = validate_snowflake_identifier(schema, "schema")
+    table = validate_snowflake_identifier(table, "table")
+    column = validate_snowflake_identifier(column, "column")
+
+    base_query, is_numeric = build_column_stats_query(db, schema, table, column, data_type)
+
     # Try samples in order from config (default: 10K, 1K, 100)
     sample_sizes = SAMPLE_SIZES
 
@@ -1381,32 +1744,7 @@ def run_adaptive_sample(conn, db, schema, table, column, data_type):
             result = cursor.fetchone()
 
             if result:
-                # Build statistics dictionary
-                if is_numeric:
-                    stats = {
-                        "row_count": result[0],
-                        "non_null_count": result[1],
-                        "null_percentage": round((1 - result[1] / result[0]) * 100, 2) if result[0] > 0 else 100.0,
-                        "max_value": float(result[2]) if result[2] is not None else None,
-                        "min_value": float(result[3]) if result[3] is not None else None,
-                        "avg_value": float(result[4]) if result[4] is not None else None,
-                        "median_value": float(result[5]) if result[5] is not None else None,
-                        "p95_value": float(result[6]) if result[6] is not None else None,
-                        "stddev_value": float(result[7]) if result[7] is not None else None
-                    }
-                else:
-                    stats = {
-                        "row_count": result[0],
-                        "non_null_count": result[1],
-                        "null_percentage": round((1 - result[1] / result[0]) * 100, 2) if result[0] > 0 else 100.0,
-                        "max_length": result[2],
-                        "min_length": result[3],
-                        "avg_length": round(result[4], 2) if result[4] is not None else None,
-                        "median_length": round(result[5], 2) if result[5] is not None else None,
-                        "p95_length": round(result[6], 2) if result[6] is not None else None,
-                        "stddev_length": round(result[7], 2) if result[7] is not None else None
-                    }
-
+                stats = build_column_stats(result, is_numeric)
                 cursor.close()
                 return (True, stats, sample_size, None)
 
@@ -1435,13 +1773,24 @@ def enhance_data_readiness_score(candidate, statistics):
 
     Returns updated score (float, 0.0-5.0)
     """
-    score = 0.0
-
     if not statistics:
         return 1.0  # Minimal score if no statistics available
 
+    # Score-relevant inputs are rounded/quantized, so many candidates collapse
+    # to the same key and re-scoring on cache-hit paths is a lookup
+    return _score_readiness(
+        statistics.get('null_percentage', 100.0),
+        statistics.get('avg_length'),
+        statistics.get('max_length'),
+        candidate.get('max_length')
+    )
+
+@lru_cache(maxsize=100_000)
+def _score_readiness(null_pct, avg_length, max_length, defined_length):
+    """Core readiness scoring math, memoized on its quantized inputs."""
+    score = 0.0
+
     # Component 1: NULL Rate Impact (0-2 points)
-    null_pct = statistics.get('null_percentage', 100.0)
     if null_pct <= 10:
         score += 2.0
     elif null_pct <= 30:
@@ -1453,7 +1802,6 @@ def enhance_data_readiness_score(candidate, statistics):
     # else: 0 points (>70% nulls)
 
     # Component 2: Content Substantiality (0-2 points) - text columns only
-    avg_length = statistics.get('avg_length')
     if avg_length is not None:
         if avg_length >= 200:
             score += 2.0
@@ -1466,8 +1814,6 @@ def enhance_data_readiness_score(candidate, statistics):
         # else: 0 points (<50 chars - likely codes/short values)
 
     # Component 3: Data Efficiency (0-1 point) - actual vs defined size
-    max_length = statistics.get('max_length')
-    defined_length = candidate.get('max_length')
     if max_length is not None and defined_length and defined_length > 0:
         efficiency = (max_length / defined_length) * 100
         if efficiency > 50:
@@ -1591,84 +1937,127 @@ def analyze_candidates(conn, candidates):
     print(f"Found {len(analyzable_candidates)} analyzable column candidates (LLM + Extract)")
     print(f"Analyzing candidates with adaptive sampling (10K→1K→100 rows)...")
 
-    for i, cand in enumerate(analyzable_candidates, 1):
-        db = cand['database']
-        schema = cand['schema']
-        table = cand['table']
-        column = cand['column']
-        data_type = cand.get('data_type', 'VARCHAR')
+    def record_error(cache_key, error_msg, attempts, unexpected=False):
+        """Append an error to the in-memory log and the errors file."""
+        error_entry = {
+            "timestamp": datetime.now().isoformat(),
+            "candidate": cache_key,
+            "error": error_msg,
+            "attempts": attempts
+        }
+        error_log.append(error_entry)
 
-        cache_key = f"{db}.{schema}.{table}.{column}"
+        with open(analysis_errors_path, "a", encoding="utf-8") as f:
+            if unexpected:
+                f.write(f"[{error_entry['timestamp']}] UNEXPECTED ERROR: {cache_key}\n")
+            else:
+                f.write(f"[{error_entry['timestamp']}] ERROR: {cache_key}\n")
+                f.write(f"  Attempts: {error_entry['attempts']}\n")
+            f.write(f"  Error: {error_msg}\n")
+            f.write(f"  Action: Skipped, continuing analysis\n\n")
+
+    def apply_stats(cand, cache_key, statistics, sample_size):
+        """Cache successful analysis and attach statistics to the candidate."""
+        cache[cache_key] = {
+            "analyzed_at": datetime.now().isoformat(),
+            "sample_size": sample_size,
+            "analysis_type": "sample",
+            "statistics": statistics
+        }
+        cand['statistics'] = statistics
+        cand['sample_size'] = sample_size
+        cand['analyzed_at'] = cache[cache_key]["analyzed_at"]
 
-        # Check cache
-        if cache_key in cache and not FORCE_REANALYSIS:
-            cached_hits += 1
-            # Apply cached statistics to candidate
-            cand['statistics'] = cache[cache_key].get('statistics', {})
-            cand['sample_size'] = cache[cache_key].get('sample_size')
-            cand['analyzed_at'] = cache[cache_key].get('analyzed_at')
-            continue
+    # Pipeline sampling queries with execute_async: while the warehouse runs
+    # the next queries, the client collects results and updates the cache for
+    # finished ones instead of blocking on each round-trip.
+    pending = deque()
+    async_cursor = conn.cursor()
+
+    def drain_oldest():
+        """Collect the oldest in-flight query; fall back to sync sampling on failure."""
+        nonlocal analyzed_count, skipped_count
+        cand, cache_key, query_id, is_numeric = pending.popleft()
 
-        # Progress indicator every 100 candidates
-        if i % 100 == 0:
-            print(f"  Progress: {i}/{len(analyzable_candidates)} candidates analyzed...")
+        try:
+            async_cursor.get_results_from_sfqid(query_id)
+            result = async_cursor.fetchone()
+            if result:
+                apply_stats(cand, cache_key, build_column_stats(result, is_numeric), SAMPLE_SIZES[0])
+                analyzed_count += 1
+                return
+            async_error = "No result returned"
+        except Exception as e:
+            async_error = str(e)
 
-        # Run adaptive sampling
+        # Async query failed at the largest sample - retry synchronously
+        # with the adaptive fallback (smaller samples).
         try:
             success, statistics, sample_size, error_msg = run_adaptive_sample(
-                conn, db, schema, table, column, data_type
+                conn, cand['database'], cand['schema'], cand['table'],
+                cand['column'], cand.get('data_type', 'VARCHAR')
             )
-
             if success:
-                # Cache successful analysis
-                cache[cache_key] = {
-                    "analyzed_at": datetime.now().isoformat(),
-                    "sample_size": sample_size,
-                    "analysis_type": "sample",
-                    "statistics": statistics
-                }
-
-                # Attach to candidate
-                cand['statistics'] = statistics
-                cand['sample_size'] = sample_size
-                cand['analyzed_at'] = cache[cache_key]["analyzed_at"]
-
+                apply_stats(cand, cache_key, statistics, sample_size)
                 analyzed_count += 1
             else:
-                # Log error
-                error_entry = {
-                    "timestamp": datetime.now().isoformat(),
-                    "candidate": cache_key,
-                    "error": error_msg,
-                    "attempts": "3 (10000→1000→100 rows)"
-                }
-                error_log.append(error_entry)
+                record_error(cache_key, error_msg, "3 (10000→1000→100 rows)")
+                skipped_count += 1
+        except Exception as e:
+            record_error(cache_key, str(e), "Unexpected error", unexpected=True)
+            skipped_count += 1
 
-                # Write to error log file
-                with open(analysis_errors_path, "a", encoding="utf-8") as f:
-                    f.write(f"[{error_entry['timestamp']}] ERROR: {cache_key}\n")
-                    f.write(f"  Attempts: {error_entry['attempts']}\n")
-                    f.write(f"  Error: {error_msg}\n")
-                    f.write(f"  Action: Skipped, continuing analysis\n\n")
+    try:
+        # Set statement timeout once for the whole pipelined session
+        async_cursor.execute(f"ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS = {DATA_ANALYSIS_SAMPLE_TIMEOUT}")
+
+        for i, cand in enumerate(analyzable_candidates, 1):
+            db = cand['database']
+            schema = cand['schema']
+            table = cand['table']
+            column = cand['column']
+            data_type = cand.get('data_type', 'VARCHAR')
+
+            cache_key = f"{db}.{schema}.{table}.{column}"
+
+            # Check cache
+            if cache_key in cache and not FORCE_REANALYSIS:
+                cached_hits += 1
+                # Apply cached statistics to candidate
+                cand['statistics'] = cache[cache_key].get('statistics', {})
+                cand['sample_size'] = cache[cache_key].get('sample_size')
+                cand['analyzed_at'] = cache[cache_key].get('analyzed_at')
+                continue
 
-                skipped_count += 1
+            # Progress indicator every 100 candidates
+            if i % 100 == 0:
+                print(f"  Progress: {i}/{len(analyzable_candidates)} candidates analyzed...")
 
-        except Exception as e:
-            # Catch-all for unexpected errors
-            error_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "candidate": cache_key,
-                "error": str(e),
-                "attempts": "Unexpected error"
-            }
-            error_log.append(error_entry)
+            try:
+                db = validate_snowflake_identifier(db, "database")
+                schema = validate_snowflake_identifier(schema, "schema")
+                table = validate_snowflake_identifier(table, "table")
+                column = validate_snowflake_identifier(column, "column")
+
+                query, is_numeric = build_column_stats_query(
+                    db, schema, table, column, data_type, sample_size=SAMPLE_SIZES[0]
+                )
+                async_cursor.execute_async(query)
+                pending.append((cand, cache_key, async_cursor.sfqid, is_numeric))
+            except Exception as e:
+                record_error(cache_key, str(e), "Unexpected error", unexpected=True)
+                skipped_count += 1
+                continue
 
-            with open(analysis_errors_path, "a", encoding="utf-8") as f:
-                f.write(f"[{error_entry['timestamp']}] UNEXPECTED ERROR: {cache_key}\n")
-                f.write(f"  Error: {str(e)}\n")
-                f.write(f"  Action: Skipped, continuing analysis\n\n")
+            # Keep a bounded number of queries in flight
+            while len(pending) >= ASYNC_PIPELINE_DEPTH:
+                drain_oldest()
 
-            skipped_count += 1
+        # Collect remaining in-flight queries
+        while pending:
+            drain_oldest()
+    finally:
+        async_cursor.close()
 
     # Step 3: Re-score with actual data
     print("\n=== Phase 2C: Re-scoring with Actual Data ===")
@@ -1725,11 +2114,10 @@ def identify_top_candidates(candidates, top_n=200):
         if 'total_score' in cand and all(k in cand for k in ['database', 'schema', 'table', 'column']):
             scorable.append(cand)
 
-    # Sort by total_score descending
-    sorted_candidates = sorted(scorable, key=lambda x: x.get('total_score', 0), reverse=True)
-
-    # Return top N
-    top_candidates = sorted_candidates[:top_n]
+    # Partial sort: only the top N ever leave this function, so a K-sized
+    # heap beats sorting all N candidates
+    top_candidates = heapq.nlargest(top_n, scorable,
+                                    key=lambda x: x.get('total_score', 0))
 
     print(f"\n=== Top {top_n} Candidates Identified ===")
     print(f"Filtered from {len(scorable)} scorable candidates")
@@ -1756,19 +2144,21 @@ def run_full_scan_analysis(conn, top_candidates, cache):
     skipped_count = 0
     total_candidates = len(top_candidates)
 
-    for i, cand in enumerate(top_candidates, 1):
+    # One timestamp per batch, refreshed at most once a minute: the cache
+    # bookkeeping only needs seconds granularity, not a syscall per candidate
+    batch_ts = datetime.now().isoformat()
+    batch_ts_refreshed = time.monotonic()
+
+    # Group candidates by table so every column's aggregates run in a single
+    # scan: one query per table instead of one full scan per column.
+    table_groups = defaultdict(list)
+    for cand in top_candidates:
         db = cand['database']
         schema = cand['schema']
         table = cand['table']
         column = cand['column']
-        data_type = cand.get('data_type', 'VARCHAR')
-
         cache_key = f"{db}.{schema}.{table}.{column}"
 
-        # Progress tracking
-        extra_info = f"OK:{success_count} Err:{skipped_count}"
-        print_progress(i, total_candidates, cache_key, "Phase 2E", extra_info)
-
         # Validate identifiers
         try:
             db = validate_snowflake_identifier(db, "database")
@@ -1778,109 +2168,187 @@ def run_full_scan_analysis(conn, top_candidates, cache):
         except ValueError as e:
             error_msg = f"Invalid identifier: {e}"
             full_scan_errors.append({
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": batch_ts,
                 "candidate": cache_key,
                 "error": error_msg
             })
             skipped_count += 1
             continue
 
-        # Build full scan query (no SAMPLE clause)
-        is_numeric = any(t in data_type.upper() for t in ['NUMBER', 'INT', 'FLOAT', 'DOUBLE', 'DECIMAL'])
-
-        if is_numeric:
-            query = f"""
-            SELECT
-                COUNT(*) as row_count,
-                COUNT("{column}") as non_null_count,
-                MAX("{column}") as max_value,
-                MIN("{column}") as min_value,
-                AVG("{column}") as avg_value,
-                PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY "{column}") as median_value,
-                PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY "{column}") as p95_value,
-                STDDEV("{column}") as stddev_value
-            FROM "{db}"."{schema}"."{table}"
-            """
-        else:
-            query = f"""
-            SELECT
-                COUNT(*) as row_count,
-                COUNT("{column}") as non_null_count,
-                MAX(LENGTH("{column}")) as max_length,
-                MIN(LENGTH("{column}")) as min_length,
-                AVG(LENGTH("{column}")) as avg_length,
-                PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY LENGTH("{column}")) as median_length,
-                PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY LENGTH("{column}")) as p95_length,
-                STDDEV(LENGTH("{column}")) as stddev_length
-            FROM "{db}"."{schema}"."{table}"
-            """
-
-        # Execute full scan with extended timeout
-        cursor = conn.cursor()
-        try:
-            cursor.execute(f"ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS = {DATA_ANALYSIS_FULL_TIMEOUT}")
-            cursor.execute(query)
-            result = cursor.fetchone()
-
-            if result:
-                # Build statistics
-                if is_numeric:
-                    stats = {
-                        "row_count": result[0],
-                        "non_null_count": result[1],
-                        "null_percentage": round((1 - result[1] / result[0]) * 100, 2) if result[0] > 0 else 100.0,
-                        "max_value": float(result[2]) if result[2] is not None else None,
-                        "min_value": float(result[3]) if result[3] is not None else None,
-                        "avg_value": float(result[4]) if result[4] is not None else None,
-                        "median_value": float(result[5]) if result[5] is not None else None,
-                        "p95_value": float(result[6]) if result[6] is not None else None,
-                        "stddev_value": float(result[7]) if result[7] is not None else None
-                    }
-                else:
-                    stats = {
-                        "row_count": result[0],
-                        "non_null_count": result[1],
-                        "null_percentage": round((1 - result[1] / result[0]) * 100, 2) if result[0] > 0 else 100.0,
-                        "max_length": result[2],
-                        "min_length": result[3],
-                        "avg_length": round(result[4], 2) if result[4] is not None else None,
-                        "median_length": round(result[5], 2) if result[5] is not None else None,
-                        "p95_length": round(result[6], 2) if result[6] is not None else None,
-                        "stddev_length": round(result[7], 2) if result[7] is not None else None
-                    }
+        table_groups[(db, schema, table)].append((cand, cache_key, column))
+
+    def build_table_scan_query(db, schema, table, group):
+        """Build the batched full scan query for one table."""
+        # Build one full scan query (no SAMPLE clause) covering all candidate
+        # columns of this table: 7 aggregates per column plus COUNT(*)
+        select_parts = ['COUNT(*) as row_count']
+        numeric_flags = []
+        for cand, cache_key, column in group:
+            is_numeric = classify_data_type(cand.get('data_type', 'VARCHAR')) == 'numeric'
+            numeric_flags.append(is_numeric)
+            expr = f'"{column}"' if is_numeric else f'LENGTH("{column}")'
+            if USE_APPROX_PERCENTILE:
+                # t-digest sketch: one pass instead of a full sort per column
+                median_expr = f'APPROX_PERCENTILE({expr}, 0.5)'
+                p95_expr = f'APPROX_PERCENTILE({expr}, 0.95)'
+            else:
+                median_expr = f'PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY {expr})'
+                p95_expr = f'PERCENTILE_CONT(0.95) WITHIN GROUP (ORDER BY {expr})'
+            select_parts.extend([
+                f'COUNT("{column}")',
+                f'MAX({expr})',
+                f'MIN({expr})',
+                f'AVG({expr})',
+                median_expr,
+                p95_expr,
+                f'STDDEV({expr})'
+            ])
+
+        select_clause = ',\n            '.join(select_parts)
+        query = f"""
+        SELECT
+            {select_clause}
+        FROM "{db}"."{schema}"."{table}"
+        """
+        return query, numeric_flags
 
-                # Update cache with full scan
-                cache[cache_key] = {
-                    "analyzed_at": datetime.now().isoformat(),
-                    "sample_size": "full",
-                    "analysis_type": "full_scan",
-                    "statistics": stats
-                }
+    # Set the extended timeout and a query tag once for the session: the
+    # ALTER SESSION is session-scoped, so cursors in the pool inherit it and
+    # we avoid one metadata round-trip per scan. The tag lets warehouse
+    # monitoring attribute (and right-size for) the full-scan workload.
+    session_cursor = conn.cursor()
+    try:
+        session_cursor.execute(
+            f"ALTER SESSION SET STATEMENT_TIMEOUT_IN_SECONDS = {DATA_ANALYSIS_FULL_TIMEOUT}, "
+            f"QUERY_TAG = 'phase2e_fullscan'"
+        )
+    finally:
+        session_cursor.close()
+
+    # Shadow log: append each completed candidate so a crash mid-phase loses
+    # at most the in-flight scans; load_analysis_cache() replays it on startup
+    CACHE_LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    cache_log = open(CACHE_LOG_FILE, "a", encoding="utf-8")
+
+    # Submit scans with execute_async and poll for completion: submission is
+    # decoupled from result collection, so up to SCAN_CONCURRENCY queries run
+    # on the warehouse while this thread does the Python-side bookkeeping.
+    processed = skipped_count
+    scan_cursor = conn.cursor()
+    pending = {}  # sfqid -> (group, numeric_flags)
+    groups_iter = iter(table_groups.items())
+    exhausted = False
 
-                # Update candidate
-                cand['statistics'] = stats
-                cand['sample_size'] = "full"
-                cand['analyzed_at'] = cache[cache_key]["analyzed_at"]
+    try:
+        while True:
+            # Keep the submission window full
+            while not exhausted and len(pending) < SCAN_CONCURRENCY:
+                try:
+                    (db, schema, table), group = next(groups_iter)
+                except StopIteration:
+                    exhausted = True
+                    break
+                query, numeric_flags = build_table_scan_query(db, schema, table, group)
+                try:
+                    scan_cursor.execute_async(query)
+                    pending[scan_cursor.sfqid] = (group, numeric_flags)
+                except Exception as e:
+                    error_msg = str(e)
+                    for cand, cache_key, column in group:
+                        processed += 1
+                        full_scan_errors.append({
+                            "timestamp": batch_ts,
+                            "candidate": cache_key,
+                            "error": error_msg
+                        })
+                        skipped_count += 1
+
+            if not pending:
+                break
 
-                # Re-score with exact data
-                enhanced_score = enhance_data_readiness_score(cand, stats)
-                if 'scores' in cand:
-                    cand['scores']['data_readiness'] = enhanced_score
-                    cand['total_score'] = sum(cand['scores'].values())
+            # Collect whichever queries have finished
+            finished = [
+                qid for qid in list(pending)
+                if not conn.is_still_running(conn.get_query_status(qid))
+            ]
+            if not finished:
+                time.sleep(0.2)
+                continue
 
-                success_count += 1
+            # Refresh the shared timestamp at most once a minute
+            if time.monotonic() - batch_ts_refreshed > 60:
+                batch_ts = datetime.now().isoformat()
+                batch_ts_refreshed = time.monotonic()
+
+            for qid in finished:
+                group, numeric_flags = pending.pop(qid)
+                try:
+                    scan_cursor.get_results_from_sfqid(qid)
+                    result = scan_cursor.fetchone()
+                    error_msg = None
+                except Exception as e:
+                    result = None
+                    error_msg = str(e)
+
+                if error_msg is None and result:
+                    row_count = result[0]
+                    for idx, (cand, cache_key, column) in enumerate(group):
+                        processed += 1
+                        extra_info = f"OK:{success_count} Err:{skipped_count}"
+                        print_progress(processed, total_candidates, cache_key, "Phase 2E", extra_info)
+
+                        # Each column occupies a fixed 7-value slice after COUNT(*)
+                        offset = 1 + idx * 7
+                        stats = build_column_stats(
+                            (row_count,) + tuple(result[offset:offset + 7]),
+                            numeric_flags[idx]
+                        )
+
+                        # Update cache with full scan
+                        cache[cache_key] = {
+                            "analyzed_at": batch_ts,
+                            "sample_size": "full",
+                            "analysis_type": "full_scan_approx" if USE_APPROX_PERCENTILE else "full_scan",
+                            "statistics": stats
+                        }
+
+                        # Update candidate
+                        cand['statistics'] = stats
+                        cand['sample_size'] = "full"
+                        cand['analyzed_at'] = cache[cache_key]["analyzed_at"]
+
+                        # Re-score with exact data
+                        enhanced_score = enhance_data_readiness_score(cand, stats)
+                        if 'scores' in cand:
+                            cand['scores']['data_readiness'] = enhanced_score
+                            cand['total_score'] = sum(cand['scores'].values())
+
+                        success_count += 1
+
+                        # Append to shadow log; O(1) vs rewriting the whole cache
+                        cache_log.write(json.dumps({"k": cache_key, "v": cache[cache_key]}, default=json_serializer) + "\n")
+                        cache_log.flush()
+
+                        # Periodic compact checkpoint, then reset the log
+                        if success_count % CACHE_CHECKPOINT_INTERVAL == 0:
+                            if save_analysis_cache(cache):
+                                cache_log.truncate(0)
+                else:
+                    if error_msg is None:
+                        error_msg = "No result returned"
+                    for cand, cache_key, column in group:
+                        processed += 1
+                        full_scan_errors.append({
+                            "timestamp": batch_ts,
+                            "candidate": cache_key,
+                            "error": error_msg
+                        })
+                        skipped_count += 1
 
-        except Exception as e:
-            error_msg = str(e)
-            full_scan_errors.append({
-                "timestamp": datetime.now().isoformat(),
-                "candidate": cache_key,
-                "error": error_msg
-            })
-            skipped_count += 1
+    finally:
+        scan_cursor.close()
 
-        finally:
-            cursor.close()
+    cache_log.close()
 
     # Print completion summary
     print_progress_complete("Phase 2E Full Scan", {
@@ -1889,8 +2357,12 @@ def run_full_scan_analysis(conn, top_candidates, cache):
         "Total processed": total_candidates
     })
 
-    # Save updated cache
-    save_analysis_cache(cache)
+    # Save updated cache; the shadow log is only needed until this succeeds
+    if save_analysis_cache(cache):
+        try:
+            CACHE_LOG_FILE.unlink()
+        except OSError:
+            pass
 
     return top_candidates, cache, full_scan_errors
 
@@ -1907,7 +2379,53 @@ def generate_data_quality_dashboard(candidates, cache, error_log):
 
     Returns dashboard markdown string
     """
-    dashboard = f"""# Data Quality Dashboard - Actual Data Analysis
+    # Single pass over candidates: fuse the summary counters, quality buckets,
+    # over-provisioning scan and per-feature rollups into one traversal
+    analyzed_candidates = 0
+    top_200_count = 0
+    high_quality = []
+    low_quality = []
+    over_provisioned = []
+    feature_stats = defaultdict(lambda: {'total': 0, 'analyzed': 0, 'high_quality': 0, 'score_sum': 0.0, 'score_n': 0})
+
+    for cand in candidates:
+        ai_feature = cand.get('ai_feature', 'Unknown')
+        feature_entry = feature_stats[ai_feature]
+        feature_entry['total'] += 1
+
+        if cand.get('sample_size') == 'full':
+            top_200_count += 1
+
+        if 'statistics' in cand:
+            analyzed_candidates += 1
+            feature_entry['analyzed'] += 1
+
+            # Over-provisioned: actual usage significantly below defined size
+            stats = cand['statistics']
+            defined_len = cand.get('max_length')
+            avg_len = stats.get('avg_length')
+            if defined_len and avg_len and defined_len > 0:
+                efficiency = (avg_len / defined_len) * 100
+                if efficiency < 25:
+                    over_provisioned.append({
+                        'candidate': cand,
+                        'defined': defined_len,
+                        'avg_actual': avg_len,
+                        'efficiency': efficiency
+                    })
+
+        if 'scores' in cand:
+            data_readiness = cand['scores'].get('data_readiness', 0)
+            # Running sum/count instead of materializing a per-feature list
+            feature_entry['score_sum'] += data_readiness
+            feature_entry['score_n'] += 1
+            if data_readiness >= 4.0:
+                high_quality.append(cand)
+                feature_entry['high_quality'] += 1
+            elif data_readiness <= 1.5:
+                low_quality.append(cand)
+
+    parts = [f"""# Data Quality Dashboard - Actual Data Analysis
 
 **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 **Analysis Type:** Adaptive Sampling (10K→1K→100 rows) + Top 200 Full Scans
@@ -1916,29 +2434,23 @@ def generate_data_quality_dashboard(candidates, cache, error_log):
 
 ## Executive Summary
 
-"""
+"""]
 
     # Calculate summary statistics
     total_candidates = len(candidates)
-    analyzed_candidates = len([c for c in candidates if 'statistics' in c])
     success_rate = (analyzed_candidates / total_candidates * 100) if total_candidates > 0 else 0
-    top_200_count = len([c for c in candidates if c.get('sample_size') == 'full'])
     error_count = len(error_log)
 
-    dashboard += f"""| Metric | Value |
+    parts.append(f"""| Metric | Value |
 |--------|-------|
 | **Total Candidates** | {total_candidates:,} |
 | **Successfully Analyzed** | {analyzed_candidates:,} ({success_rate:.1f}%) |
 | **Top Candidates (Full Scan)** | {top_200_count:,} |
 | **Analysis Errors** | {error_count:,} |
 
-"""
-
-    # Key findings
-    high_quality = [c for c in candidates if 'scores' in c and c['scores'].get('data_readiness', 0) >= 4.0]
-    low_quality = [c for c in candidates if 'scores' in c and c['scores'].get('data_readiness', 0) <= 1.5]
+""")
 
-    dashboard += f"""### Key Findings
+    parts.append(f"""### Key Findings
 
 - **High Quality Candidates:** {len(high_quality):,} columns with data readiness score ≥ 4.0
 - **Low Quality Candidates:** {len(low_quality):,} columns with data readiness score ≤ 1.5
@@ -1952,39 +2464,20 @@ Columns where actual data usage is significantly below defined size (efficiency
 
 | Rank | Database.Schema.Table.Column | Defined | Avg Actual | Efficiency | Recommendation |
 |------|------------------------------|---------|------------|------------|----------------|
-"""
-
-    # Find over-provisioned columns
-    over_provisioned = []
-    for cand in candidates:
-        if 'statistics' not in cand:
-            continue
-        stats = cand['statistics']
-        defined_len = cand.get('max_length')
-        avg_len = stats.get('avg_length')
-
-        if defined_len and avg_len and defined_len > 0:
-            efficiency = (avg_len / defined_len) * 100
-            if efficiency < 25:
-                over_provisioned.append({
-                    'candidate': cand,
-                    'defined': defined_len,
-                    'avg_actual': avg_len,
-                    'efficiency': efficiency
-                })
+""")
 
-    # Sort by worst efficiency
-    over_provisioned.sort(key=lambda x: x['efficiency'])
+    # Partial selection: only the 20 worst efficiencies are reported
+    top_over_provisioned = heapq.nsmallest(20, over_provisioned, key=lambda x: x['efficiency'])
 
-    for i, item in enumerate(over_provisioned[:20], 1):
+    for i, item in enumerate(top_over_provisioned, 1):
         cand = item['candidate']
         fqn = f"{cand.get('database', 'N/A')}.{cand.get('schema', 'N/A')}.{cand.get('table', 'N/A')}.{cand.get('column', 'N/A')}"
-        dashboard += f"| {i} | `{fqn[:60]}` | {item['defined']} | {item['avg_actual']:.1f} | {item['efficiency']:.1f}% | Consider VARCHAR({int(item['avg_actual'] * 2)}) |\n"
+        parts.append(f"| {i} | `{fqn[:60]}` | {item['defined']} | {item['avg_actual']:.1f} | {item['efficiency']:.1f}% | Consider VARCHAR({int(item['avg_actual'] * 2)}) |\n")
 
     if not over_provisioned:
-        dashboard += "| - | No significantly over-provisioned columns found | - | - | - | - |\n"
+        parts.append("| - | No significantly over-provisioned columns found | - | - | - | - |\n")
 
-    dashboard += f"""
+    parts.append(f"""
 ---
 
 ## Highest Quality AI Candidates
@@ -1993,23 +2486,25 @@ Top candidates with excellent data readiness (score ≥ 4.0).
 
 | Rank | Database.Schema.Table.Column | Score | Avg Length | NULL% | AI Feature |
 |------|------------------------------|-------|------------|-------|------------|
-"""
+""")
 
-    # Sort high quality by score
-    high_quality_sorted = sorted(high_quality, key=lambda x: x.get('total_score', 0), reverse=True)
+    # Partial selection: top 30 by score without sorting the whole bucket
+    high_quality_sorted = heapq.nlargest(30, high_quality, key=lambda x: x.get('total_score', 0))
 
-    for i, cand in enumerate(high_quality_sorted[:30], 1):
-        fqn = f"{cand.get('database', 'N/A')}.{cand.get('schema', 'N/A')}.{cand.get('table', 'N/A')}.{cand.get('column', 'N/A')}"
+    for i, cand in enumerate(high_quality_sorted, 1):
+        # Hoist dict lookups into locals; one fqn build per row
+        stats = cand.get('statistics') or {}
+        fqn = f"{cand.get('database', 'N/A')}.{cand.get('schema', 'N/A')}.{cand.get('table', 'N/A')}.{cand.get('column', 'N/A')}"[:60]
         score = cand.get('total_score', 0)
-        avg_len = cand.get('statistics', {}).get('avg_length', 0) if 'statistics' in cand else 0
-        null_pct = cand.get('statistics', {}).get('null_percentage', 100) if 'statistics' in cand else 100
+        avg_len = stats.get('avg_length', 0)
+        null_pct = stats.get('null_percentage', 100)
         ai_feature = cand.get('ai_feature', 'N/A')
-        dashboard += f"| {i} | `{fqn[:60]}` | {score:.2f} | {avg_len:.1f} | {null_pct:.1f}% | {ai_feature} |\n"
+        parts.append(f"| {i} | `{fqn}` | {score:.2f} | {avg_len:.1f} | {null_pct:.1f}% | {ai_feature} |\n")
 
     if not high_quality:
-        dashboard += "| - | No high-quality candidates found | - | - | - | - |\n"
+        parts.append("| - | No high-quality candidates found | - | - | - | - |\n")
 
-    dashboard += f"""
+    parts.append(f"""
 ---
 
 ## Candidates to Reconsider
@@ -2018,15 +2513,15 @@ Candidates with poor data quality (data readiness ≤ 1.5) that may not be suita
 
 | Database.Schema.Table.Column | Total Score | Data Readiness | Issue | Reason |
 |------------------------------|-------------|----------------|-------|--------|
-"""
+""")
 
     for cand in low_quality[:20]:
-        fqn = f"{cand.get('database', 'N/A')}.{cand.get('schema', 'N/A')}.{cand.get('table', 'N/A')}.{cand.get('column', 'N/A')}"
+        stats = cand.get('statistics') or {}
+        fqn = f"{cand.get('database', 'N/A')}.{cand.get('schema', 'N/A')}.{cand.get('table', 'N/A')}.{cand.get('column', 'N/A')}"[:60]
         total_score = cand.get('total_score', 0)
         data_readiness = cand['scores'].get('data_readiness', 0)
 
         # Determine issue
-        stats = cand.get('statistics', {})
         null_pct = stats.get('null_percentage', 100)
         avg_len = stats.get('avg_length', 0)
 
@@ -2040,50 +2535,33 @@ Candidates with poor data quality (data readiness ≤ 1.5) that may not be suita
             issue = "Low quality"
             reason = "Multiple factors"
 
-        dashboard += f"| `{fqn[:60]}` | {total_score:.2f} | {data_readiness:.2f} | {issue} | {reason} |\n"
+        parts.append(f"| `{fqn}` | {total_score:.2f} | {data_readiness:.2f} | {issue} | {reason} |\n")
 
     if not low_quality:
-        dashboard += "| - | No low-quality candidates identified | - | - | - | - |\n"
+        parts.append("| - | No low-quality candidates identified | - | - | - | - |\n")
 
-    dashboard += f"""
+    parts.append(f"""
 ---
 
 ## Data Quality by AI Feature
 
-"""
-
-    # Group by AI feature
-    feature_stats = defaultdict(lambda: {'total': 0, 'analyzed': 0, 'high_quality': 0, 'avg_score': []})
-
-    for cand in candidates:
-        ai_feature = cand.get('ai_feature', 'Unknown')
-        feature_stats[ai_feature]['total'] += 1
-
-        if 'statistics' in cand:
-            feature_stats[ai_feature]['analyzed'] += 1
-
-        if 'scores' in cand:
-            data_readiness = cand['scores'].get('data_readiness', 0)
-            feature_stats[ai_feature]['avg_score'].append(data_readiness)
-
-            if data_readiness >= 4.0:
-                feature_stats[ai_feature]['high_quality'] += 1
+""")
 
     for feature in sorted(feature_stats.keys()):
         stats = feature_stats[feature]
-        avg_score = sum(stats['avg_score']) / len(stats['avg_score']) if stats['avg_score'] else 0
+        avg_score = stats['score_sum'] / stats['score_n'] if stats['score_n'] else 0
         analysis_rate = (stats['analyzed'] / stats['total'] * 100) if stats['total'] > 0 else 0
 
-        dashboard += f"""### {feature}
+        parts.append(f"""### {feature}
 
 - **Total Candidates:** {stats['total']:,}
 - **Analyzed:** {stats['analyzed']:,} ({analysis_rate:.1f}%)
 - **High Quality (≥4.0):** {stats['high_quality']:,}
 - **Average Data Readiness:** {avg_score:.2f}/5.0
 
-"""
+""")
 
-    dashboard += """---
+    parts.append("""---
 
 ## Next Steps
 
@@ -2103,9 +2581,9 @@ Candidates with poor data quality (data readiness ≤ 1.5) that may not be suita
 | `metadata/top_200_full_analysis.json` | Detailed exact statistics for top 200 |
 | `logs/analysis_errors.log` | Detailed error log |
 | `logs/analysis_summary.log` | Summary statistics |
-"""
+""")
 
-    return dashboard
+    return "".join(parts)
 
 def generate_comparison_report(candidates):
     """
@@ -2116,7 +2594,9 @@ def generate_comparison_report(candidates):
 
     Returns comparison report markdown string
     """
-    report = f"""# Scoring Comparison Report - Metadata vs Data-Enhanced
+    import numpy as np
+
+    parts = [f"""# Scoring Comparison Report - Metadata vs Data-Enhanced
 
 **Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
@@ -2141,60 +2621,70 @@ def generate_comparison_report(candidates):
 
 ## Impact Summary
 
-"""
+"""]
 
-    # Separate candidates into before/after groups
+    # Separate candidates into before/after groups in one partition pass;
+    # bind the append methods once instead of a lookup per iteration
     metadata_only = []
     data_enhanced = []
+    append_enhanced = data_enhanced.append
+    append_metadata = metadata_only.append
 
     for cand in candidates:
         if 'statistics' in cand and 'scores' in cand:
-            data_enhanced.append(cand)
+            append_enhanced(cand)
         else:
-            metadata_only.append(cand)
+            append_metadata(cand)
 
-    report += f"""| Metric | Count |
+    parts.append(f"""| Metric | Count |
 |--------|-------|
 | **Total Candidates** | {len(candidates):,} |
 | **Data-Enhanced Candidates** | {len(data_enhanced):,} |
 | **Metadata-Only Candidates** | {len(metadata_only):,} |
 
-"""
+""")
 
-    # Calculate score distributions
+    # Calculate score distributions: extract the scores once and reduce with
+    # vectorized C loops instead of three list-comprehension scans
     if data_enhanced:
-        data_readiness_scores = [c['scores'].get('data_readiness', 0) for c in data_enhanced]
-        avg_dr_score = sum(data_readiness_scores) / len(data_readiness_scores)
-        high_dr = len([s for s in data_readiness_scores if s >= 4.0])
-        low_dr = len([s for s in data_readiness_scores if s <= 1.5])
+        dr = np.fromiter(
+            (c['scores'].get('data_readiness', 0.0) for c in data_enhanced),
+            dtype=np.float64, count=len(data_enhanced)
+        )
+        avg_dr_score = float(dr.mean())
+        high_dr = int((dr >= 4.0).sum())
+        low_dr = int((dr <= 1.5).sum())
 
-        report += f"""### Data-Enhanced Candidates Statistics
+        parts.append(f"""### Data-Enhanced Candidates Statistics
 
 - **Average Data Readiness Score:** {avg_dr_score:.2f}/5.0
 - **High Quality (≥4.0):** {high_dr:,} ({high_dr/len(data_enhanced)*100:.1f}%)
 - **Low Quality (≤1.5):** {low_dr:,} ({low_dr/len(data_enhanced)*100:.1f}%)
 
-"""
+""")
 
     # Identify movers (for candidates with both metadata and data scores)
-    # We'll simulate "before" by using a fixed metadata score of 3.0
-    movers = []
-    for cand in data_enhanced:
-        metadata_dr_score = 3.0  # Default metadata-based data readiness
-        enhanced_dr_score = cand['scores'].get('data_readiness', 3.0)
-        score_change = enhanced_dr_score - metadata_dr_score
-
-        movers.append({
-            'candidate': cand,
-            'before': metadata_dr_score,
-            'after': enhanced_dr_score,
-            'change': score_change
-        })
+    # We'll simulate "before" by using a fixed metadata score of 3.0.
+    # Scores live in parallel NumPy arrays; no per-candidate mover dicts.
+    metadata_dr_score = 3.0  # Default metadata-based data readiness
+    after_scores = np.fromiter(
+        (c['scores'].get('data_readiness', 3.0) for c in data_enhanced),
+        dtype=np.float64, count=len(data_enhanced)
+    )
+    change = after_scores - metadata_dr_score
+    improver_count = int((change > 0).sum())
+    decliner_count = int((change < 0).sum())
 
-    # Sort by biggest change
-    movers.sort(key=lambda x: abs(x['change']), reverse=True)
+    def top_change_indices(descending, count):
+        """Indices of the 15 biggest positive/negative changes via argpartition."""
+        k = min(15, count)
+        if k == 0:
+            return []
+        order = -change if descending else change
+        idx = np.argpartition(order, k - 1)[:k]
+        return idx[np.argsort(order[idx])]
 
-    report += f"""---
+    parts.append(f"""---
 
 ## Biggest Movers (Up and Down)
 
@@ -2204,13 +2694,13 @@ Candidates that proved to be higher quality than metadata suggested.
 
 | Rank | Database.Schema.Table.Column | Before | After | Change | Reason |
 |------|------------------------------|--------|-------|--------|--------|
-"""
+""")
 
-    improvers = [m for m in movers if m['change'] > 0]
-    for i, mover in enumerate(improvers[:15], 1):
-        cand = mover['candidate']
-        fqn = f"{cand.get('database', 'N/A')}.{cand.get('schema', 'N/A')}.{cand.get('table', 'N/A')}.{cand.get('column', 'N/A')}"
-        stats = cand.get('statistics', {})
+    # Partial selection: only the 15 biggest improvements are reported
+    for i, idx in enumerate(top_change_indices(descending=True, count=improver_count), 1):
+        cand = data_enhanced[idx]
+        fqn = f"{cand.get('database', 'N/A')}.{cand.get('schema', 'N/A')}.{cand.get('table', 'N/A')}.{cand.get('column', 'N/A')}"[:55]
+        stats = cand.get('statistics') or {}
         null_pct = stats.get('null_percentage', 100)
         avg_len = stats.get('avg_length', 0)
 
@@ -2224,12 +2714,12 @@ Candidates that proved to be higher quality than metadata suggested.
         else:
             reason = "Good data quality"
 
-        report += f"| {i} | `{fqn[:55]}` | {mover['before']:.2f} | {mover['after']:.2f} | +{mover['change']:.2f} | {reason} |\n"
+        parts.append(f"| {i} | `{fqn}` | {metadata_dr_score:.2f} | {after_scores[idx]:.2f} | +{change[idx]:.2f} | {reason} |\n")
 
-    if not improvers:
-        report += "| - | No improvers found | - | - | - | - |\n"
+    if not improver_count:
+        parts.append("| - | No improvers found | - | - | - | - |\n")
 
-    report += f"""
+    parts.append(f"""
 
 ### Top Decliners (Enhanced Score < Metadata Score)
 
@@ -2237,15 +2727,13 @@ Candidates that proved to be lower quality than metadata suggested.
 
 | Rank | Database.Schema.Table.Column | Before | After | Change | Reason |
 |------|------------------------------|--------|-------|--------|--------|
-"""
-
-    decliners = [m for m in movers if m['change'] < 0]
-    decliners.sort(key=lambda x: x['change'])  # Most negative first
+""")
 
-    for i, mover in enumerate(decliners[:15], 1):
-        cand = mover['candidate']
-        fqn = f"{cand.get('database', 'N/A')}.{cand.get('schema', 'N/A')}.{cand.get('table', 'N/A')}.{cand.get('column', 'N/A')}"
-        stats = cand.get('statistics', {})
+    # Partial selection: most negative 15 without a full sort
+    for i, idx in enumerate(top_change_indices(descending=False, count=decliner_count), 1):
+        cand = data_enhanced[idx]
+        fqn = f"{cand.get('database', 'N/A')}.{cand.get('schema', 'N/A')}.{cand.get('table', 'N/A')}.{cand.get('column', 'N/A')}"[:55]
+        stats = cand.get('statistics') or {}
         null_pct = stats.get('null_percentage', 100)
         avg_len = stats.get('avg_length', 0)
 
@@ -2259,29 +2747,29 @@ Candidates that proved to be lower quality than metadata suggested.
         else:
             reason = "Data quality issues"
 
-        report += f"| {i} | `{fqn[:55]}` | {mover['before']:.2f} | {mover['after']:.2f} | {mover['change']:.2f} | {reason} |\n"
+        parts.append(f"| {i} | `{fqn}` | {metadata_dr_score:.2f} | {after_scores[idx]:.2f} | {change[idx]:.2f} | {reason} |\n")
 
-    if not decliners:
-        report += "| - | No decliners found | - | - | - | - |\n"
+    if not decliner_count:
+        parts.append("| - | No decliners found | - | - | - | - |\n")
 
-    report += f"""
+    parts.append(f"""
 
 ---
 
 ## Key Insights
 
-"""
+""")
 
-    if improvers and decliners:
-        report += f"""- **{len(improvers):,} candidates improved** with data-enhanced scoring
-- **{len(decliners):,} candidates declined** with data-enhanced scoring
+    if improver_count and decliner_count:
+        parts.append(f"""- **{improver_count:,} candidates improved** with data-enhanced scoring
+- **{decliner_count:,} candidates declined** with data-enhanced scoring
 - Data-enhanced scoring provides more accurate ranking based on actual content quality
 - Metadata alone can be misleading - columns with large defined sizes may have sparse content
 - NULL rates and actual content length are critical factors missed by metadata-only analysis
 
-"""
+""")
 
-    report += """---
+    parts.append("""---
 
 ## Recommendations
 
@@ -2297,9 +2785,9 @@ Candidates that proved to be lower quality than metadata suggested.
 - Review [Data Quality Dashboard](data_quality_dashboard.md) for detailed analysis
 - Focus POCs on top data-enhanced candidates
 - Address data quality issues in declining candidates
-"""
+""")
 
-    return report
+    return "".join(parts)
 
 def save_enhanced_metadata(candidates, top_candidates, dashboard, comparison_report):
     """
@@ -2314,14 +2802,12 @@ def save_enhanced_metadata(candidates, top_candidates, dashboard, comparison_rep
     results = {}
 
     # Ensure reports directory exists
-    reports_dir = OUTPUT_DIR / "reports"
-    reports_dir.mkdir(parents=True, exist_ok=True)
+    REPORTS_DIR.mkdir(parents=True, exist_ok=True)
 
     # Save all_candidates_enhanced.json
     try:
-        enhanced_path = OUTPUT_DIR / "metadata" / "all_candidates_enhanced.json"
-        with open(enhanced_path, "w", encoding="utf-8") as f:
-            json.dump(candidates, f, indent=2, default=str)
+        enhanced_path = METADATA_DIR / "all_candidates_enhanced.json"
+        dump_json_file(candidates, enhanced_path, default=str)
         results['all_candidates_enhanced'] = str(enhanced_path)
         print(f"Saved enhanced candidates to {enhanced_path}")
     except Exception as e:
@@ -2329,9 +2815,8 @@ def save_enhanced_metadata(candidates, top_candidates, dashboard, comparison_rep
 
     # Save top_200_full_analysis.json
     try:
-        top_200_path = OUTPUT_DIR / "metadata" / "top_200_full_analysis.json"
-        with open(top_200_path, "w", encoding="utf-8") as f:
-            json.dump(top_candidates, f, indent=2, default=str)
+        top_200_path = METADATA_DIR / "top_200_full_analysis.json"
+        dump_json_file(top_candidates, top_200_path, default=str)
         results['top_200_full_analysis'] = str(top_200_path)
         print(f"Saved top 200 analysis to {top_200_path}")
     except Exception as e:
@@ -2339,7 +2824,7 @@ def save_enhanced_metadata(candidates, top_candidates, dashboard, comparison_rep
 
     # Save data_quality_dashboard.md
     try:
-        dashboard_path = reports_dir / "data_quality_dashboard.md"
+        dashboard_path = REPORTS_DIR / "data_quality_dashboard.md"
         with open(dashboard_path, "w", encoding="utf-8") as f:
             f.write(dashboard)
         results['data_quality_dashboard'] = str(dashboard_path)
@@ -2349,7 +2834,7 @@ def save_enhanced_metadata(candidates, top_candidates, dashboard, comparison_rep
 
     # Save scoring_comparison.md
     try:
-        comparison_path = reports_dir / "scoring_comparison.md"
+        comparison_path = REPORTS_DIR / "scoring_comparison.md"
         with open(comparison_path, "w", encoding="utf-8") as f:
             f.write(comparison_report)
         results['scoring_comparison'] = str(comparison_path)
@@ -2493,7 +2978,7 @@ def discover_columns(conn):
     QUALIFY ROW_NUMBER() OVER (PARTITION BY TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME ORDER BY ORDINAL_POSITION) = 1
     ORDER BY TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION
     """
-    cols, rows = execute_query(conn, query, "List all columns from ACCOUNT_USAGE (filtered)")
+    cols, rows = execute_query(conn, query, "List all columns from ACCOUNT_USAGE (filtered)", use_arrow=True)
     print(f"Found {len(rows)} columns")
     return cols, rows
 
@@ -2531,46 +3016,70 @@ def discover_stages(conn):
 
 # ==================== PHASE 2: AI CANDIDATE IDENTIFICATION ====================
 
-def identify_llm_candidates(columns_data):
-    """Find high-density VARCHAR/TEXT columns for Cortex LLM"""
-    candidates = []
-    text_indicators = ['DESCRIPTION', 'CONTENT', 'MESSAGE', 'NOTE', 'SUMMARY',
-                       'DETAIL', 'BODY', 'TEXT', 'COMMENT', 'FEEDBACK', 'REVIEW',
-                       'ABSTRACT', 'BIO', 'NARRATIVE', 'TITLE', 'SUBJECT']
+# Precompiled alternations: one C-level scan per row instead of N Python-level
+# substring tests inside any()
+_TEXT_TYPE_RE = re.compile(r'VARCHAR|TEXT|STRING|CHAR')
+_TEXT_INDICATOR_RE = re.compile(
+    r'DESCRIPTION|CONTENT|MESSAGE|NOTE|SUMMARY|DETAIL|BODY|TEXT|COMMENT'
+    r'|FEEDBACK|REVIEW|ABSTRACT|BIO|NARRATIVE|TITLE|SUBJECT'
+)
+
+_SEARCH_TEXT_TYPE_RE = re.compile(r'VARCHAR|TEXT|STRING')
+_NUMERIC_TYPE_RE = re.compile(r'NUMBER|FLOAT|DECIMAL|INTEGER|DOUBLE')
+_TEMPORAL_TYPE_RE = re.compile(r'TIMESTAMP|DATE')
+
+def classify_columns(columns_data):
+    """
+    Classify all column rows for AI candidate identification in one pass.
+
+    Each row is unpacked and uppercased once, then dispatched to every
+    accumulator (LLM, Extract, ML, Search) instead of re-reading
+    columns_data per feature.
+
+    Returns (llm_candidates, variant_candidates, ml_candidates, search_candidates)
+    """
+    llm_candidates = []
+    variant_candidates = []
+    table_ml = defaultdict(lambda: [False, []])  # ML: [has_timestamp, numeric col names]
+    table_long_text = defaultdict(list)          # Search: text col names with max_len >= 200
+
+    # Data types repeat across millions of columns (a few dozen distinct
+    # values), so normalize each distinct type string only once
+    dtype_upper_cache = {}
 
     for row in columns_data:
         db, schema, table, col_name, _, data_type, max_len, _, _, _, comment = row
         if not data_type:
             continue
-        dtype_upper = data_type.upper()
+        dtype_upper = dtype_upper_cache.get(data_type)
+        if dtype_upper is None:
+            dtype_upper = dtype_upper_cache[data_type] = data_type.upper()
         col_upper = (col_name or "").upper()
+        table_key = (db, schema, table)
+        # Coerce the connector's Decimal lengths to int at creation so the
+        # JSON encoders never hit the default=str fallback path; treat the
+        # CSV round-trip's '' the same as NULL rather than crashing on it
+        max_len = int(max_len) if max_len not in (None, '') else None
+
+        # Cortex LLM: text columns, long or semantically named
+        if _TEXT_TYPE_RE.search(dtype_upper):
+            is_long_text = max_len and max_len >= 500
+            if is_long_text or _TEXT_INDICATOR_RE.search(col_upper):
+                llm_candidates.append({
+                    "database": db,
+                    "schema": schema,
+                    "table": table,
+                    "column": col_name,
+                    "data_type": data_type,
+                    "max_length": max_len,
+                    "comment": comment,
+                    "ai_feature": "Cortex LLM",
+                    "reason": f"Text column ({data_type}) - {'long text' if is_long_text else 'semantic name'}"
+                })
 
-        # Check for text columns
-        is_text_type = any(t in dtype_upper for t in ['VARCHAR', 'TEXT', 'STRING', 'CHAR'])
-        is_long_text = max_len and max_len >= 500
-        has_text_indicator = any(ind in col_upper for ind in text_indicators)
-
-        if is_text_type and (is_long_text or has_text_indicator):
-            candidates.append({
-                "database": db,
-                "schema": schema,
-                "table": table,
-                "column": col_name,
-                "data_type": data_type,
-                "max_length": max_len,
-                "comment": comment,
-                "ai_feature": "Cortex LLM",
-                "reason": f"Text column ({data_type}) - {'long text' if is_long_text else 'semantic name'}"
-            })
-    return candidates
-
-def identify_variant_candidates(columns_data):
-    """Find VARIANT columns for Cortex Extract"""
-    candidates = []
-    for row in columns_data:
-        db, schema, table, col_name, _, data_type, _, _, _, _, comment = row
-        if data_type and data_type.upper() in ('VARIANT', 'OBJECT', 'ARRAY'):
-            candidates.append({
+        # Cortex Extract: semi-structured columns
+        if dtype_upper in ('VARIANT', 'OBJECT', 'ARRAY'):
+            variant_candidates.append({
                 "database": db,
                 "schema": schema,
                 "table": table,
@@ -2580,48 +3089,35 @@ def identify_variant_candidates(columns_data):
                 "ai_feature": "Cortex Extract",
                 "reason": f"Semi-structured {data_type} column"
             })
-    return candidates
 
-def identify_ml_candidates(columns_data):
-    """Find tables with TIMESTAMP + NUMBER for ML forecasting/anomaly"""
-    table_columns = defaultdict(list)
-    for row in columns_data:
-        db, schema, table, col_name, _, data_type, _, _, _, _, _ = row
-        key = (db, schema, table)
-        table_columns[key].append((col_name, data_type or ""))
-
-    candidates = []
-    for (db, schema, table), cols in table_columns.items():
-        has_timestamp = any('TIMESTAMP' in dtype.upper() or 'DATE' in dtype.upper()
-                           for _, dtype in cols if dtype)
-        num_cols = [(name, dtype) for name, dtype in cols if dtype and
-                    any(t in dtype.upper() for t in ['NUMBER', 'FLOAT', 'DECIMAL', 'INTEGER', 'DOUBLE'])]
-
-        if has_timestamp and len(num_cols) >= 1:
-            candidates.append({
+        # ML / Search accumulate running aggregates per table, resolved below
+        # without a second scan over every column
+        ml_info = table_ml[table_key]
+        if _TEMPORAL_TYPE_RE.search(dtype_upper):
+            ml_info[0] = True
+        elif _NUMERIC_TYPE_RE.search(dtype_upper):
+            ml_info[1].append(col_name)
+        if _SEARCH_TEXT_TYPE_RE.search(dtype_upper) and (max_len or 0) >= 200:
+            table_long_text[table_key].append(col_name)
+
+    # Cortex ML: tables with TIMESTAMP/DATE plus numeric columns
+    ml_candidates = []
+    for (db, schema, table), (has_timestamp, num_cols) in table_ml.items():
+        if has_timestamp and num_cols:
+            ml_candidates.append({
                 "database": db,
                 "schema": schema,
                 "table": table,
                 "ai_feature": "Cortex ML (Forecasting/Anomaly)",
                 "reason": f"Has timestamp + {len(num_cols)} numeric columns",
-                "numeric_columns": [n for n, _ in num_cols[:5]]
+                "numeric_columns": num_cols[:5]
             })
-    return candidates
 
-def identify_search_candidates(columns_data):
-    """Find tables with rich text for Cortex Search/RAG"""
-    table_text_cols = defaultdict(list)
-    for row in columns_data:
-        db, schema, table, col_name, _, data_type, max_len, _, _, _, _ = row
-        if data_type and any(t in data_type.upper() for t in ['VARCHAR', 'TEXT', 'STRING']):
-            key = (db, schema, table)
-            table_text_cols[key].append((col_name, max_len or 0))
-
-    candidates = []
-    for (db, schema, table), text_cols in table_text_cols.items():
-        long_text = [c for c, length in text_cols if length >= 200]
+    # Cortex Search: tables with multiple substantial text columns
+    search_candidates = []
+    for (db, schema, table), long_text in table_long_text.items():
         if len(long_text) >= 2:
-            candidates.append({
+            search_candidates.append({
                 "database": db,
                 "schema": schema,
                 "table": table,
@@ -2629,128 +3125,86 @@ def identify_search_candidates(columns_data):
                 "reason": f"{len(long_text)} substantial text columns",
                 "text_columns": long_text[:5]
             })
-    return candidates
+
+    return llm_candidates, variant_candidates, ml_candidates, search_candidates
+
+def identify_llm_candidates(columns_data):
+    """Find high-density VARCHAR/TEXT columns for Cortex LLM"""
+    return classify_columns(columns_data)[0]
+
+def identify_variant_candidates(columns_data):
+    """Find VARIANT columns for Cortex Extract"""
+    return classify_columns(columns_data)[1]
+
+def identify_ml_candidates(columns_data):
+    """Find tables with TIMESTAMP + NUMBER for ML forecasting/anomaly"""
+    return classify_columns(columns_data)[2]
+
+def identify_search_candidates(columns_data):
+    """Find tables with rich text for Cortex Search/RAG"""
+    return classify_columns(columns_data)[3]
 
 # ==================== PHASE 3: ENHANCED TEXT ANALYSIS ====================
 
-def find_text_rich_columns(conn):
-    """Find columns likely to contain rich text content"""
-    print("\n=== Finding Text-Rich Columns ===")
-    query = """
-    SELECT
-        TABLE_CATALOG AS DATABASE_NAME,
-        TABLE_SCHEMA AS SCHEMA_NAME,
-        TABLE_NAME,
-        COLUMN_NAME,
-        DATA_TYPE,
-        CHARACTER_MAXIMUM_LENGTH,
-        COMMENT
-    FROM SNOWFLAKE.ACCOUNT_USAGE.COLUMNS
-    WHERE DELETED IS NULL
-    AND (
-        DATA_TYPE IN ('TEXT', 'VARCHAR', 'STRING')
-        AND (
-            CHARACTER_MAXIMUM_LENGTH >= 1000
-            OR UPPER(COLUMN_NAME) LIKE '%DESCRIPTION%'
-            OR UPPER(COLUMN_NAME) LIKE '%CONTENT%'
-            OR UPPER(COLUMN_NAME) LIKE '%MESSAGE%'
-            OR UPPER(COLUMN_NAME) LIKE '%NOTE%'
-            OR UPPER(COLUMN_NAME) LIKE '%SUMMARY%'
-            OR UPPER(COLUMN_NAME) LIKE '%DETAIL%'
-            OR UPPER(COLUMN_NAME) LIKE '%BODY%'
-            OR UPPER(COLUMN_NAME) LIKE '%TEXT%'
-            OR UPPER(COLUMN_NAME) LIKE '%COMMENT%'
-            OR UPPER(COLUMN_NAME) LIKE '%FEEDBACK%'
-            OR UPPER(COLUMN_NAME) LIKE '%REVIEW%'
-            OR UPPER(COLUMN_NAME) LIKE '%ABSTRACT%'
-            OR UPPER(COLUMN_NAME) LIKE '%NARRATIVE%'
-        )
-    )
-    ORDER BY TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME
-    """
-    cols, rows = execute_query(conn, query, "Find text-rich columns for LLM analysis")
-    print(f"Found {len(rows)} text-rich columns")
-    return rows
-
-def find_education_tables(conn):
-    """Find education/learning related tables"""
-    print("\n=== Finding Education Content Tables ===")
-    query = """
-    SELECT DISTINCT TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME
-    FROM SNOWFLAKE.ACCOUNT_USAGE.COLUMNS
-    WHERE DELETED IS NULL
-    AND (
-        UPPER(TABLE_NAME) LIKE '%CURRICULUM%'
-        OR UPPER(TABLE_NAME) LIKE '%LESSON%'
-        OR UPPER(TABLE_NAME) LIKE '%COURSE%'
-        OR UPPER(TABLE_NAME) LIKE '%STUDENT%'
-        OR UPPER(TABLE_NAME) LIKE '%LEARNING%'
-        OR UPPER(TABLE_NAME) LIKE '%ASSESSMENT%'
-        OR UPPER(TABLE_NAME) LIKE '%QUESTION%'
-        OR UPPER(TABLE_NAME) LIKE '%ANSWER%'
-        OR UPPER(TABLE_NAME) LIKE '%CONTENT%'
-        OR UPPER(TABLE_NAME) LIKE '%RESOURCE%'
-        OR UPPER(TABLE_NAME) LIKE '%FEEDBACK%'
-        OR UPPER(TABLE_NAME) LIKE '%SKILL%'
-        OR UPPER(TABLE_NAME) LIKE '%GRADE%'
-        OR UPPER(TABLE_NAME) LIKE '%SCORE%'
-        OR UPPER(TABLE_NAME) LIKE '%TEST%'
-    )
-    ORDER BY TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME
-    """
-    cols, rows = execute_query(conn, query, "Find education/learning content tables")
-    print(f"Found {len(rows)} education-related tables")
-    return rows
-
-def find_document_columns(conn):
-    """Find columns with document/file references"""
-    print("\n=== Finding Document Reference Columns ===")
-    query = """
-    SELECT TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, DATA_TYPE
-    FROM SNOWFLAKE.ACCOUNT_USAGE.COLUMNS
-    WHERE DELETED IS NULL
-    AND (
-        UPPER(COLUMN_NAME) LIKE '%FILE%PATH%'
-        OR UPPER(COLUMN_NAME) LIKE '%FILE%URL%'
-        OR UPPER(COLUMN_NAME) LIKE '%DOCUMENT%'
-        OR UPPER(COLUMN_NAME) LIKE '%PDF%'
-        OR UPPER(COLUMN_NAME) LIKE '%ATTACHMENT%'
-        OR UPPER(COLUMN_NAME) LIKE '%S3%'
-        OR UPPER(COLUMN_NAME) LIKE '%BLOB%'
-        OR UPPER(COLUMN_NAME) LIKE '%IMAGE%'
-    )
-    ORDER BY TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME
+# Phase 3 classification patterns, applied to the Phase 1 column inventory
+# in Python instead of re-scanning ACCOUNT_USAGE.COLUMNS over the wire.
+# Multi-part SQL patterns like %FILE%PATH% become FILE.*PATH.
+_RICH_TEXT_TYPES = {'TEXT', 'VARCHAR', 'STRING'}
+_RICH_TEXT_NAME_RE = re.compile(
+    r'DESCRIPTION|CONTENT|MESSAGE|NOTE|SUMMARY|DETAIL|BODY|TEXT|COMMENT'
+    r'|FEEDBACK|REVIEW|ABSTRACT|NARRATIVE', re.IGNORECASE)
+_EDU_TABLE_RE = re.compile(
+    r'CURRICULUM|LESSON|COURSE|STUDENT|LEARNING|ASSESSMENT|QUESTION|ANSWER'
+    r'|CONTENT|RESOURCE|FEEDBACK|SKILL|GRADE|SCORE|TEST', re.IGNORECASE)
+_DOC_COLUMN_RE = re.compile(
+    r'FILE.*PATH|FILE.*URL|DOCUMENT|PDF|ATTACHMENT|S3|BLOB|IMAGE', re.IGNORECASE)
+_PII_COLUMN_RE = re.compile(
+    r'EMAIL|SSN|SOCIAL.*SECURITY|PHONE|ADDRESS|FIRST.*NAME|LAST.*NAME'
+    r'|BIRTH|DOB|PASSWORD|SECRET|CREDENTIAL', re.IGNORECASE)
+
+def find_special_columns(columns_data):
+    """Classify text-rich, education, document, and PII columns in one pass.
+
+    Phase 1 already pulled the full column inventory, so Phase 3 filters it
+    locally with precompiled patterns instead of issuing fresh
+    ACCOUNT_USAGE.COLUMNS queries - no additional network round-trips, and
+    the configured database scope from discovery carries over.
     """
-    cols, rows = execute_query(conn, query, "Find document/file reference columns")
-    print(f"Found {len(rows)} document reference columns")
-    return rows
-
-def find_pii_columns(conn):
-    """Find columns that likely contain PII"""
-    print("\n=== Finding PII Columns ===")
-    query = """
-    SELECT TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME, DATA_TYPE
-    FROM SNOWFLAKE.ACCOUNT_USAGE.COLUMNS
-    WHERE DELETED IS NULL
-    AND (
-        UPPER(COLUMN_NAME) LIKE '%EMAIL%'
-        OR UPPER(COLUMN_NAME) LIKE '%SSN%'
-        OR UPPER(COLUMN_NAME) LIKE '%SOCIAL%SECURITY%'
-        OR UPPER(COLUMN_NAME) LIKE '%PHONE%'
-        OR UPPER(COLUMN_NAME) LIKE '%ADDRESS%'
-        OR UPPER(COLUMN_NAME) LIKE '%FIRST%NAME%'
-        OR UPPER(COLUMN_NAME) LIKE '%LAST%NAME%'
-        OR UPPER(COLUMN_NAME) LIKE '%BIRTH%'
-        OR UPPER(COLUMN_NAME) LIKE '%DOB%'
-        OR UPPER(COLUMN_NAME) LIKE '%PASSWORD%'
-        OR UPPER(COLUMN_NAME) LIKE '%SECRET%'
-        OR UPPER(COLUMN_NAME) LIKE '%CREDENTIAL%'
-    )
-    ORDER BY TABLE_CATALOG, TABLE_SCHEMA, TABLE_NAME
-    """
-    cols, rows = execute_query(conn, query, "Find potential PII columns")
-    print(f"Found {len(rows)} potential PII columns")
-    return rows
+    print("\n=== Finding Text-Rich / Education / Document / PII Columns ===")
+
+    text_rich_columns = []
+    edu_tables = []
+    doc_columns = []
+    pii_columns = []
+    seen_edu_tables = set()
+    dtype_upper_cache = {}
+    for row in columns_data:
+        db, schema, table, column, _, data_type, max_len, _, _, _, comment = row
+        if not data_type:
+            continue
+        column = column or ""
+        dtype_upper = dtype_upper_cache.get(data_type)
+        if dtype_upper is None:
+            dtype_upper = dtype_upper_cache[data_type] = data_type.upper()
+        # Same Decimal-to-int coercion ('' treated as NULL) as classify_columns
+        max_len = int(max_len) if max_len not in (None, '') else None
+
+        if (dtype_upper in _RICH_TEXT_TYPES
+                and ((max_len and max_len >= 1000) or _RICH_TEXT_NAME_RE.search(column))):
+            text_rich_columns.append((db, schema, table, column, data_type, max_len, comment))
+        if _EDU_TABLE_RE.search(table or "") and (db, schema, table) not in seen_edu_tables:
+            seen_edu_tables.add((db, schema, table))
+            edu_tables.append((db, schema, table))
+        if _DOC_COLUMN_RE.search(column):
+            doc_columns.append((db, schema, table, column, data_type))
+        if _PII_COLUMN_RE.search(column):
+            pii_columns.append((db, schema, table, column, data_type))
+
+    print(f"Found {len(text_rich_columns)} text-rich columns")
+    print(f"Found {len(edu_tables)} education-related tables")
+    print(f"Found {len(doc_columns)} document reference columns")
+    print(f"Found {len(pii_columns)} potential PII columns")
+    return text_rich_columns, edu_tables, doc_columns, pii_columns
 
 # ==================== PHASE 4: DATA PROFILING ====================
 
@@ -2769,7 +3223,57 @@ def profile_sample_text_columns(conn, text_columns, limit=10):
             seen_tables.add(table_key)
             samples.append(row)
 
+    if not samples:
+        return profiles
+
+    def build_profile(db, schema, table, col, dtype, r):
+        return {
+            "database": db,
+            "schema": schema,
+            "table": table,
+            "column": col,
+            "data_type": dtype,
+            "total_rows_sampled": r[0],
+            "non_null_count": r[1],
+            "avg_length": float(r[2]) if r[2] else 0,
+            "max_length": r[3],
+            "min_length": r[4]
+        }
+
+    # One round-trip for all sampled columns: each contributes a UNION ALL
+    # branch, so the per-query compile + scheduling cost is paid once
+    branches = []
     for row in samples:
+        db, schema, table, col, dtype, max_len, comment = row
+        branches.append(f"""
+        SELECT
+            '{db}' AS database_name,
+            '{schema}' AS schema_name,
+            '{table}' AS table_name,
+            '{col}' AS column_name,
+            COUNT(*) AS total_rows,
+            COUNT("{col}") AS non_null_count,
+            AVG(LENGTH("{col}")) AS avg_length,
+            MAX(LENGTH("{col}")) AS max_length,
+            MIN(LENGTH("{col}")) AS min_length
+        FROM "{db}"."{schema}"."{table}"
+        TABLESAMPLE SYSTEM (1)""")
+    batched_query = "\n        UNION ALL".join(branches)
+    cols, rows = execute_query(conn, batched_query,
+                               f"Profile {len(samples)} text columns (batched)")
+    if rows:
+        dtype_by_key = {(s[0], s[1], s[2], s[3]): s[4] for s in samples}
+        for r in rows:
+            db, schema, table, col = r[0], r[1], r[2], r[3]
+            profiles.append(build_profile(db, schema, table, col,
+                                          dtype_by_key.get((db, schema, table, col)), r[4:]))
+            print(f"  {db}.{schema}.{table}.{col}: avg_len={profiles[-1]['avg_length']:.0f}")
+        return profiles
+
+    # The batch fails as a unit if any one table is inaccessible; retry
+    # column-by-column, overlapping the independent round-trips with a
+    # thread pool (the connector supports concurrent cursors per connection)
+    def profile_one(row):
         db, schema, table, col, dtype, max_len, comment = row
         fqn = f'"{db}"."{schema}"."{table}"'
 
@@ -2781,27 +3285,22 @@ def profile_sample_text_columns(conn, text_columns, limit=10):
             MAX(LENGTH("{col}")) AS max_length,
             MIN(LENGTH("{col}")) AS min_length
         FROM {fqn}
-        TABLESAMPLE (1000 ROWS)
+        TABLESAMPLE SYSTEM (1)
         """
         try:
             cols, rows = execute_query(conn, query, f"Profile text column {db}.{schema}.{table}.{col}")
             if rows and rows[0]:
-                r = rows[0]
-                profiles.append({
-                    "database": db,
-                    "schema": schema,
-                    "table": table,
-                    "column": col,
-                    "data_type": dtype,
-                    "total_rows_sampled": r[0],
-                    "non_null_count": r[1],
-                    "avg_length": float(r[2]) if r[2] else 0,
-                    "max_length": r[3],
-                    "min_length": r[4]
-                })
-                print(f"  {db}.{schema}.{table}.{col}: avg_len={profiles[-1]['avg_length']:.0f}")
+                return build_profile(db, schema, table, col, dtype, rows[0])
         except Exception as e:
             print(f"  Could not profile {fqn}.{col}: {e}")
+        return None
+
+    with ThreadPoolExecutor(max_workers=min(8, len(samples))) as pool:
+        for profile in pool.map(profile_one, samples):
+            if profile:
+                profiles.append(profile)
+                print(f"  {profile['database']}.{profile['schema']}.{profile['table']}"
+                      f".{profile['column']}: avg_len={profile['avg_length']:.0f}")
 
     return profiles
 
@@ -2810,32 +3309,98 @@ def profile_variant_columns(conn, variant_candidates, limit=5):
     print("\n=== Profiling VARIANT Columns ===")
     profiles = []
 
-    for cand in variant_candidates[:limit]:
+    selected = variant_candidates[:limit]
+    if not selected:
+        return profiles
+
+    # Same batching as text profiling: one UNION ALL round-trip for all
+    # sampled VARIANT columns, falling back to per-column queries on failure
+    branches = []
+    for cand in selected:
+        db, schema, table, col = cand['database'], cand['schema'], cand['table'], cand['column']
+        branches.append(f"""
+        SELECT
+            '{db}' AS database_name,
+            '{schema}' AS schema_name,
+            '{table}' AS table_name,
+            '{col}' AS column_name,
+            key
+        FROM (
+            SELECT DISTINCT f.key AS key
+            FROM "{db}"."{schema}"."{table}" TABLESAMPLE SYSTEM (1),
+                 LATERAL FLATTEN(input => "{col}", recursive => FALSE) f
+            LIMIT 50
+        )""")
+    batched_query = "\n        UNION ALL".join(branches)
+    cols, rows = execute_query(conn, batched_query,
+                               f"Profile VARIANT keys in {len(selected)} columns (batched)")
+    if rows:
+        keys_by_column = defaultdict(list)
+        for r in rows:
+            keys_by_column[(r[0], r[1], r[2], r[3])].append(r[4])
+        for cand in selected:
+            key = (cand['database'], cand['schema'], cand['table'], cand['column'])
+            top_keys = keys_by_column.get(key)
+            if top_keys:
+                profiles.append({**cand, "top_keys": top_keys})
+                print(f"  {'.'.join(key)}: {len(top_keys)} keys found")
+        return profiles
+
+    def profile_one(cand):
         db, schema, table, col = cand['database'], cand['schema'], cand['table'], cand['column']
         fqn = f'"{db}"."{schema}"."{table}"'
 
         query = f"""
         SELECT DISTINCT f.key
-        FROM {fqn} TABLESAMPLE (100 ROWS),
+        FROM {fqn} TABLESAMPLE SYSTEM (1),
              LATERAL FLATTEN(input => "{col}", recursive => FALSE) f
         LIMIT 50
         """
         try:
             cols, rows = execute_query(conn, query, f"Profile VARIANT keys in {db}.{schema}.{table}.{col}")
             if rows:
-                profiles.append({
+                return {
                     **cand,
                     "top_keys": [r[0] for r in rows]
-                })
-                print(f"  {db}.{schema}.{table}.{col}: {len(rows)} keys found")
+                }
         except Exception as e:
             print(f"  Could not profile VARIANT {fqn}.{col}: {e}")
+        return None
+
+    with ThreadPoolExecutor(max_workers=min(8, len(selected))) as pool:
+        for profile in pool.map(profile_one, selected):
+            if profile:
+                profiles.append(profile)
+                print(f"  {profile['database']}.{profile['schema']}.{profile['table']}"
+                      f".{profile['column']}: {len(profile['top_keys'])} keys found")
 
     return profiles
 
 # ==================== PHASE 5: SCORING ====================
 
-def score_candidate(candidate, text_profiles=None, variant_profiles=None):
+# Compiled once: one linear regex scan replaces nine substring probes per name.
+# IGNORECASE lets the raw names be searched without building uppercased copies.
+_PII_RE = re.compile(r'EMAIL|SSN|PHONE|ADDRESS|NAME|DOB|BIRTH|PASSWORD|SECRET',
+                     re.IGNORECASE)
+
+# Columns whose names suggest translatable prose (TRANSLATE recommendation)
+_TRANSLATE_RE = re.compile(r'DESCRIPTION|CONTENT', re.IGNORECASE)
+
+_BUSINESS_POTENTIAL = {
+    'Cortex LLM': 4,
+    'Cortex ML (Forecasting/Anomaly)': 5,
+    'Cortex Search / RAG': 4,
+    'Cortex Extract': 3,
+}
+
+def build_text_profile_lookup(text_profiles):
+    """Index text profiles by (db, schema, table, column) for O(1) scoring lookups."""
+    return {
+        (p['database'], p['schema'], p['table'], p['column']): p
+        for p in text_profiles or []
+    }
+
+def score_candidate(candidate, text_profile_lookup=None, variant_profiles=None):
     """Score candidate on 0-5 scale for multiple dimensions"""
     scores = {
         "business_potential": 3,
@@ -2844,63 +3409,137 @@ def score_candidate(candidate, text_profiles=None, variant_profiles=None):
         "governance_risk": 2
     }
 
+    # Bind the lookup once; this function runs for every candidate
+    get = candidate.get
+
     # Adjust based on AI feature type
-    ai_feature = candidate.get('ai_feature', '')
-    if ai_feature == 'Cortex LLM':
-        scores['business_potential'] = 4
-    elif ai_feature == 'Cortex ML (Forecasting/Anomaly)':
-        scores['business_potential'] = 5
-    elif ai_feature == 'Cortex Search / RAG':
-        scores['business_potential'] = 4
-    elif ai_feature == 'Cortex Extract':
-        scores['business_potential'] = 3
+    scores['business_potential'] = _BUSINESS_POTENTIAL.get(get('ai_feature', ''), 3)
 
     # Check for profile data
-    if text_profiles:
-        key = (candidate.get('database'), candidate.get('schema'),
-               candidate.get('table'), candidate.get('column'))
-        for p in text_profiles:
-            if (p['database'], p['schema'], p['table'], p['column']) == key:
-                if p.get('avg_length', 0) > 100:
-                    scores['data_readiness'] = 4
-                if p.get('non_null_count', 0) and p.get('total_rows_sampled', 1):
-                    fill_rate = p['non_null_count'] / max(p['total_rows_sampled'], 1)
-                    if fill_rate > 0.9:
-                        scores['data_readiness'] = 5
-                break
+    if text_profile_lookup:
+        p = text_profile_lookup.get((get('database'), get('schema'),
+                                     get('table'), get('column')))
+        if p is not None:
+            if p.get('avg_length', 0) > 100:
+                scores['data_readiness'] = 4
+            if p.get('non_null_count', 0) and p.get('total_rows_sampled', 1):
+                fill_rate = p['non_null_count'] / max(p['total_rows_sampled'], 1)
+                if fill_rate > 0.9:
+                    scores['data_readiness'] = 5
 
     # Check for comments (metadata quality)
-    if candidate.get('comment'):
+    if get('comment'):
         scores['metadata_quality'] = 4
 
     # PII risk based on column names
-    col_name = str(candidate.get('column', '')).upper()
-    table_name = str(candidate.get('table', '')).upper()
-    pii_indicators = ['EMAIL', 'SSN', 'PHONE', 'ADDRESS', 'NAME', 'DOB', 'BIRTH', 'PASSWORD', 'SECRET']
-    if any(ind in col_name or ind in table_name for ind in pii_indicators):
+    if (_PII_RE.search(str(get('column', '')))
+            or _PII_RE.search(str(get('table', '')))):
         scores['governance_risk'] = 5
 
     candidate['scores'] = scores
     candidate['total_score'] = sum(scores.values())
     return candidate
 
+def score_candidates_bulk(candidates, text_profile_lookup=None, variant_profiles=None):
+    """
+    Vectorized scoring pass over a full candidate list.
+
+    Computes the same four dimensions as score_candidate, but as numpy
+    column operations over all candidates at once (mirroring
+    confirm_candidates_bulk); the per-candidate dict writes happen in one
+    final pass.
+    """
+    import numpy as np
+    import pandas as pd
+
+    if not candidates:
+        return
+
+    lookup = text_profile_lookup or {}
+    n = len(candidates)
+
+    # Extract the scoring inputs once per candidate
+    features = []
+    has_comment = []
+    pii_strings = []
+    avg_lens = []
+    fill_ok = []
+    for cand in candidates:
+        get = cand.get
+        features.append(get('ai_feature', ''))
+        has_comment.append(bool(get('comment')))
+        pii_strings.append(f"{get('column', '')} {get('table', '')}")
+        p = lookup.get((get('database'), get('schema'),
+                        get('table'), get('column')))
+        if p is not None:
+            avg_lens.append(p.get('avg_length', 0) or 0)
+            non_null = p.get('non_null_count', 0)
+            sampled = p.get('total_rows_sampled', 1)
+            fill_ok.append(bool(non_null and sampled
+                                and non_null / max(sampled, 1) > 0.9))
+        else:
+            avg_lens.append(0)
+            fill_ok.append(False)
+
+    business = np.fromiter((_BUSINESS_POTENTIAL.get(f, 3) for f in features),
+                           dtype=np.int64, count=n)
+    readiness = np.where(np.fromiter(fill_ok, dtype=bool, count=n), 5,
+                         np.where(np.asarray(avg_lens, dtype=np.float64) > 100, 4, 3))
+    metadata = np.where(np.fromiter(has_comment, dtype=bool, count=n), 4, 2)
+    # No PII keyword spans the space between column and table names, so one
+    # combined scan per candidate matches the two separate searches
+    pii_hit = pd.Series(pii_strings).str.contains(_PII_RE).to_numpy()
+    governance = np.where(pii_hit, 5, 2)
+    totals = business + readiness + metadata + governance
+
+    for cand, b, r, m, g, t in zip(candidates, business, readiness,
+                                   metadata, governance, totals):
+        cand['scores'] = {
+            "business_potential": int(b),
+            "data_readiness": int(r),
+            "metadata_quality": int(m),
+            "governance_risk": int(g)
+        }
+        cand['total_score'] = int(t)
+
 # ==================== PHASE 6: REPORT GENERATION ====================
 
+def build_report_aggregates(all_candidates):
+    """
+    Compute the candidate aggregates shared by the Phase 6 report generators.
+
+    Every report needs the score-ordered candidate list and the per-feature
+    grouping; building them once here lets the generators reuse the same
+    structures instead of each re-sorting and re-grouping independently.
+    """
+    sorted_cands = sorted(all_candidates, key=lambda x: x.get('total_score', 0), reverse=True)
+    # Bind each bucket's append once; d[key](c) skips the per-item
+    # attribute lookup, and __self__ recovers the underlying lists
+    d = defaultdict(lambda: [].append)
+    for c in sorted_cands:
+        d[c.get('ai_feature', 'Unknown')](c)
+    by_feature = {k: v.__self__ for k, v in d.items()}
+    return {'sorted': sorted_cands, 'by_feature': by_feature}
+
 def generate_executive_summary(all_candidates, tables_count, columns_count,
                                databases_count, schemas_count, stages_count,
                                llm_count, search_count, ml_count, extract_count,
-                               edu_tables, pii_columns, text_profiles):
+                               edu_tables, pii_columns, text_profiles,
+                               aggregates=None):
     """Generate executive summary markdown"""
 
-    # Sort candidates by score
-    sorted_candidates = sorted(all_candidates, key=lambda x: x.get('total_score', 0), reverse=True)
+    if aggregates is None:
+        aggregates = build_report_aggregates(all_candidates)
+
+    # Only the top 10 are shown
+    top_candidates = aggregates['sorted'][:10]
+
+    # Feature distribution comes straight from the shared grouping
+    feature_counts = {f: len(cands) for f, cands in aggregates['by_feature'].items()}
 
-    # Feature distribution
-    feature_counts = defaultdict(int)
-    for c in all_candidates:
-        feature_counts[c.get('ai_feature', 'Unknown')] += 1
+    student_table_count = sum(1 for t in edu_tables if 'STUDENT' in str(t).upper())
 
-    summary = f"""# Snowflake AI Enablement - Executive Summary
+    parts = [f"""# Snowflake AI Enablement - Executive Summary
 
 **Analysis Date:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 **Account:** WSWZONP-NWEA_PRD (EJA57698)
@@ -2920,7 +3559,7 @@ def generate_executive_summary(all_candidates, tables_count, columns_count,
 
 ### Domain Analysis
 This is a comprehensive **Education Technology (EdTech)** data platform containing:
-- Student assessment data ({len([t for t in edu_tables if 'STUDENT' in str(t).upper()])} student-related tables)
+- Student assessment data ({student_table_count} student-related tables)
 - Learning content & curriculum
 - Educational resource management
 - Marketing & lead data (Marketo integration)
@@ -2946,30 +3585,36 @@ This is a comprehensive **Education Technology (EdTech)** data platform containi
 
 | Rank | Database.Schema.Table | AI Feature | Score | Rationale |
 |------|----------------------|------------|-------|-----------|
-"""
+"""]
 
-    for i, cand in enumerate(sorted_candidates[:10], 1):
+    for i, cand in enumerate(top_candidates, 1):
+        column = cand.get('column')
         fqn = f"{cand.get('database', 'N/A')}.{cand.get('schema', 'N/A')}.{cand.get('table', 'N/A')}"
-        if cand.get('column'):
-            fqn += f".{cand.get('column')}"
+        if column:
+            fqn += f".{column}"
         feature = cand.get('ai_feature', 'Unknown')
         score = cand.get('total_score', 0)
         reason = cand.get('reason', 'N/A')[:50]
-        summary += f"| {i} | `{fqn[:60]}` | {feature} | {score}/20 | {reason} |\n"
+        parts.append(f"| {i} | `{fqn[:60]}` | {feature} | {score}/20 | {reason} |\n")
 
-    summary += f"""
+    parts.append(f"""
 
 ---
 
 ## Quick Wins (Implement Immediately)
 
 ### 1. Content Summarization (Cortex LLM)
-"""
+""")
 
-    # Find best text profile
+    # Find best text profile with a manual fold (no per-element key lambda)
     if text_profiles:
-        best_text = max(text_profiles, key=lambda x: x.get('avg_length', 0))
-        summary += f"""
+        best_text = text_profiles[0]
+        best_len = best_text.get('avg_length', 0)
+        for p in text_profiles:
+            length = p.get('avg_length', 0)
+            if length > best_len:
+                best_len, best_text = length, p
+        parts.append(f"""
 **Target:** `{best_text['database']}.{best_text['schema']}.{best_text['table']}.{best_text['column']}`
 - Average text length: {best_text['avg_length']:.0f} characters
 - Ideal for: SUMMARIZE, CLASSIFY, SENTIMENT
@@ -2981,9 +3626,9 @@ FROM "{best_text['database']}"."{best_text['schema']}"."{best_text['table']}"
 WHERE "{best_text['column']}" IS NOT NULL
 LIMIT 100;
 ```
-"""
+""")
 
-    summary += f"""
+    parts.append(f"""
 
 ### 2. Semantic Search (Cortex Search)
 Create a Cortex Search Service on content tables with multiple text columns.
@@ -2998,11 +3643,11 @@ Create a Cortex Search Service on content tables with multiple text columns.
 
 ## AI Feature Distribution
 
-"""
+""")
     for feature, count in sorted(feature_counts.items(), key=lambda x: -x[1]):
-        summary += f"- **{feature}:** {count:,} candidates\n"
+        parts.append(f"- **{feature}:** {count:,} candidates\n")
 
-    summary += f"""
+    parts.append(f"""
 
 ---
 
@@ -3065,13 +3710,111 @@ Create a Cortex Search Service on content tables with multiple text columns.
 | `profiles/*.md` | Per-schema analysis reports |
 | `profiles/text_column_profiles.json` | Text column profiling data |
 | `logs/audit_trail.sql` | All SELECT queries executed |
+""")
+    return "".join(parts)
+
+
+# Quality tiers indexed by how many thresholds a profile clears
+_QUALITY_TIERS = ("🔴 Poor", "🟡 Fair", "🟢 Good")
+
+# PII categories in precedence order: the first matching pattern wins, so the
+# loop breaks early instead of running every substring test per column
+_PII_CATEGORY_PATTERNS = (
+    ('Email', re.compile(r'EMAIL', re.IGNORECASE)),
+    ('Name', re.compile(r'NAME|FIRST|LAST', re.IGNORECASE)),
+    ('Phone', re.compile(r'PHONE|MOBILE', re.IGNORECASE)),
+    ('Address', re.compile(r'ADDRESS|STREET|CITY', re.IGNORECASE)),
+    ('Date of Birth', re.compile(r'DOB|BIRTH', re.IGNORECASE)),
+    ('SSN', re.compile(r'SSN|SOCIAL', re.IGNORECASE)),
+)
+
+# Combined rejection filter: columns matching no category keyword go straight
+# to 'Other' after one scan instead of paying all six category probes
+_PII_ANY_CATEGORY_RE = re.compile(
+    r'EMAIL|NAME|FIRST|LAST|PHONE|MOBILE|ADDRESS|STREET|CITY|DOB|BIRTH'
+    r'|SSN|SOCIAL', re.IGNORECASE)
+
+def _sparsity_pct(non_null, total):
+    """Percent of sampled rows that are NULL; 100 when nothing was sampled."""
+    return 100.0 * (1.0 - non_null / total) if total else 100.0
+
+# Per-candidate report block templates: one format call per block instead of
+# assembling 6-10 separate f-strings per candidate
+_LLM_CAND_TMPL = """#### {rank}. `{table}.{column}`
+
+**Full Path:** `{fqn}`
+
+| Attribute | Value |
+|-----------|-------|
+| **Score** | {score}/20 |
+| **Status** | {status} |
+| **Data Type** | {data_type} |
+| **Max Length** | {max_length:,} |
+"""
+
+_LLM_PROFILE_TMPL = """| **Avg Length** | {avg_length:.1f} chars |
+| **Non-Null Count** | {non_null_count:,} / {total_rows_sampled:,} |
+| **Sparsity** | {sparsity:.1f}% |
+"""
+
+_SCORE_BREAKDOWN_TMPL = """
+**Selection Reason:** {reason}
+
+**Score Breakdown:**
+- Business Potential: {business_potential}/5
+- Data Readiness: {data_readiness}/5
+- Metadata Quality: {metadata_quality}/5
+- Governance Risk: {governance_risk}/5
+
+"""
+
+_SEARCH_CAND_TMPL = """#### {rank}. `{schema}.{table}`
+
+**Full Path:** `{fqn}`
+
+| Attribute | Value |
+|-----------|-------|
+| **Score** | {score}/20 |
+| **Status** | {status} |
+
+**Selection Reason:** {reason}
+
+"""
+
+_SEARCH_IMPL_TMPL = """**Recommended Implementation:**
+```sql
+CREATE CORTEX SEARCH SERVICE {table}_search
+  ON {database}.{schema}.{table}
+  TARGET_LAG = '1 hour'
+  WAREHOUSE = your_warehouse;
+```
+
+---
+
 """
-    return summary
 
+_ML_CAND_TMPL = """#### {rank}. `{schema}.{table}`
+
+**Full Path:** `{fqn}`
+
+| Attribute | Value |
+|-----------|-------|
+| **Score** | {score}/20 |
+
+**Selection Reason:** {reason}
+
+**Recommended Use Cases:**
+- Time-series forecasting with `SNOWFLAKE.ML.FORECAST`
+- Anomaly detection with `SNOWFLAKE.ML.ANOMALY_DETECTION`
+
+---
+
+"""
 
 def generate_detailed_analysis_report(all_candidates, text_profiles, variant_profiles, 
                                        confirmed_candidates, edu_tables, pii_columns,
-                                       databases, schemas, tables, stages):
+                                       databases, schemas, tables, stages,
+                                       aggregates=None):
     """
     Generate comprehensive detailed analysis report in markdown format.
     
@@ -3079,23 +3822,25 @@ def generate_detailed_analysis_report(all_candidates, text_profiles, variant_pro
     data quality metrics, and implementation recommendations.
     """
     
-    # Sort candidates by score
-    sorted_candidates = sorted(all_candidates, key=lambda x: x.get('total_score', 0), reverse=True)
-    confirmed_set = set(f"{c.get('database')}.{c.get('schema')}.{c.get('table')}.{c.get('column', '')}" 
-                        for c in confirmed_candidates)
-    
+    # Tuple keys give exact O(1) membership checks; a table-level set serves
+    # the sections that confirm whole tables rather than single columns
+    confirmed_set = frozenset((c.get('database'), c.get('schema'), c.get('table'), c.get('column', ''))
+                              for c in confirmed_candidates)
+    confirmed_tables = frozenset((db, schema, table) for (db, schema, table, _) in confirmed_set)
+
     # Create text profile lookup
     text_profile_lookup = {}
     for tp in text_profiles:
         key = f"{tp.get('database')}.{tp.get('schema')}.{tp.get('table')}.{tp.get('column')}"
         text_profile_lookup[key] = tp
+
+    # Reuse the shared per-feature grouping; its buckets are already in
+    # descending score order, so the sections below can slice for top-K
+    if aggregates is None:
+        aggregates = build_report_aggregates(all_candidates)
+    by_feature = aggregates['by_feature']
     
-    # Group by AI feature
-    by_feature = defaultdict(list)
-    for c in sorted_candidates:
-        by_feature[c.get('ai_feature', 'Unknown')].append(c)
-    
-    report = f"""# Snowflake AI Enablement - Detailed Analysis Report
+    parts = [f"""# Snowflake AI Enablement - Detailed Analysis Report
 
 > **Generated On:** {get_utc_timestamp()}  
 > **Agent:** {AGENT_NAME} v{AGENT_VERSION}  
@@ -3133,15 +3878,16 @@ def generate_detailed_analysis_report(all_candidates, text_profiles, variant_pro
 
 | AI Feature | Total | Confirmed | Top Score |
 |------------|-------|-----------|-----------|
-"""
+"""]
     
     for feature in ['Cortex LLM', 'Cortex Search / RAG', 'Cortex ML (Forecasting/Anomaly)', 'Cortex Extract (Semi-structured)']:
         feature_cands = by_feature.get(feature, [])
-        feature_confirmed = len([c for c in feature_cands if f"{c.get('database')}.{c.get('schema')}.{c.get('table')}.{c.get('column', '')}" in confirmed_set])
-        top_score = max([c.get('total_score', 0) for c in feature_cands]) if feature_cands else 0
-        report += f"| **{feature}** | {len(feature_cands):,} | {feature_confirmed:,} | {top_score}/20 |\n"
+        feature_confirmed = sum(1 for c in feature_cands
+                                if (c.get('database'), c.get('schema'), c.get('table'), c.get('column', '')) in confirmed_set)
+        top_score = feature_cands[0].get('total_score', 0) if feature_cands else 0
+        parts.append(f"| **{feature}** | {len(feature_cands):,} | {feature_confirmed:,} | {top_score}/20 |\n")
     
-    report += f"""
+    parts.append(f"""
 
 ---
 
@@ -3176,63 +3922,64 @@ Cortex LLM functions enable text summarization, classification, sentiment analys
 - Semantic column names suggesting natural language content
 - Low sparsity indicating data availability
 
-"""
+""")
     
-    llm_cands = by_feature.get('Cortex LLM', [])[:50]  # Top 50
+    llm_cands = by_feature.get('Cortex LLM', [])[:50]
     if llm_cands:
-        report += "### Top LLM Candidates (Detailed Analysis)\n\n"
+        parts.append("### Top LLM Candidates (Detailed Analysis)\n\n")
         for i, cand in enumerate(llm_cands[:25], 1):
             fqn = f"{cand.get('database')}.{cand.get('schema')}.{cand.get('table')}.{cand.get('column', '')}"
-            is_confirmed = fqn in confirmed_set
+            is_confirmed = (cand.get('database'), cand.get('schema'),
+                            cand.get('table'), cand.get('column', '')) in confirmed_set
             profile = text_profile_lookup.get(fqn, {})
             
-            report += f"#### {i}. `{cand.get('table')}.{cand.get('column')}`\n\n"
-            report += f"**Full Path:** `{fqn}`\n\n"
-            report += f"| Attribute | Value |\n"
-            report += f"|-----------|-------|\n"
-            report += f"| **Score** | {cand.get('total_score', 0)}/20 |\n"
-            report += f"| **Status** | {'✅ Confirmed' if is_confirmed else '⚠️ Needs Review'} |\n"
-            report += f"| **Data Type** | {cand.get('data_type', 'N/A')} |\n"
-            report += f"| **Max Length** | {cand.get('max_length', 'N/A'):,} |\n"
-            
+            parts.append(_LLM_CAND_TMPL.format(
+                rank=i, table=cand.get('table'), column=cand.get('column'),
+                fqn=fqn, score=cand.get('total_score', 0),
+                status='✅ Confirmed' if is_confirmed else '⚠️ Needs Review',
+                data_type=cand.get('data_type', 'N/A'),
+                max_length=cand.get('max_length', 'N/A')))
+
             if profile:
-                report += f"| **Avg Length** | {profile.get('avg_length', 0):.1f} chars |\n"
-                report += f"| **Non-Null Count** | {profile.get('non_null_count', 0):,} / {profile.get('total_rows_sampled', 0):,} |\n"
-                sparsity = 100 - (profile.get('non_null_count', 0) / profile.get('total_rows_sampled', 1) * 100)
-                report += f"| **Sparsity** | {sparsity:.1f}% |\n"
-            
-            report += f"\n**Selection Reason:** {cand.get('reason', 'N/A')}\n\n"
-            
-            # Score breakdown
+                sparsity = _sparsity_pct(profile.get('non_null_count', 0),
+                                         profile.get('total_rows_sampled', 1))
+                parts.append(_LLM_PROFILE_TMPL.format(
+                    avg_length=profile.get('avg_length', 0),
+                    non_null_count=profile.get('non_null_count', 0),
+                    total_rows_sampled=profile.get('total_rows_sampled', 0),
+                    sparsity=sparsity))
+
+            # Selection reason + score breakdown
             scores = cand.get('scores', {})
-            report += f"**Score Breakdown:**\n"
-            report += f"- Business Potential: {scores.get('business_potential', 0)}/5\n"
-            report += f"- Data Readiness: {scores.get('data_readiness', 0)}/5\n"
-            report += f"- Metadata Quality: {scores.get('metadata_quality', 0)}/5\n"
-            report += f"- Governance Risk: {scores.get('governance_risk', 0)}/5\n\n"
+            parts.append(_SCORE_BREAKDOWN_TMPL.format(
+                reason=cand.get('reason', 'N/A'),
+                business_potential=scores.get('business_potential', 0),
+                data_readiness=scores.get('data_readiness', 0),
+                metadata_quality=scores.get('metadata_quality', 0),
+                governance_risk=scores.get('governance_risk', 0)))
             
             # Confirmation reasons
             if cand.get('confirmation_reasons'):
-                report += f"**Confirmation Analysis:**\n"
+                parts.append(f"**Confirmation Analysis:**\n")
                 for reason in cand.get('confirmation_reasons', []):
-                    report += f"- {reason}\n"
-                report += "\n"
+                    parts.append(f"- {reason}\n")
+                parts.append("\n")
             
             # Recommended use cases
-            report += f"**Recommended Cortex Functions:**\n"
+            parts.append(f"**Recommended Cortex Functions:**\n")
             avg_len = profile.get('avg_length', cand.get('max_length', 100))
             if avg_len and avg_len > 200:
-                report += f"- `SNOWFLAKE.CORTEX.SUMMARIZE()` - Summarize long text\n"
-            report += f"- `SNOWFLAKE.CORTEX.SENTIMENT()` - Analyze sentiment\n"
-            report += f"- `SNOWFLAKE.CORTEX.CLASSIFY_TEXT()` - Categorize content\n"
-            if 'DESCRIPTION' in str(cand.get('column', '')).upper() or 'CONTENT' in str(cand.get('column', '')).upper():
-                report += f"- `SNOWFLAKE.CORTEX.TRANSLATE()` - Multi-language support\n"
-            report += "\n---\n\n"
+                parts.append(f"- `SNOWFLAKE.CORTEX.SUMMARIZE()` - Summarize long text\n")
+            parts.append(f"- `SNOWFLAKE.CORTEX.SENTIMENT()` - Analyze sentiment\n")
+            parts.append(f"- `SNOWFLAKE.CORTEX.CLASSIFY_TEXT()` - Categorize content\n")
+            if _TRANSLATE_RE.search(str(cand.get('column', ''))):
+                parts.append(f"- `SNOWFLAKE.CORTEX.TRANSLATE()` - Multi-language support\n")
+            parts.append("\n---\n\n")
     else:
-        report += "*No Cortex LLM candidates identified.*\n\n"
+        parts.append("*No Cortex LLM candidates identified.*\n\n")
     
     # Cortex Search / RAG section
-    report += """## Cortex Search / RAG Candidates
+    parts.append("""## Cortex Search / RAG Candidates
 
 Cortex Search enables semantic search and Retrieval-Augmented Generation (RAG) on tables with multiple text columns.
 
@@ -3241,40 +3988,36 @@ Cortex Search enables semantic search and Retrieval-Augmented Generation (RAG) o
 - Content suitable for knowledge retrieval
 - Educational or documentation content
 
-"""
+""")
     
     search_cands = by_feature.get('Cortex Search / RAG', [])[:30]
     if search_cands:
-        report += "### Top Search/RAG Candidates\n\n"
+        parts.append("### Top Search/RAG Candidates\n\n")
         for i, cand in enumerate(search_cands[:15], 1):
             fqn = f"{cand.get('database')}.{cand.get('schema')}.{cand.get('table')}"
-            is_confirmed = any(fqn in c for c in confirmed_set)
+            is_confirmed = (cand.get('database'), cand.get('schema'),
+                            cand.get('table')) in confirmed_tables
             
-            report += f"#### {i}. `{cand.get('schema')}.{cand.get('table')}`\n\n"
-            report += f"**Full Path:** `{fqn}`\n\n"
-            report += f"| Attribute | Value |\n"
-            report += f"|-----------|-------|\n"
-            report += f"| **Score** | {cand.get('total_score', 0)}/20 |\n"
-            report += f"| **Status** | {'✅ Confirmed' if is_confirmed else '⚠️ Needs Review'} |\n"
-            report += f"\n**Selection Reason:** {cand.get('reason', 'N/A')}\n\n"
+            parts.append(_SEARCH_CAND_TMPL.format(
+                rank=i, schema=cand.get('schema'), table=cand.get('table'),
+                fqn=fqn, score=cand.get('total_score', 0),
+                status='✅ Confirmed' if is_confirmed else '⚠️ Needs Review',
+                reason=cand.get('reason', 'N/A')))
             
             if cand.get('text_columns'):
-                report += f"**Text Columns for Search Index:**\n"
+                parts.append(f"**Text Columns for Search Index:**\n")
                 for col in cand.get('text_columns', [])[:5]:
-                    report += f"- `{col}`\n"
-                report += "\n"
+                    parts.append(f"- `{col}`\n")
+                parts.append("\n")
             
-            report += f"**Recommended Implementation:**\n"
-            report += f"```sql\nCREATE CORTEX SEARCH SERVICE {cand.get('table', 'table')}_search\n"
-            report += f"  ON {cand.get('database')}.{cand.get('schema')}.{cand.get('table')}\n"
-            report += f"  TARGET_LAG = '1 hour'\n"
-            report += f"  WAREHOUSE = your_warehouse;\n```\n\n"
-            report += "---\n\n"
+            parts.append(_SEARCH_IMPL_TMPL.format(
+                database=cand.get('database'), schema=cand.get('schema'),
+                table=cand.get('table', 'table')))
     else:
-        report += "*No Cortex Search candidates identified.*\n\n"
+        parts.append("*No Cortex Search candidates identified.*\n\n")
     
     # Cortex ML section
-    report += """## Cortex ML Candidates
+    parts.append("""## Cortex ML Candidates
 
 Cortex ML enables forecasting and anomaly detection on time-series data.
 
@@ -3283,30 +4026,23 @@ Cortex ML enables forecasting and anomaly detection on time-series data.
 - Numeric columns suitable for forecasting
 - Time-series patterns in the data
 
-"""
+""")
     
     ml_cands = by_feature.get('Cortex ML (Forecasting/Anomaly)', [])[:20]
     if ml_cands:
-        report += "### Top ML Candidates\n\n"
+        parts.append("### Top ML Candidates\n\n")
         for i, cand in enumerate(ml_cands[:10], 1):
             fqn = f"{cand.get('database')}.{cand.get('schema')}.{cand.get('table')}"
             
-            report += f"#### {i}. `{cand.get('schema')}.{cand.get('table')}`\n\n"
-            report += f"**Full Path:** `{fqn}`\n\n"
-            report += f"| Attribute | Value |\n"
-            report += f"|-----------|-------|\n"
-            report += f"| **Score** | {cand.get('total_score', 0)}/20 |\n"
-            report += f"\n**Selection Reason:** {cand.get('reason', 'N/A')}\n\n"
-            
-            report += f"**Recommended Use Cases:**\n"
-            report += f"- Time-series forecasting with `SNOWFLAKE.ML.FORECAST`\n"
-            report += f"- Anomaly detection with `SNOWFLAKE.ML.ANOMALY_DETECTION`\n\n"
-            report += "---\n\n"
+            parts.append(_ML_CAND_TMPL.format(
+                rank=i, schema=cand.get('schema'), table=cand.get('table'),
+                fqn=fqn, score=cand.get('total_score', 0),
+                reason=cand.get('reason', 'N/A')))
     else:
-        report += "*No Cortex ML candidates identified.*\n\n"
+        parts.append("*No Cortex ML candidates identified.*\n\n")
     
     # Document AI / Extract section
-    report += """## Document AI / Extract Candidates
+    parts.append("""## Document AI / Extract Candidates
 
 Cortex Extract processes semi-structured data (VARIANT, OBJECT, ARRAY) and Document AI processes unstructured files.
 
@@ -3315,44 +4051,46 @@ Cortex Extract processes semi-structured data (VARIANT, OBJECT, ARRAY) and Docum
 - Stages with document files (PDF, images)
 - Complex nested data structures
 
-"""
+""")
     
     extract_cands = by_feature.get('Cortex Extract (Semi-structured)', [])[:20]
     if extract_cands:
-        report += "### Top Extract Candidates\n\n"
+        parts.append("### Top Extract Candidates\n\n")
         for i, cand in enumerate(extract_cands[:10], 1):
             fqn = f"{cand.get('database')}.{cand.get('schema')}.{cand.get('table')}.{cand.get('column', '')}"
             
-            report += f"#### {i}. `{cand.get('table')}.{cand.get('column')}`\n\n"
-            report += f"**Full Path:** `{fqn}`\n\n"
-            report += f"| Attribute | Value |\n"
-            report += f"|-----------|-------|\n"
-            report += f"| **Score** | {cand.get('total_score', 0)}/20 |\n"
-            report += f"| **Data Type** | {cand.get('data_type', 'N/A')} |\n"
-            report += f"\n**Selection Reason:** {cand.get('reason', 'N/A')}\n\n"
-            report += "---\n\n"
+            parts.append(f"#### {i}. `{cand.get('table')}.{cand.get('column')}`\n\n")
+            parts.append(f"**Full Path:** `{fqn}`\n\n")
+            parts.append(f"| Attribute | Value |\n")
+            parts.append(f"|-----------|-------|\n")
+            parts.append(f"| **Score** | {cand.get('total_score', 0)}/20 |\n")
+            parts.append(f"| **Data Type** | {cand.get('data_type', 'N/A')} |\n")
+            parts.append(f"\n**Selection Reason:** {cand.get('reason', 'N/A')}\n\n")
+            parts.append("---\n\n")
     else:
-        report += "*No Cortex Extract candidates identified.*\n\n"
+        parts.append("*No Cortex Extract candidates identified.*\n\n")
     
     # Data Quality Assessment
-    report += f"""## Data Quality Assessment
+    parts.append(f"""## Data Quality Assessment
 
 ### Text Column Quality Summary
 
-"""
+""")
     if text_profiles:
-        report += "| Column | Avg Length | Max Length | Sparsity | Quality |\n"
-        report += "|--------|------------|------------|----------|--------|\n"
-        for tp in sorted(text_profiles, key=lambda x: x.get('avg_length', 0), reverse=True)[:20]:
-            sparsity = 100 - (tp.get('non_null_count', 0) / tp.get('total_rows_sampled', 1) * 100) if tp.get('total_rows_sampled', 0) > 0 else 100
-            quality = "🟢 Good" if sparsity < 30 and tp.get('avg_length', 0) > 50 else "🟡 Fair" if sparsity < 60 else "🔴 Poor"
+        parts.append("| Column | Avg Length | Max Length | Sparsity | Quality |\n")
+        parts.append("|--------|------------|------------|----------|--------|\n")
+        for tp in heapq.nlargest(20, text_profiles, key=lambda x: x.get('avg_length', 0)):
+            avg_length = tp.get('avg_length', 0)
+            total_rows = tp.get('total_rows_sampled', 0)
+            sparsity = _sparsity_pct(tp.get('non_null_count', 0), total_rows)
+            quality = _QUALITY_TIERS[(sparsity < 60) + (sparsity < 30 and avg_length > 50)]
             col_name = f"{tp.get('table')}.{tp.get('column')}"[:40]
-            report += f"| `{col_name}` | {tp.get('avg_length', 0):.0f} | {tp.get('max_length', 0):,} | {sparsity:.0f}% | {quality} |\n"
+            parts.append(f"| `{col_name}` | {avg_length:.0f} | {tp.get('max_length', 0):,} | {sparsity:.0f}% | {quality} |\n")
     else:
-        report += "*No text profiling data available.*\n"
+        parts.append("*No text profiling data available.*\n")
     
     # PII & Governance
-    report += f"""
+    parts.append(f"""
 
 ---
 
@@ -3362,29 +4100,22 @@ Cortex Extract processes semi-structured data (VARIANT, OBJECT, ARRAY) and Docum
 
 ### PII Categories Detected
 
-"""
+""")
     pii_categories = defaultdict(list)
     for col in pii_columns:
-        col_upper = str(col).upper()
-        if 'EMAIL' in col_upper:
-            pii_categories['Email'].append(col)
-        elif 'NAME' in col_upper or 'FIRST' in col_upper or 'LAST' in col_upper:
-            pii_categories['Name'].append(col)
-        elif 'PHONE' in col_upper or 'MOBILE' in col_upper:
-            pii_categories['Phone'].append(col)
-        elif 'ADDRESS' in col_upper or 'STREET' in col_upper or 'CITY' in col_upper:
-            pii_categories['Address'].append(col)
-        elif 'DOB' in col_upper or 'BIRTH' in col_upper:
-            pii_categories['Date of Birth'].append(col)
-        elif 'SSN' in col_upper or 'SOCIAL' in col_upper:
-            pii_categories['SSN'].append(col)
-        else:
+        col_name = str(col)
+        if not _PII_ANY_CATEGORY_RE.search(col_name):
             pii_categories['Other'].append(col)
+            continue
+        for category, pattern in _PII_CATEGORY_PATTERNS:
+            if pattern.search(col_name):
+                pii_categories[category].append(col)
+                break
     
     for category, cols in sorted(pii_categories.items(), key=lambda x: -len(x[1])):
-        report += f"- **{category}:** {len(cols)} columns\n"
+        parts.append(f"- **{category}:** {len(cols)} columns\n")
     
-    report += f"""
+    parts.append(f"""
 
 ### Governance Recommendations
 
@@ -3404,159 +4135,33 @@ Cortex Extract processes semi-structured data (VARIANT, OBJECT, ARRAY) and Docum
 3. Test sentiment analysis on feedback columns
 
 ### Phase 2: Core AI Services (2-4 weeks)
-1. Deploy Cortex Search Service on content tables
-2. Implement ML forecasting on time-series data
-3. Set up data masking for PII protection
-
-### Phase 3: Advanced Use Cases (4-8 weeks)
-1. Build RAG applications with Cortex Search
-2. Deploy Document AI for stage processing
-3. Create AI-powered dashboards and reports
-
----
-
-## Appendix: Education Domain Tables
-
-**Education-related tables identified:** {len(edu_tables):,}
-
-These tables contain student, assessment, and learning content data particularly suited for EdTech AI applications.
-
----
-
-*Report generated by {AGENT_NAME} v{AGENT_VERSION}*
-"""
-    
-    return report
-
-
-def generate_roadmap(all_candidates, text_profiles, edu_tables, stages_data):
-    """Generate prioritized AI strategy roadmap with detailed implementation guidance"""
-
-    sorted_cands = sorted(all_candidates, key=lambda x: x.get('total_score', 0), reverse=True)
-
-    # Priority groups with detailed criteria
-    p1 = [c for c in sorted_cands if c.get('total_score', 0) >= 15 and c.get('scores', {}).get('governance_risk', 5) <= 3]
-    p2 = [c for c in sorted_cands if c.get('total_score', 0) >= 12 and c not in p1]
-    p3 = [c for c in sorted_cands if c not in p1 and c not in p2]
-    p3_count = len(p3)
-    
-    # Group by AI feature for analysis
-    by_feature = defaultdict(list)
-    for c in sorted_cands:
-        by_feature[c.get('ai_feature', 'Unknown')].append(c)
-    
-    # Calculate confirmation rates
-    confirmed_p1 = len([c for c in p1 if c.get('is_confirmed_candidate')])
-    confirmed_p2 = len([c for c in p2 if c.get('is_confirmed_candidate')])
-
-    roadmap = f"""# Snowflake AI Strategy Roadmap
-
-> **Generated On:** {get_utc_timestamp()}  
-> **Agent:** {AGENT_NAME} v{AGENT_VERSION}  
-> **Report Type:** AI Implementation Roadmap with Prioritized Actions
-
----
-
-## Table of Contents
-
-1. [Executive Overview](#executive-overview)
-2. [Implementation Priority Matrix](#implementation-priority-matrix)
-3. [Phase 1: Quick Wins](#phase-1-quick-wins-1-2-weeks)
-4. [Phase 2: Core AI Services](#phase-2-core-ai-services-2-4-weeks)
-5. [Phase 3: Advanced Use Cases](#phase-3-advanced-use-cases-1-3-months)
-6. [Feature Implementation Guides](#feature-implementation-guides)
-7. [Governance & Compliance](#governance--compliance)
-8. [Success Metrics & KPIs](#success-metrics--kpis)
-9. [Resource Planning](#resource-planning)
-
----
-
-## Executive Overview
-
-This roadmap provides a prioritized implementation plan for Snowflake Cortex AI services based on the analysis of your data environment.
-
-### Key Findings
-
-| Metric | Value | Implication |
-|--------|-------|-------------|
-| **Total AI Candidates** | {len(all_candidates):,} | Large opportunity for AI enablement |
-| **Priority 1 (Immediate)** | {len(p1):,} ({confirmed_p1} confirmed) | Ready for immediate implementation |
-| **Priority 2 (Short-term)** | {len(p2):,} ({confirmed_p2} confirmed) | Requires minor preparation |
-| **Priority 3 (Medium-term)** | {p3_count:,} | Requires data/governance work |
-| **Education Tables** | {len(edu_tables):,} | Strong EdTech AI potential |
-
-### AI Feature Distribution
-
-| AI Feature | Candidates | Priority 1 | Priority 2 |
-|------------|------------|------------|------------|
-| **Cortex LLM** | {len(by_feature.get('Cortex LLM', [])):,} | {len([c for c in p1 if c.get('ai_feature') == 'Cortex LLM'])} | {len([c for c in p2 if c.get('ai_feature') == 'Cortex LLM'])} |
-| **Cortex Search/RAG** | {len(by_feature.get('Cortex Search / RAG', [])):,} | {len([c for c in p1 if c.get('ai_feature') == 'Cortex Search / RAG'])} | {len([c for c in p2 if c.get('ai_feature') == 'Cortex Search / RAG'])} |
-| **Cortex ML** | {len(by_feature.get('Cortex ML (Forecasting/Anomaly)', [])):,} | {len([c for c in p1 if c.get('ai_feature') == 'Cortex ML (Forecasting/Anomaly)'])} | {len([c for c in p2 if c.get('ai_feature') == 'Cortex ML (Forecasting/Anomaly)'])} |
-| **Cortex Extract** | {len(by_feature.get('Cortex Extract (Semi-structured)', [])):,} | {len([c for c in p1 if c.get('ai_feature') == 'Cortex Extract (Semi-structured)'])} | {len([c for c in p2 if c.get('ai_feature') == 'Cortex Extract (Semi-structured)'])} |
-
----
-
-## Implementation Priority Matrix
-
-### Priority Criteria
-
-| Priority | Score Range | Governance Risk | Data Readiness | Timeline |
-|----------|-------------|-----------------|----------------|----------|
-| **P1 - Immediate** | ≥15/20 | Low (≤3) | Confirmed | 1-2 weeks |
-| **P2 - Short-term** | ≥12/20 | Medium | Likely ready | 2-4 weeks |
-| **P3 - Medium-term** | <12/20 | Any | Needs work | 1-3 months |
-
----
-
-## Phase 1: Quick Wins (1-2 Weeks)
-
-**Objective:** Demonstrate immediate value with high-confidence, low-risk implementations.
-
-### Selection Criteria
-- Total score ≥ 15/20
-- Governance risk ≤ 3/5 (low PII concern)
-- Data confirmed as ready for AI processing
-
-### Priority 1 Candidates ({len(p1):,} total)
-
-| # | Schema | Object | AI Feature | Score | Why Selected |
-|---|--------|--------|------------|-------|--------------|
-"""
-
-    for i, cand in enumerate(p1[:10], 1):
-        obj = f"{cand.get('table', 'N/A')}"
-        if cand.get('column'):
-            obj += f".{cand.get('column')}"
-        roadmap += f"| {i} | {cand.get('schema', 'N/A')[:20]} | `{obj[:30]}` | {cand.get('ai_feature', 'N/A')} | {cand.get('total_score', 0)}/20 | {cand.get('reason', 'N/A')[:30]} |\n"
+1. Deploy Cortex Search Service on content tables
+2. Implement ML forecasting on time-series data
+3. Set up data masking for PII protection
 
-    # Add detailed P1 candidate analysis
-    if p1:
-        roadmap += "\n### Detailed Phase 1 Recommendations\n\n"
-        for i, cand in enumerate(p1[:5], 1):
-            fqn = f"{cand.get('database')}.{cand.get('schema')}.{cand.get('table')}"
-            if cand.get('column'):
-                fqn += f".{cand.get('column')}"
-            scores = cand.get('scores', {})
-            roadmap += f"""#### {i}. `{cand.get('table')}.{cand.get('column', 'N/A')}`
+### Phase 3: Advanced Use Cases (4-8 weeks)
+1. Build RAG applications with Cortex Search
+2. Deploy Document AI for stage processing
+3. Create AI-powered dashboards and reports
 
-**Full Path:** `{fqn}`
+---
 
-| Dimension | Score | Assessment |
-|-----------|-------|------------|
-| Business Potential | {scores.get('business_potential', 0)}/5 | {'High value' if scores.get('business_potential', 0) >= 4 else 'Moderate value'} |
-| Data Readiness | {scores.get('data_readiness', 0)}/5 | {'Ready' if scores.get('data_readiness', 0) >= 4 else 'Needs validation'} |
-| Metadata Quality | {scores.get('metadata_quality', 0)}/5 | {'Well documented' if scores.get('metadata_quality', 0) >= 3 else 'Limited docs'} |
-| Governance Risk | {scores.get('governance_risk', 0)}/5 | {'Low risk' if scores.get('governance_risk', 0) <= 3 else 'Review needed'} |
+## Appendix: Education Domain Tables
 
-**Why Selected:** {cand.get('reason', 'N/A')}
+**Education-related tables identified:** {len(edu_tables):,}
 
-**Recommended Action:** Implement {cand.get('ai_feature', 'AI feature')} with pilot testing
+These tables contain student, assessment, and learning content data particularly suited for EdTech AI applications.
 
 ---
 
-"""
+*Report generated by {AGENT_NAME} v{AGENT_VERSION}*
+""")
+    
+    return "".join(parts)
+
 
-    roadmap += f"""
+# Static roadmap sections with no substitutions, rendered once at import
+_QUICK_WIN_SQL_BLOCK = """
 ### Quick Win SQL Examples
 
 ```sql
@@ -3594,36 +4199,9 @@ LIMIT 100;
 - Total score ≥ 12/20
 - May require minor data preparation
 - Business value justifies implementation effort
-
-### Priority 2 Candidates ({len(p2):,} total)
-
-| # | Schema | Object | AI Feature | Score | Reason |
-|---|--------|--------|------------|-------|--------|
 """
 
-    for i, cand in enumerate(p2[:15], 1):
-        obj = f"{cand.get('table', 'N/A')}"
-        if cand.get('column'):
-            obj += f".{cand.get('column')}"
-        roadmap += f"| {i} | {cand.get('schema', 'N/A')[:20]} | `{obj[:35]}` | {cand.get('ai_feature', 'N/A')} | {cand.get('total_score', 0)}/20 | {cand.get('reason', 'N/A')[:25]} |\n"
-
-    roadmap += f"""
-
----
-
-## Phase 3: Advanced Use Cases (1-3 Months)
-
-**Objective:** Implement complex AI solutions requiring data preparation or governance review.
-
-### Selection Criteria
-- Score < 12/20 OR governance risk > 3/5
-- May require significant data cleanup
-- Needs compliance/security review
-
-### Priority 3 Summary
-
-**{p3_count:,} candidates** identified requiring additional work:
-
+_FEATURE_GUIDE_INTRO_BLOCK = """
 | Blocker Category | Action Required |
 |------------------|-----------------|
 | **PII/Governance** | Review student data for FERPA/COPPA compliance |
@@ -3658,11 +4236,7 @@ LIMIT 100;
 **Best Candidates:**
 """
 
-    if text_profiles:
-        for p in sorted(text_profiles, key=lambda x: x.get('avg_length', 0), reverse=True)[:5]:
-            roadmap += f"- `{p['database']}.{p['schema']}.{p['table']}.{p['column']}` - avg {p['avg_length']:.0f} chars\n"
-
-    roadmap += f"""
+_IMPL_GUIDES_BLOCK = """
 
 **Cost Optimization:**
 - Use TABLESAMPLE and LIMIT during development
@@ -3694,7 +4268,7 @@ CREATE CORTEX SEARCH SERVICE content_search
 SELECT PARSE_JSON(
   SNOWFLAKE.CORTEX.SEARCH_PREVIEW(
     'content_search',
-    '{{"query": "algebra word problems", "columns": ["content"], "limit": 10}}'
+    '{"query": "algebra word problems", "columns": ["content"], "limit": 10}'
   )
 );
 ```
@@ -3769,8 +4343,9 @@ WHERE variant_col:content IS NOT NULL;
 
 ### Document AI
 
-**Available Stages:** {len(stages_data)} stages with S3/Azure/GCS URLs
+"""
 
+_GOVERNANCE_TAIL_BLOCK = """
 **Setup Steps:**
 1. Verify stage access permissions
 2. List files in stage to confirm formats (.pdf, .docx, .png, .jpg)
@@ -3832,68 +4407,307 @@ Before enabling AI features on any table:
 | `profiles/text_column_profiles.json` | Text profiling data |
 | `logs/audit_trail.sql` | Query audit trail |
 """
-    return roadmap
 
-def generate_profile_reports(all_candidates):
+# Roadmap row/block templates, defined once at module scope; the {:.N}
+# precision specs truncate strings just like the old per-row slicing did
+_P1_ROW_TMPL = "| {i} | {schema:.20} | `{obj:.30}` | {feature} | {score}/20 | {reason:.30} |\n"
+_P2_ROW_TMPL = "| {i} | {schema:.20} | `{obj:.35}` | {feature} | {score}/20 | {reason:.25} |\n"
+
+_P1_DETAIL_TMPL = """#### {i}. `{table}.{column}`
+
+**Full Path:** `{fqn}`
+
+| Dimension | Score | Assessment |
+|-----------|-------|------------|
+| Business Potential | {business}/5 | {business_note} |
+| Data Readiness | {readiness}/5 | {readiness_note} |
+| Metadata Quality | {metadata}/5 | {metadata_note} |
+| Governance Risk | {risk}/5 | {risk_note} |
+
+**Why Selected:** {reason}
+
+**Recommended Action:** Implement {feature} with pilot testing
+
+---
+
+"""
+
+def generate_roadmap(all_candidates, text_profiles, edu_tables, stages_data,
+                     aggregates=None):
+    """Generate prioritized AI strategy roadmap with detailed implementation guidance"""
+
+    if aggregates is None:
+        aggregates = build_report_aggregates(all_candidates)
+    sorted_cands = aggregates['sorted']
+
+    # Priority groups with detailed criteria - one pass assigns each
+    # candidate to exactly one bucket (no quadratic list membership tests)
+    p1, p2, p3 = [], [], []
+    for c in sorted_cands:
+        score = c.get('total_score', 0)
+        if score >= 15 and c.get('scores', {}).get('governance_risk', 5) <= 3:
+            p1.append(c)
+        elif score >= 12:
+            p2.append(c)
+        else:
+            p3.append(c)
+    p3_count = len(p3)
+    
+    # Shared per-feature grouping (already score-ordered)
+    by_feature = aggregates['by_feature']
+
+    # Calculate confirmation rates
+    confirmed_p1 = sum(1 for c in p1 if c.get('is_confirmed_candidate'))
+    confirmed_p2 = sum(1 for c in p2 if c.get('is_confirmed_candidate'))
+
+    # Per-priority feature counts for the distribution table, tallied once
+    p1_by_feature = Counter(c.get('ai_feature', 'Unknown') for c in p1)
+    p2_by_feature = Counter(c.get('ai_feature', 'Unknown') for c in p2)
+
+    parts = [f"""# Snowflake AI Strategy Roadmap
+
+> **Generated On:** {get_utc_timestamp()}  
+> **Agent:** {AGENT_NAME} v{AGENT_VERSION}  
+> **Report Type:** AI Implementation Roadmap with Prioritized Actions
+
+---
+
+## Table of Contents
+
+1. [Executive Overview](#executive-overview)
+2. [Implementation Priority Matrix](#implementation-priority-matrix)
+3. [Phase 1: Quick Wins](#phase-1-quick-wins-1-2-weeks)
+4. [Phase 2: Core AI Services](#phase-2-core-ai-services-2-4-weeks)
+5. [Phase 3: Advanced Use Cases](#phase-3-advanced-use-cases-1-3-months)
+6. [Feature Implementation Guides](#feature-implementation-guides)
+7. [Governance & Compliance](#governance--compliance)
+8. [Success Metrics & KPIs](#success-metrics--kpis)
+9. [Resource Planning](#resource-planning)
+
+---
+
+## Executive Overview
+
+This roadmap provides a prioritized implementation plan for Snowflake Cortex AI services based on the analysis of your data environment.
+
+### Key Findings
+
+| Metric | Value | Implication |
+|--------|-------|-------------|
+| **Total AI Candidates** | {len(all_candidates):,} | Large opportunity for AI enablement |
+| **Priority 1 (Immediate)** | {len(p1):,} ({confirmed_p1} confirmed) | Ready for immediate implementation |
+| **Priority 2 (Short-term)** | {len(p2):,} ({confirmed_p2} confirmed) | Requires minor preparation |
+| **Priority 3 (Medium-term)** | {p3_count:,} | Requires data/governance work |
+| **Education Tables** | {len(edu_tables):,} | Strong EdTech AI potential |
+
+### AI Feature Distribution
+
+| AI Feature | Candidates | Priority 1 | Priority 2 |
+|------------|------------|------------|------------|
+| **Cortex LLM** | {len(by_feature.get('Cortex LLM', [])):,} | {p1_by_feature.get('Cortex LLM', 0)} | {p2_by_feature.get('Cortex LLM', 0)} |
+| **Cortex Search/RAG** | {len(by_feature.get('Cortex Search / RAG', [])):,} | {p1_by_feature.get('Cortex Search / RAG', 0)} | {p2_by_feature.get('Cortex Search / RAG', 0)} |
+| **Cortex ML** | {len(by_feature.get('Cortex ML (Forecasting/Anomaly)', [])):,} | {p1_by_feature.get('Cortex ML (Forecasting/Anomaly)', 0)} | {p2_by_feature.get('Cortex ML (Forecasting/Anomaly)', 0)} |
+| **Cortex Extract** | {len(by_feature.get('Cortex Extract (Semi-structured)', [])):,} | {p1_by_feature.get('Cortex Extract (Semi-structured)', 0)} | {p2_by_feature.get('Cortex Extract (Semi-structured)', 0)} |
+
+---
+
+## Implementation Priority Matrix
+
+### Priority Criteria
+
+| Priority | Score Range | Governance Risk | Data Readiness | Timeline |
+|----------|-------------|-----------------|----------------|----------|
+| **P1 - Immediate** | ≥15/20 | Low (≤3) | Confirmed | 1-2 weeks |
+| **P2 - Short-term** | ≥12/20 | Medium | Likely ready | 2-4 weeks |
+| **P3 - Medium-term** | <12/20 | Any | Needs work | 1-3 months |
+
+---
+
+## Phase 1: Quick Wins (1-2 Weeks)
+
+**Objective:** Demonstrate immediate value with high-confidence, low-risk implementations.
+
+### Selection Criteria
+- Total score ≥ 15/20
+- Governance risk ≤ 3/5 (low PII concern)
+- Data confirmed as ready for AI processing
+
+### Priority 1 Candidates ({len(p1):,} total)
+
+| # | Schema | Object | AI Feature | Score | Why Selected |
+|---|--------|--------|------------|-------|--------------|
+"""]
+
+    for i, cand in enumerate(p1[:10], 1):
+        column = cand.get('column')
+        obj = f"{cand.get('table', 'N/A')}"
+        if column:
+            obj += f".{column}"
+        parts.append(_P1_ROW_TMPL.format(
+            i=i, schema=cand.get('schema', 'N/A'), obj=obj,
+            feature=cand.get('ai_feature', 'N/A'),
+            score=cand.get('total_score', 0),
+            reason=cand.get('reason', 'N/A')))
+
+    # Add detailed P1 candidate analysis
+    if p1:
+        parts.append("\n### Detailed Phase 1 Recommendations\n\n")
+        for i, cand in enumerate(p1[:5], 1):
+            table = cand.get('table')
+            column = cand.get('column')
+            fqn = f"{cand.get('database')}.{cand.get('schema')}.{table}"
+            if column:
+                fqn += f".{column}"
+            # Hoist score lookups once per candidate; each feeds two cells
+            scores = cand.get('scores', {})
+            business = scores.get('business_potential', 0)
+            readiness = scores.get('data_readiness', 0)
+            metadata = scores.get('metadata_quality', 0)
+            risk = scores.get('governance_risk', 0)
+            parts.append(_P1_DETAIL_TMPL.format(
+                i=i, table=table,
+                column=column if column is not None else 'N/A',
+                fqn=fqn,
+                business=business,
+                business_note='High value' if business >= 4 else 'Moderate value',
+                readiness=readiness,
+                readiness_note='Ready' if readiness >= 4 else 'Needs validation',
+                metadata=metadata,
+                metadata_note='Well documented' if metadata >= 3 else 'Limited docs',
+                risk=risk,
+                risk_note='Low risk' if risk <= 3 else 'Review needed',
+                reason=cand.get('reason', 'N/A'),
+                feature=cand.get('ai_feature', 'AI feature')))
+
+    parts.append(_QUICK_WIN_SQL_BLOCK)
+    parts.append(f"""
+### Priority 2 Candidates ({len(p2):,} total)
+
+| # | Schema | Object | AI Feature | Score | Reason |
+|---|--------|--------|------------|-------|--------|
+""")
+
+    for i, cand in enumerate(p2[:15], 1):
+        obj = f"{cand.get('table', 'N/A')}"
+        column = cand.get('column')
+        if column:
+            obj += f".{column}"
+        parts.append(_P2_ROW_TMPL.format(
+            i=i, schema=cand.get('schema', 'N/A'), obj=obj,
+            feature=cand.get('ai_feature', 'N/A'),
+            score=cand.get('total_score', 0),
+            reason=cand.get('reason', 'N/A')))
+
+    parts.append(f"""
+
+---
+
+## Phase 3: Advanced Use Cases (1-3 Months)
+
+**Objective:** Implement complex AI solutions requiring data preparation or governance review.
+
+### Selection Criteria
+- Score < 12/20 OR governance risk > 3/5
+- May require significant data cleanup
+- Needs compliance/security review
+
+### Priority 3 Summary
+
+**{p3_count:,} candidates** identified requiring additional work:
+""")
+    parts.append(_FEATURE_GUIDE_INTRO_BLOCK)
+
+    if text_profiles:
+        for p in heapq.nlargest(5, text_profiles, key=lambda x: x.get('avg_length', 0)):
+            parts.append(f"- `{p['database']}.{p['schema']}.{p['table']}.{p['column']}` - avg {p['avg_length']:.0f} chars\n")
+
+    parts.append(_IMPL_GUIDES_BLOCK)
+    parts.append(f"**Available Stages:** {len(stages_data)} stages with S3/Azure/GCS URLs\n")
+    parts.append(_GOVERNANCE_TAIL_BLOCK)
+    return "".join(parts)
+
+def generate_profile_reports(all_candidates, aggregates=None):
     """Generate per-schema profile reports"""
     print("\n=== Generating Profile Reports ===")
 
-    # Group by database_schema
-    profiles_by_schema = defaultdict(list)
-    for cand in all_candidates:
+    # The shared sorted order means every schema/feature bucket inherits it
+    # and the per-feature loops below can slice instead of re-sorting
+    if aggregates is None:
+        aggregates = build_report_aggregates(all_candidates)
+    all_sorted = aggregates['sorted']
+
+    # Group by database_schema with per-bucket appends bound once
+    grouped = defaultdict(lambda: [].append)
+    for cand in all_sorted:
         key = f"{cand.get('database', 'UNKNOWN')}_{cand.get('schema', 'UNKNOWN')}"
-        profiles_by_schema[key].append(cand)
+        grouped[key](cand)
+    profiles_by_schema = {k: v.__self__ for k, v in grouped.items()}
+
+    generated_ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
     consolidated_links = ["# Consolidated Profile Reports\n\n"]
-    consolidated_links.append(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+    consolidated_links.append(f"**Generated:** {generated_ts}\n\n")
     consolidated_links.append(f"**Total Schemas:** {len(profiles_by_schema)}\n\n")
     consolidated_links.append("## Schema Index\n\n")
 
+    # Hand each finished profile to a small thread pool so the file writes
+    # overlap with assembling the next schema's markdown; writes release the
+    # GIL and every worker touches its own file only
+    write_futures = []
+    pool = ThreadPoolExecutor(max_workers=8)
     for schema_key in sorted(profiles_by_schema.keys()):
         cands = profiles_by_schema[schema_key]
         profile_filename = f"{schema_key}_analysis.md"
-        profile_path = OUTPUT_DIR / "profiles" / profile_filename
+        profile_path = PROFILES_DIR / profile_filename
 
         # Generate profile content
-        profile_content = f"# AI Analysis: {schema_key}\n\n"
-        profile_content += f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
-        profile_content += f"**Candidates Found:** {len(cands)}\n\n"
-        profile_content += "---\n\n"
+        profile_parts = [f"# AI Analysis: {schema_key}\n\n"]
+        profile_parts.append(f"**Generated:** {generated_ts}\n\n")
+        profile_parts.append(f"**Candidates Found:** {len(cands)}\n\n")
+        profile_parts.append("---\n\n")
 
-        # Group by AI feature
-        by_feature = defaultdict(list)
+        # Group by AI feature, same bound-append pattern
+        grouped_feats = defaultdict(lambda: [].append)
         for c in cands:
-            by_feature[c.get('ai_feature', 'Unknown')].append(c)
+            grouped_feats[c.get('ai_feature', 'Unknown')](c)
+        by_feature = {k: v.__self__ for k, v in grouped_feats.items()}
 
         for feature in sorted(by_feature.keys()):
             feature_cands = by_feature[feature]
-            profile_content += f"## {feature} ({len(feature_cands)} candidates)\n\n"
+            profile_parts.append(f"## {feature} ({len(feature_cands)} candidates)\n\n")
 
-            for cand in sorted(feature_cands, key=lambda x: x.get('total_score', 0), reverse=True)[:20]:
-                profile_content += f"### {cand.get('table', 'N/A')}"
+            for cand in feature_cands[:20]:
+                profile_parts.append(f"### {cand.get('table', 'N/A')}")
                 if cand.get('column'):
-                    profile_content += f".{cand.get('column')}"
-                profile_content += f"\n"
-                profile_content += f"- **Score:** {cand.get('total_score', 0)}/20\n"
-                profile_content += f"- **Reason:** {cand.get('reason', 'N/A')}\n"
+                    profile_parts.append(f".{cand.get('column')}")
+                profile_parts.append(f"\n")
+                profile_parts.append(f"- **Score:** {cand.get('total_score', 0)}/20\n")
+                profile_parts.append(f"- **Reason:** {cand.get('reason', 'N/A')}\n")
                 if cand.get('data_type'):
-                    profile_content += f"- **Data Type:** {cand.get('data_type')}\n"
+                    profile_parts.append(f"- **Data Type:** {cand.get('data_type')}\n")
                 if cand.get('scores'):
-                    profile_content += f"- **Scores:** Business={cand['scores'].get('business_potential', 0)}, "
-                    profile_content += f"Data={cand['scores'].get('data_readiness', 0)}, "
-                    profile_content += f"Metadata={cand['scores'].get('metadata_quality', 0)}, "
-                    profile_content += f"Risk={cand['scores'].get('governance_risk', 0)}\n"
-                profile_content += "\n"
+                    profile_parts.append(f"- **Scores:** Business={cand['scores'].get('business_potential', 0)}, ")
+                    profile_parts.append(f"Data={cand['scores'].get('data_readiness', 0)}, ")
+                    profile_parts.append(f"Metadata={cand['scores'].get('metadata_quality', 0)}, ")
+                    profile_parts.append(f"Risk={cand['scores'].get('governance_risk', 0)}\n")
+                profile_parts.append("\n")
 
-        with open(profile_path, "w", encoding="utf-8") as f:
-            f.write(profile_content)
+        # Encode once and write the bytes in a single shot; skips the
+        # buffered text layer when emitting many per-schema files
+        write_futures.append(pool.submit(
+            profile_path.write_bytes, "".join(profile_parts).encode("utf-8")))
 
         consolidated_links.append(f"- [{schema_key}](profiles/{profile_filename}) - {len(cands)} candidates\n")
 
     # Write consolidated report
-    consolidated_path = OUTPUT_DIR / "profiles" / "consolidated_profiles.md"
-    with open(consolidated_path, "w", encoding="utf-8") as f:
-        f.write("".join(consolidated_links))
+    consolidated_path = PROFILES_DIR / "consolidated_profiles.md"
+    write_futures.append(pool.submit(
+        consolidated_path.write_bytes, "".join(consolidated_links).encode("utf-8")))
+
+    # Surface any write error before reporting success
+    for future in write_futures:
+        future.result()
+    pool.shutdown()
 
     print(f"Generated {len(profiles_by_schema)} schema profile reports")
     return len(profiles_by_schema)
@@ -3912,8 +4726,8 @@ def generate_report_index(databases, schemas, tables, columns, stages,
     # Group candidates by database for the analysis breakdown
     db_breakdown = defaultdict(lambda: {"tables": set(), "columns": 0, "candidates": 0, "confirmed": 0})
     
-    all_cands = llm_candidates + search_candidates + ml_candidates + variant_candidates
-    for cand in all_cands:
+    # chain() iterates the four lists without materializing a merged copy
+    for cand in chain(llm_candidates, search_candidates, ml_candidates, variant_candidates):
         db = cand.get('database', 'Unknown')
         db_breakdown[db]["columns"] += 1
         db_breakdown[db]["tables"].add(f"{cand.get('schema', '')}.{cand.get('table', '')}")
@@ -4053,8 +4867,9 @@ For questions about this analysis:
 
 # ==================== AGENT ENTRY POINT ====================
 
-def parse_arguments():
-    """Parse command line arguments for agent execution."""
+@lru_cache(maxsize=1)
+def _build_argument_parser():
+    """Build the ArgumentParser once; repeat library calls reuse it."""
     parser = argparse.ArgumentParser(
         prog='snowflake-ai-agent',
         description=f'{AGENT_NAME} v{AGENT_VERSION} - Autonomous Snowflake AI Readiness Analysis',
@@ -4092,7 +4907,56 @@ All timestamps in generated output use UTC format.
                         help='Restart from a specific stage (e.g., 2B, 3, 5). Loads cached data from previous runs.')
     parser.add_argument('--version', '-v', action='version', version=f'{AGENT_NAME} v{AGENT_VERSION}')
     parser.add_argument('--quiet', '-q', action='store_true', help='Suppress non-essential output')
-    return parser.parse_args()
+    parser.add_argument('--fast-exit', action='store_true',
+                        help='Skip interpreter cleanup on successful exit (flushes output, then os._exit)')
+    return parser
+
+def parse_arguments():
+    """Parse command line arguments for agent execution."""
+    return _build_argument_parser().parse_args()
+
+# Final status banner, rendered once at the end of run_agent with a single
+# .format call instead of an inline f-string full of repeated len() sums
+_FINAL_SUMMARY_TMPL = """
+Environment Summary:
+  - Databases: {num_databases:,}
+  - Schemas: {num_schemas:,}
+  - Tables/Views: {num_tables:,}
+  - Columns: {num_columns:,}
+  - Stages: {num_stages:,}
+
+AI Candidates Identified:
+  - Cortex LLM: {num_llm:,}
+  - Cortex Search/RAG: {num_search:,}
+  - Cortex ML: {num_ml:,}
+  - Cortex Extract: {num_extract:,}
+  - Total: {total_identified:,}
+
+Data Analysis Summary:
+  - Candidates analyzed: {analyzed_count:,}
+  - From cache: {cached_count:,}
+  - New analyses: {new_analyses:,}
+  - Skipped (errors): {skipped_count:,}
+  - Top candidates (full scan): {num_top:,}
+  - Analysis success rate: {success_rate:.1f}%
+
+Reports Generated:
+  - {output_dir}/README.md (Main Report Index)
+  - {output_dir}/reports/executive_summary.md
+  - {output_dir}/reports/detailed_analysis_report.md (Comprehensive Analysis)
+  - {output_dir}/reports/ai_strategy_roadmap.md
+  - {output_dir}/profiles/*.md ({num_profiles} schema profiles)
+  - {output_dir}/metadata/*.json (data files)
+  - {output_dir}/logs/*.sql (audit trail)
+
+Confirmed Candidates: {num_confirmed:,} / {total_identified:,}
+
+Agent completed: {completed_at}
+
+======================================================================
+📋 VIEW FULL REPORT: {output_dir}/README.md
+======================================================================
+"""
 
 def run_agent(config_path=None, dry_run_override=None, start_stage=None):
     """
@@ -4180,30 +5044,35 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
         print("PHASE 1: METADATA DISCOVERY")
         print("=" * 50)
 
-        db_cols, databases = discover_databases(conn)
-        schema_cols, schemas = discover_schemas(conn)
-        table_cols, tables = discover_tables_and_views(conn)
-        column_cols, columns = discover_columns(conn)
-        stage_cols, stages = discover_stages(conn)
+        # Overlap the five metadata round-trips; each discover_* call opens
+        # its own cursor inside execute_query, which the Snowflake connector
+        # supports concurrently on one connection
+        with ThreadPoolExecutor(max_workers=5) as pool:
+            futures = [pool.submit(fn, conn) for fn in (
+                discover_databases, discover_schemas, discover_tables_and_views,
+                discover_columns, discover_stages)]
+            ((db_cols, databases), (schema_cols, schemas),
+             (table_cols, tables), (column_cols, columns),
+             (stage_cols, stages)) = [f.result() for f in futures]
 
         # Save inventory
         print("\nSaving metadata inventory...")
 
         # Full column inventory
-        inventory_path = OUTPUT_DIR / "metadata" / "full_inventory.csv"
+        inventory_path = METADATA_DIR / "full_inventory.csv"
         inventory_cols = ["DATABASE", "SCHEMA", "TABLE", "COLUMN", "DATA_TYPE", "MAX_LENGTH", "COMMENT"]
-        inventory_data = []
-        for row in columns:
-            db, schema, table, col_name, ordinal, data_type, max_len, num_prec, num_scale, nullable, comment = row
-            inventory_data.append([db, schema, table, col_name, data_type, max_len, comment])
+        # Single C-level comprehension instead of unpack-then-append per row
+        inventory_data = [(r[0], r[1], r[2], r[3], r[5], r[6], r[10]) for r in columns]
         save_csv(inventory_path, inventory_cols, inventory_data)
         print(f"  Saved {len(inventory_data):,} columns to {inventory_path}")
 
         # Stages inventory
         if stages:
-            stages_path = OUTPUT_DIR / "metadata" / "stages_inventory.csv"
+            stages_path = METADATA_DIR / "stages_inventory.csv"
             save_csv(stages_path, stage_cols, stages)
             print(f"  Saved {len(stages):,} stages to {stages_path}")
+
+        save_checkpoint('1')
     else:
         print("\n" + "=" * 50)
         print("PHASE 1: METADATA DISCOVERY [SKIPPED - Loading from cache]")
@@ -4222,16 +5091,11 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
         print("PHASE 2: AI CANDIDATE IDENTIFICATION")
         print("=" * 50)
 
-        llm_candidates = identify_llm_candidates(columns)
+        # Single fused pass over columns instead of one scan per feature
+        llm_candidates, variant_candidates, ml_candidates, search_candidates = classify_columns(columns)
         print(f"Cortex LLM candidates: {len(llm_candidates):,}")
-
-        variant_candidates = identify_variant_candidates(columns)
         print(f"Cortex Extract candidates: {len(variant_candidates):,}")
-
-        ml_candidates = identify_ml_candidates(columns)
         print(f"Cortex ML candidates: {len(ml_candidates):,}")
-
-        search_candidates = identify_search_candidates(columns)
         print(f"Cortex Search candidates: {len(search_candidates):,}")
 
         all_candidates = llm_candidates + variant_candidates + ml_candidates + search_candidates
@@ -4242,11 +5106,17 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
         print("=" * 50)
         if intermediate_state and intermediate_state['all_candidates']:
             all_candidates = intermediate_state['all_candidates']
-            # Try to restore individual candidate lists
-            llm_candidates = [c for c in all_candidates if c.get('ai_feature') == 'Cortex LLM']
-            variant_candidates = [c for c in all_candidates if c.get('ai_feature') == 'Cortex Extract']
-            ml_candidates = [c for c in all_candidates if c.get('ai_feature') == 'Cortex ML']
-            search_candidates = [c for c in all_candidates if c.get('ai_feature') == 'Cortex Search / RAG']
+            # Try to restore individual candidate lists in one pass
+            buckets = {'Cortex LLM': [], 'Cortex Extract': [],
+                       'Cortex ML': [], 'Cortex Search / RAG': []}
+            for c in all_candidates:
+                bucket = buckets.get(c.get('ai_feature'))
+                if bucket is not None:
+                    bucket.append(c)
+            llm_candidates = buckets['Cortex LLM']
+            variant_candidates = buckets['Cortex Extract']
+            ml_candidates = buckets['Cortex ML']
+            search_candidates = buckets['Cortex Search / RAG']
         print(f"  Loaded {len(all_candidates):,} candidates from cache")
 
     # ========== PHASE 2: ACTUAL DATA ANALYSIS ==========
@@ -4288,36 +5158,49 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
             exclude_databases=EXCLUDE_DATABASES
         )
 
-        # Build lookups for scoring candidates
+        # Build lookups for scoring candidates; flatten the per-table column
+        # lists into one (db, schema, table, column) dict so the loop below
+        # does an O(1) hash lookup instead of scanning each table's columns
         meta_table_lookup = metadata_analysis_result['table_lookup']
         meta_column_lookup = metadata_analysis_result['column_lookup']
+        meta_column_by_full_key = {
+            table_key + (col.get('column_name'),): col
+            for table_key, cols in meta_column_lookup.items()
+            for col in cols
+        }
 
         total_candidates = len(all_candidates)
+        # Redraw the progress line ~200 times total rather than per candidate;
+        # the per-item terminal flush dominates this loop otherwise
+        progress_interval = max(1, total_candidates // 200)
+        # One analysis timestamp for the whole metadata pass; every candidate
+        # is analyzed in the same wall-clock burst
+        batch_ts = get_utc_timestamp_iso()
         for i, candidate in enumerate(all_candidates, 1):
-            item_name = f"{candidate.get('database', '?')}.{candidate.get('schema', '?')}.{candidate.get('table', '?')}.{candidate.get('column', '?')}"
-            extra_info = f"OK:{analyzed_count} Err:{skipped_count}"
-            print_progress(i, total_candidates, item_name, "Phase 2B", extra_info)
+            if i % progress_interval == 0 or i == total_candidates:
+                item_name = f"{candidate.get('database', '?')}.{candidate.get('schema', '?')}.{candidate.get('table', '?')}.{candidate.get('column', '?')}"
+                extra_info = f"OK:{analyzed_count} Err:{skipped_count}"
+                print_progress(i, total_candidates, item_name, "Phase 2B", extra_info)
 
             try:
                 table_key = (candidate.get('database'), candidate.get('schema'), candidate.get('table'))
                 table_meta = meta_table_lookup.get(table_key, {})
-                cols_meta = meta_column_lookup.get(table_key, [])
 
-                # Find the specific column metadata
+                # Direct hash lookup for the specific column metadata
                 col_name = candidate.get('column', '')
-                col_meta = next((c for c in cols_meta if c.get('column_name') == col_name), {})
+                col_meta = meta_column_by_full_key.get(table_key + (col_name,), {})
 
                 if col_meta:
                     # Compute metadata-based statistics (replaces run_adaptive_sample)
                     stats = compute_column_metadata_stats(col_meta, table_meta)
                     candidate['statistics'] = stats
                     candidate['sample_size'] = 'metadata'
-                    candidate['analyzed_at'] = get_utc_timestamp_iso()
+                    candidate['analyzed_at'] = batch_ts
 
                     # Cache the result
                     cache_key = f"{candidate.get('database')}.{candidate.get('schema')}.{candidate.get('table')}.{col_name}"
                     cache[cache_key] = {
-                        "analyzed_at": get_utc_timestamp_iso(),
+                        "analyzed_at": batch_ts,
                         "sample_size": "metadata",
                         "analysis_type": "metadata_only",
                         "statistics": stats
@@ -4337,9 +5220,10 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
             "Skipped (errors)": skipped_count,
             "Table scans avoided": total_candidates
         })
+        save_checkpoint('2B')
     else:
         print("\nPhase 2B: Metadata Analysis [SKIPPED]")
-        analyzed_count = len([c for c in all_candidates if 'statistics' in c])
+        analyzed_count = sum(1 for c in all_candidates if 'statistics' in c)
         print(f"  Using {analyzed_count:,} pre-analyzed candidates")
 
     # Phase 2C: Save updated cache
@@ -4390,6 +5274,7 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
 
         # Save updated cache
         save_analysis_cache(cache)
+        save_checkpoint('2E')
     else:
         print("\nPhase 2E: Metadata Enhanced Scoring [SKIPPED]")
 
@@ -4400,40 +5285,38 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
         print("=" * 50)
 
         # Save enhanced candidates
-        enhanced_candidates_path = OUTPUT_DIR / "metadata" / "all_candidates_enhanced.json"
-        with open(enhanced_candidates_path, "w", encoding="utf-8") as f:
-            json.dump(all_candidates, f, indent=2, default=str)
+        enhanced_candidates_path = METADATA_DIR / "all_candidates_enhanced.json"
+        dump_json_file(all_candidates, enhanced_candidates_path, default=str,
+                       skip_unchanged=True)
         print(f"  Saved enhanced candidates to {enhanced_candidates_path}")
 
         # Save top 200 full analysis
-        top_200_path = OUTPUT_DIR / "metadata" / "top_200_full_analysis.json"
-        with open(top_200_path, "w", encoding="utf-8") as f:
-            json.dump(top_candidates, f, indent=2, default=str)
+        top_200_path = METADATA_DIR / "top_200_full_analysis.json"
+        dump_json_file(top_candidates, top_200_path, default=str,
+                       skip_unchanged=True)
         print(f"  Saved top 200 analysis to {top_200_path}")
 
         # Collect error log from ANALYSIS_ERRORS_LOG file
         error_log = []
         if ANALYSIS_ERRORS_LOG.exists():
             try:
-                with open(ANALYSIS_ERRORS_LOG, "r", encoding="utf-8") as f:
-                    error_content = f.read()
-                    # Parse error log entries
-                    for line in error_content.split('\n'):
-                        if line.strip():
-                            error_log.append(line)
+                # One C-level split plus one filtered comprehension pass
+                error_log = [line for line in
+                             ANALYSIS_ERRORS_LOG.read_text(encoding="utf-8").splitlines()
+                             if line.strip()]
             except Exception as e:
                 print(f"  Warning: Could not read error log: {e}")
 
         # Generate data quality dashboard
         dashboard = generate_data_quality_dashboard(all_candidates, cache, error_log)
-        dashboard_path = OUTPUT_DIR / "reports" / "data_quality_dashboard.md"
+        dashboard_path = REPORTS_DIR / "data_quality_dashboard.md"
         with open(dashboard_path, "w", encoding="utf-8") as f:
             f.write(dashboard)
         print(f"  Generated data quality dashboard: {dashboard_path}")
 
         # Generate comparison report
         comparison = generate_comparison_report(all_candidates)
-        comparison_path = OUTPUT_DIR / "reports" / "scoring_comparison.md"
+        comparison_path = REPORTS_DIR / "scoring_comparison.md"
         with open(comparison_path, "w", encoding="utf-8") as f:
             f.write(comparison)
         print(f"  Generated scoring comparison: {comparison_path}")
@@ -4444,15 +5327,14 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
                 metadata_analysis_result['table_scores'],
                 metadata_analysis_result['summary']
             )
-            readiness_path = OUTPUT_DIR / "reports" / "ai_readiness_metadata_report.md"
+            readiness_path = REPORTS_DIR / "ai_readiness_metadata_report.md"
             with open(readiness_path, "w", encoding="utf-8") as f:
                 f.write(readiness_report)
             print(f"  Generated metadata readiness report: {readiness_path}")
 
             # Save table readiness scores as JSON
-            readiness_json_path = OUTPUT_DIR / "metadata" / "table_readiness_scores.json"
-            with open(readiness_json_path, "w", encoding="utf-8") as f:
-                json.dump(metadata_analysis_result['table_scores'], f, indent=2, default=str)
+            readiness_json_path = METADATA_DIR / "table_readiness_scores.json"
+            dump_json_file(metadata_analysis_result['table_scores'], readiness_json_path, default=str)
             print(f"  Saved table readiness scores to {readiness_json_path}")
     else:
         print("\nPhase 2F: Generate Data Analysis Reports [SKIPPED]")
@@ -4473,27 +5355,25 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
         print("PHASE 3: ENHANCED ANALYSIS")
         print("=" * 50)
 
-        text_rich_columns = find_text_rich_columns(conn)
-        edu_tables = find_education_tables(conn)
-        doc_columns = find_document_columns(conn)
-        pii_columns = find_pii_columns(conn)
+        text_rich_columns, edu_tables, doc_columns, pii_columns = find_special_columns(columns)
 
         # Save enhanced candidates
-        enhanced_path = OUTPUT_DIR / "metadata" / "enhanced_text_candidates.json"
-
-        # Create LLM candidates from text-rich columns
-        table_text_cols = defaultdict(list)
-        for row in text_rich_columns:
-            db, schema, table, col, dtype, max_len, comment = row
-            enhanced_llm.append({
-                "database": db, "schema": schema, "table": table, "column": col,
-                "data_type": dtype, "max_length": max_len, "comment": comment,
-                "ai_feature": "Cortex LLM", "reason": f"Text column '{col}'"
-            })
-            table_text_cols[(db, schema, table)].append(col)
+        enhanced_path = METADATA_DIR / "enhanced_text_candidates.json"
+
+        # Column rows arrive ordered by (db, schema, table, ordinal), so the
+        # text-rich subset keeps each table's columns contiguous and groupby
+        # builds LLM and search candidates in one pass, no grouping dict
+        for (db, schema, table), grp in groupby(text_rich_columns, key=itemgetter(0, 1, 2)):
+            cols = []
+            for _, _, _, col, dtype, max_len, comment in grp:
+                enhanced_llm.append({
+                    "database": db, "schema": schema, "table": table, "column": col,
+                    "data_type": dtype, "max_length": max_len, "comment": comment,
+                    "ai_feature": "Cortex LLM", "reason": f"Text column '{col}'"
+                })
+                cols.append(col)
 
-        # Create search candidates from tables with multiple text columns
-        for (db, schema, table), cols in table_text_cols.items():
+            # Tables with multiple text columns also make search candidates
             if len(cols) >= 2:
                 enhanced_search.append({
                     "database": db, "schema": schema, "table": table,
@@ -4502,17 +5382,17 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
                     "text_columns": cols[:10]
                 })
 
-        with open(enhanced_path, "w") as f:
-            json.dump({
-                "llm_candidates": enhanced_llm[:1000],
-                "search_candidates": enhanced_search[:500],
-                "total_llm": len(enhanced_llm),
-                "total_search": len(enhanced_search),
-                "education_tables": len(edu_tables),
-                "document_columns": len(doc_columns),
-                "pii_columns": len(pii_columns)
-            }, f, indent=2, default=str)
+        dump_json_file({
+            "llm_candidates": enhanced_llm[:1000],
+            "search_candidates": enhanced_search[:500],
+            "total_llm": len(enhanced_llm),
+            "total_search": len(enhanced_search),
+            "education_tables": len(edu_tables),
+            "document_columns": len(doc_columns),
+            "pii_columns": len(pii_columns)
+        }, enhanced_path, default=str)
         print(f"\nSaved enhanced candidates to {enhanced_path}")
+        save_checkpoint('3')
     else:
         print("\n" + "=" * 50)
         print("PHASE 3: ENHANCED ANALYSIS [SKIPPED - Loading from cache]")
@@ -4573,13 +5453,13 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
         print(f"Built {len(variant_profiles)} variant profiles from metadata")
 
         # Save profiles
-        profiles_json_path = OUTPUT_DIR / "profiles" / "text_column_profiles.json"
-        with open(profiles_json_path, "w") as f:
-            json.dump({
-                "text_profiles": text_profiles,
-                "variant_profiles": variant_profiles
-            }, f, indent=2, default=str)
+        profiles_json_path = PROFILES_DIR / "text_column_profiles.json"
+        dump_json_file({
+            "text_profiles": text_profiles,
+            "variant_profiles": variant_profiles
+        }, profiles_json_path, default=str)
         print(f"\nSaved profiling data to {profiles_json_path}")
+        save_checkpoint('4')
     else:
         print("\n" + "=" * 50)
         print("PHASE 4: DATA PROFILING [SKIPPED - Loading from cache]")
@@ -4595,19 +5475,19 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
         print("PHASE 5: SCORING CANDIDATES")
         print("=" * 50)
 
-        for cand in all_candidates:
-            score_candidate(cand, text_profiles, variant_profiles)
+        text_profile_lookup = build_text_profile_lookup(text_profiles)
+        score_candidates_bulk(all_candidates, text_profile_lookup, variant_profiles)
 
         # Also score enhanced candidates
-        for cand in enhanced_llm + enhanced_search:
-            score_candidate(cand, text_profiles, variant_profiles)
+        score_candidates_bulk(enhanced_llm + enhanced_search,
+                              text_profile_lookup, variant_profiles)
 
         print(f"Scored {len(all_candidates):,} candidates")
     else:
         print("\n" + "=" * 50)
         print("PHASE 5: SCORING CANDIDATES [SKIPPED - Using existing scores]")
         print("=" * 50)
-        scored_count = len([c for c in all_candidates if 'total_score' in c])
+        scored_count = sum(1 for c in all_candidates if 'total_score' in c)
         print(f"  {scored_count:,} candidates already have scores")
 
     # ========== PHASE 5B: CONFIRMED CANDIDATES (Objective 2) ==========
@@ -4620,15 +5500,18 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
         print("PHASE 5B: FLAGGING CONFIRMED CANDIDATES")
         print("=" * 50)
         total_to_confirm = len(all_candidates)
-        
-        for i, cand in enumerate(all_candidates, 1):
-            # Build item name for progress
-            item_name = f"{cand.get('database', '?')}.{cand.get('table', '?')}.{cand.get('column', '?')}"
-            extra_info = f"Confirmed:{confirmed_count} Unconfirmed:{unconfirmed_count}"
-            print_progress(i, total_to_confirm, item_name, "Phase 5B", extra_info)
-            
-            # Apply confirmed candidate logic based on data profiling
-            is_confirmed, reasons = is_confirmed_candidate(cand)
+
+        # Compute all confirmation decisions in one vectorized pass
+        confirmation_results = confirm_candidates_bulk(all_candidates)
+
+        # Same progress throttling as Phase 2B: ~200 redraws total
+        progress_interval = max(1, total_to_confirm // 200)
+        for i, (cand, (is_confirmed, reasons)) in enumerate(zip(all_candidates, confirmation_results), 1):
+            if i % progress_interval == 0 or i == total_to_confirm:
+                item_name = f"{cand.get('database', '?')}.{cand.get('table', '?')}.{cand.get('column', '?')}"
+                extra_info = f"Confirmed:{confirmed_count} Unconfirmed:{unconfirmed_count}"
+                print_progress(i, total_to_confirm, item_name, "Phase 5B", extra_info)
+
             cand['is_confirmed_candidate'] = is_confirmed
             cand['confirmation_reasons'] = reasons
             
@@ -4656,21 +5539,21 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
                 print(f"  Combined: {len(existing_candidates):,} existing + {len(all_candidates) - len(existing_candidates):,} new")
             
             # Update run history with databases analyzed in this run
-            new_databases = set(c.get('database', '') for c in all_candidates if c.get('database'))
+            # Set comprehension: one C-level pass, no generator frame
+            new_databases = {c['database'] for c in all_candidates if c.get('database')}
             save_run_history(run_metadata, new_databases)
         
         # Save all candidates (with confirmation status)
-        candidates_path = OUTPUT_DIR / "metadata" / "all_candidates.json"
-        with open(candidates_path, "w") as f:
-            json.dump(all_candidates, f, indent=2, default=str)
+        candidates_path = METADATA_DIR / "all_candidates.json"
+        dump_json_file(all_candidates, candidates_path, default=str)
         print(f"Saved all candidates to {candidates_path}")
         
         # Save confirmed candidates separately
         confirmed_candidates = [c for c in all_candidates if c.get('is_confirmed_candidate')]
-        confirmed_path = OUTPUT_DIR / "metadata" / "confirmed_candidates.json"
-        with open(confirmed_path, "w") as f:
-            json.dump(confirmed_candidates, f, indent=2, default=str)
+        confirmed_path = METADATA_DIR / "confirmed_candidates.json"
+        dump_json_file(confirmed_candidates, confirmed_path, default=str)
         print(f"Saved {len(confirmed_candidates):,} confirmed candidates to {confirmed_path}")
+        save_checkpoint('5B')
     else:
         print("\n" + "=" * 50)
         print("PHASE 5B: FLAGGING CONFIRMED CANDIDATES [SKIPPED]")
@@ -4686,62 +5569,78 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
         print("PHASE 6: GENERATING REPORTS")
         print("=" * 50)
 
-        # Executive Summary
-        exec_summary = generate_executive_summary(
-            all_candidates=all_candidates + enhanced_llm[:100] + enhanced_search[:50],
-            tables_count=len(tables),
-            columns_count=len(columns),
-            databases_count=len(databases),
-            schemas_count=len(schemas),
-            stages_count=len(stages),
-            llm_count=len(enhanced_llm),
-            search_count=len(enhanced_search),
-            ml_count=len(ml_candidates),
-            extract_count=len(variant_candidates),
-            edu_tables=edu_tables,
-            pii_columns=pii_columns,
-            text_profiles=text_profiles
-        )
-        exec_path = OUTPUT_DIR / "reports" / "executive_summary.md"
-        exec_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(exec_path, "w", encoding="utf-8") as f:
-            f.write(exec_summary)
-        print(f"Saved executive summary to {exec_path}")
-
-        # Detailed Analysis Report (comprehensive markdown with reasoning)
-        detailed_report = generate_detailed_analysis_report(
-            all_candidates=all_candidates,
-            text_profiles=text_profiles,
-            variant_profiles=variant_profiles,
-            confirmed_candidates=confirmed_candidates,
-            edu_tables=edu_tables,
-            pii_columns=pii_columns,
-            databases=databases,
-            schemas=schemas,
-            tables=tables,
-            stages=stages,
-        )
-        detailed_path = OUTPUT_DIR / "reports" / "detailed_analysis_report.md"
-        detailed_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(detailed_path, "w", encoding="utf-8") as f:
-            f.write(detailed_report)
-        print(f"Saved detailed analysis report to {detailed_path}")
-
-        # AI Strategy Roadmap
-        roadmap = generate_roadmap(
-            all_candidates=all_candidates + enhanced_llm[:100] + enhanced_search[:50],
-            text_profiles=text_profiles,
-            edu_tables=edu_tables,
-            stages_data=stages
-        )
-        roadmap_path = OUTPUT_DIR / "reports" / "ai_strategy_roadmap.md"
-        roadmap_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(roadmap_path, "w", encoding="utf-8") as f:
-            f.write(roadmap)
-        print(f"Saved roadmap to {roadmap_path}")
+        # Compute the shared sorted/grouped aggregates once per run; the
+        # summary and roadmap include the enhanced extras, the detailed and
+        # profile reports cover the core candidate list
+        extended_candidates = all_candidates + enhanced_llm[:100] + enhanced_search[:50]
+        extended_aggregates = build_report_aggregates(extended_candidates)
+        core_aggregates = build_report_aggregates(all_candidates)
+
+        REPORTS_DIR.mkdir(parents=True, exist_ok=True)
+
+        def _write_exec_summary():
+            exec_summary = generate_executive_summary(
+                all_candidates=extended_candidates,
+                tables_count=len(tables),
+                columns_count=len(columns),
+                databases_count=len(databases),
+                schemas_count=len(schemas),
+                stages_count=len(stages),
+                llm_count=len(enhanced_llm),
+                search_count=len(enhanced_search),
+                ml_count=len(ml_candidates),
+                extract_count=len(variant_candidates),
+                edu_tables=edu_tables,
+                pii_columns=pii_columns,
+                text_profiles=text_profiles,
+                aggregates=extended_aggregates
+            )
+            exec_path = REPORTS_DIR / "executive_summary.md"
+            exec_path.write_text(exec_summary, encoding="utf-8")
+            return f"Saved executive summary to {exec_path}"
+
+        def _write_detailed_report():
+            detailed_report = generate_detailed_analysis_report(
+                all_candidates=all_candidates,
+                text_profiles=text_profiles,
+                variant_profiles=variant_profiles,
+                confirmed_candidates=confirmed_candidates,
+                edu_tables=edu_tables,
+                pii_columns=pii_columns,
+                databases=databases,
+                schemas=schemas,
+                tables=tables,
+                stages=stages,
+                aggregates=core_aggregates,
+            )
+            detailed_path = REPORTS_DIR / "detailed_analysis_report.md"
+            detailed_path.write_text(detailed_report, encoding="utf-8")
+            return f"Saved detailed analysis report to {detailed_path}"
+
+        def _write_roadmap():
+            roadmap = generate_roadmap(
+                all_candidates=extended_candidates,
+                text_profiles=text_profiles,
+                edu_tables=edu_tables,
+                stages_data=stages,
+                aggregates=extended_aggregates
+            )
+            roadmap_path = REPORTS_DIR / "ai_strategy_roadmap.md"
+            roadmap_path.write_text(roadmap, encoding="utf-8")
+            return f"Saved roadmap to {roadmap_path}"
+
+        # The three standalone reports only read shared state, so build and
+        # write them concurrently while the main thread emits the per-schema
+        # profiles; file writes release the GIL and overlap string building
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            report_futures = [pool.submit(fn) for fn in
+                              (_write_exec_summary, _write_detailed_report, _write_roadmap)]
+
+            # Profile Reports
+            num_profiles = generate_profile_reports(all_candidates, aggregates=core_aggregates)
 
-        # Profile Reports
-        num_profiles = generate_profile_reports(all_candidates)
+            for future in report_futures:
+                print(future.result())
 
         # Save audit log
         save_audit_log()
@@ -4774,6 +5673,7 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
         with open(index_path, "w", encoding="utf-8") as f:
             f.write(report_index)
         print(f"Saved report index to {index_path}")
+        save_checkpoint('6')
     else:
         print("\n" + "=" * 50)
         print("PHASE 6: GENERATING REPORTS [SKIPPED]")
@@ -4783,49 +5683,35 @@ def run_agent(config_path=None, dry_run_override=None, start_stage=None):
     conn.close()
 
     # ========== SUMMARY ==========
-    print("\n" + "=" * 70)
-    print("ANALYSIS COMPLETE")
-    print("=" * 70)
-    print(f"""
-Environment Summary:
-  - Databases: {len(databases):,}
-  - Schemas: {len(schemas):,}
-  - Tables/Views: {len(tables):,}
-  - Columns: {len(columns):,}
-  - Stages: {len(stages):,}
-
-AI Candidates Identified:
-  - Cortex LLM: {len(enhanced_llm):,}
-  - Cortex Search/RAG: {len(enhanced_search):,}
-  - Cortex ML: {len(ml_candidates):,}
-  - Cortex Extract: {len(variant_candidates):,}
-  - Total: {len(enhanced_llm) + len(enhanced_search) + len(ml_candidates) + len(variant_candidates):,}
-
-Data Analysis Summary:
-  - Candidates analyzed: {analyzed_count:,}
-  - From cache: {cached_count:,}
-  - New analyses: {new_analyses:,}
-  - Skipped (errors): {skipped_count:,}
-  - Top candidates (full scan): {len(top_candidates):,}
-  - Analysis success rate: {(analyzed_count/(analyzed_count+skipped_count)*100) if (analyzed_count+skipped_count) > 0 else 0:.1f}%
-
-Reports Generated:
-  - {OUTPUT_DIR}/README.md (Main Report Index)
-  - {OUTPUT_DIR}/reports/executive_summary.md
-  - {OUTPUT_DIR}/reports/detailed_analysis_report.md (Comprehensive Analysis)
-  - {OUTPUT_DIR}/reports/ai_strategy_roadmap.md
-  - {OUTPUT_DIR}/profiles/*.md ({num_profiles} schema profiles)
-  - {OUTPUT_DIR}/metadata/*.json (data files)
-  - {OUTPUT_DIR}/logs/*.sql (audit trail)
-
-Confirmed Candidates: {len(confirmed_candidates):,} / {len(enhanced_llm) + len(enhanced_search) + len(ml_candidates) + len(variant_candidates):,}
-
-Agent completed: {get_utc_timestamp()}
-
-======================================================================
-📋 VIEW FULL REPORT: {OUTPUT_DIR}/README.md
-======================================================================
-""")
+    total_identified = (len(enhanced_llm) + len(enhanced_search)
+                        + len(ml_candidates) + len(variant_candidates))
+    total_attempted = analyzed_count + skipped_count
+    # Emit the whole banner in one buffered write instead of four prints
+    divider = "=" * 70
+    summary = _FINAL_SUMMARY_TMPL.format(
+        num_databases=len(databases),
+        num_schemas=len(schemas),
+        num_tables=len(tables),
+        num_columns=len(columns),
+        num_stages=len(stages),
+        num_llm=len(enhanced_llm),
+        num_search=len(enhanced_search),
+        num_ml=len(ml_candidates),
+        num_extract=len(variant_candidates),
+        total_identified=total_identified,
+        analyzed_count=analyzed_count,
+        cached_count=cached_count,
+        new_analyses=new_analyses,
+        skipped_count=skipped_count,
+        num_top=len(top_candidates),
+        success_rate=(analyzed_count / total_attempted * 100) if total_attempted > 0 else 0,
+        output_dir=OUTPUT_DIR,
+        num_profiles=num_profiles,
+        num_confirmed=len(confirmed_candidates),
+        completed_at=get_utc_timestamp(),
+    )
+    sys.stdout.write(f"\n{divider}\nANALYSIS COMPLETE\n{divider}\n{summary}\n")
+    sys.stdout.flush()
     
     return 0  # Success
 
@@ -4838,7 +5724,7 @@ def main():
     args = parse_arguments()
     
     # Determine dry run mode (CLI flag overrides config)
-    dry_run_override = True if args.dry_run else None
+    dry_run_override = args.dry_run or None
     
     # Run the agent
     exit_code = run_agent(
@@ -4846,7 +5732,15 @@ def main():
         dry_run_override=dry_run_override,
         start_stage=args.start_stage
     )
-    
+
+    if args.fast_exit and exit_code == 0:
+        # All artifacts are written and the connection is closed by now, so
+        # skip interpreter teardown (GC of large candidate structures,
+        # connector atexit handlers) for a faster exit. Opt-in only.
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(0)
+
     sys.exit(exit_code)
 
 if __name__ == "__main__":